@@ -0,0 +1,6 @@
+"""Allow running autopod as ``python -m autopod``."""
+
+from autopod.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Deferred module imports for autopod.
+
+The CLI imports every autopod module at startup, so heavy third-party
+packages imported at module level are paid for by every command, including
+ones that never use them.
+"""
+
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Callable, Dict, Optional
+
+
+class _LoadState:
+    """What a lazy module needs to run its code, plus the lock guarding it."""
+
+    def __init__(self, module: ModuleType, loader, on_load: Optional[Callable[[ModuleType], None]]):
+        self.loader = loader
+        self.on_load = on_load
+        # Attributes as created, to tell which were assigned before loading
+        self.initial_attrs = dict(module.__dict__)
+        self.lock = threading.RLock()
+        self.loading = False
+
+
+# Pending lazy modules by name; an entry is dropped once its module has loaded
+_load_states: Dict[str, _LoadState] = {}
+
+
+class _LazyModule(ModuleType):
+    """Module placeholder whose code runs on first attribute access.
+
+    The module only becomes a plain module once its code (and on_load hook)
+    has finished, and that happens under a lock, so a thread that touches it
+    meanwhile waits instead of seeing a half-initialised module.
+    importlib's LazyLoader gives no such guarantee before Python 3.12.
+    """
+
+    def __getattribute__(self, attr):
+        _load(self)
+        return ModuleType.__getattribute__(self, attr)
+
+    def __setattr__(self, attr, value):
+        # Assigning (e.g. runpod.api_key) doesn't need the module's code;
+        # the value is kept when it does load
+        state = _load_states.get(object.__getattribute__(self, "__name__"))
+        if state is None:
+            ModuleType.__setattr__(self, attr, value)
+            return
+        with state.lock:
+            ModuleType.__setattr__(self, attr, value)
+
+    def __delattr__(self, attr):
+        _load(self)
+        ModuleType.__delattr__(self, attr)
+
+
+def _load(module: ModuleType) -> None:
+    """Run a lazy module's code, once, unless it is already running."""
+    state = _load_states.get(object.__getattribute__(module, "__name__"))
+    if state is None:
+        return
+
+    with state.lock:
+        # Already loaded by another thread, or this thread is running the
+        # module's code and the access comes from that code itself
+        if type(module) is not _LazyModule or state.loading:
+            return
+
+        state.loading = True
+        try:
+            attrs = object.__getattribute__(module, "__dict__")
+            assigned = {
+                key: value for key, value in attrs.items()
+                if key not in state.initial_attrs or value is not state.initial_attrs[key]
+            }
+            state.loader.exec_module(module)
+            attrs.update(assigned)
+            if state.on_load is not None:
+                state.on_load(module)
+            object.__setattr__(module, "__class__", ModuleType)
+            del _load_states[module.__name__]
+        finally:
+            state.loading = False
+
+
+def lazy_import(
+    name: str, on_load: Optional[Callable[[ModuleType], None]] = None
+) -> ModuleType:
+    """Import a module on first attribute access instead of now.
+
+    The returned object can be bound to a module-level name (and patched in
+    tests) like a normal import. The module's code runs when an attribute is
+    first read; if several threads do so at once, one loads it and the rest
+    wait for it to finish. Attributes assigned before then don't trigger the
+    load and keep their values once it happens.
+
+    Args:
+        name: Module name
+        on_load: Optional hook called with the module once its code has run
+            (immediately if it is already imported)
+
+    Returns:
+        The module, or a lazy placeholder that loads it when first used
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed
+    """
+    if name in sys.modules:
+        module = sys.modules[name]
+        if on_load is not None:
+            on_load(module)
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    module = importlib.util.module_from_spec(spec)
+    _load_states[name] = _LoadState(module, spec.loader, on_load)
+    module.__class__ = _LazyModule
+    sys.modules[name] = module
+    return module
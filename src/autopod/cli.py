@@ -735,6 +735,53 @@ def shell_alias(pod_id, command):
     runner.invoke(ssh, args)
 
 
+@cli.command("wait-ssh")
+@click.argument("pod_id", required=False)
+@click.option("--timeout", type=int, default=120, help="Seconds to wait before giving up (default: 120)")
+def wait_ssh(pod_id, timeout):
+    """Wait until SSH is ready on a pod.
+
+    Polls the pod status with exponential backoff (1s, capped at 5s) and
+    exits 0 as soon as SSH is ready, or 1 if the timeout expires.
+
+    Examples:
+        autopod wait-ssh abc-123                 # Wait up to 120s
+        autopod wait-ssh abc-123 --timeout 300   # Wait up to 5 minutes
+    """
+    try:
+        provider = load_provider()
+
+        # Auto-select if no pod_id provided
+        if not pod_id:
+            pod_id = get_single_pod_id(PodManager(provider, console))
+            if not pod_id:
+                sys.exit(1)
+            console.print(f"[dim]Auto-selected pod: {pod_id}[/dim]\n")
+
+        deadline = time.monotonic() + timeout
+        delay = 1.0
+        with console.status(f"[cyan]Waiting for SSH on pod {pod_id}...[/cyan]"):
+            while True:
+                status = provider.get_pod_status(pod_id, force=True)
+                if status.get("ssh_ready"):
+                    console.print(f"[green]✓ SSH is ready on pod {pod_id}[/green]")
+                    sys.exit(0)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 1.5, 5.0)
+
+        console.print(f"[red]✗ SSH not ready after {timeout}s[/red]")
+        sys.exit(1)
+
+    except Exception as e:
+        console.print(f"[red]✗ Wait for SSH failed: {e}[/red]")
+        logger.exception("Wait for SSH failed")
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("pod_id", required=False)
 def stop(pod_id):
@@ -905,7 +952,8 @@ def tunnel():
 @click.option("--local-port", type=int, default=8188, help="Local port to bind (default: 8188)")
 @click.option("--remote-port", type=int, default=8188, help="Remote port to forward (default: 8188)")
 @click.option("--ssh-key", type=str, help="Path to SSH private key")
-def tunnel_start(pod_id, local_port, remote_port, ssh_key):
+@click.option("--multiplex", is_flag=True, help="Share one SSH connection with other tunnels to this pod")
+def tunnel_start(pod_id, local_port, remote_port, ssh_key, multiplex):
     """Start an SSH tunnel to a pod.
 
     Creates a persistent SSH tunnel that forwards a local port to a remote
@@ -971,7 +1019,8 @@ def tunnel_start(pod_id, local_port, remote_port, ssh_key):
                 ssh_connection_string=ssh_connection_string,
                 local_port=local_port,
                 remote_port=remote_port,
-                ssh_key_path=ssh_key
+                ssh_key_path=ssh_key,
+                multiplex=multiplex
             )
         except RuntimeError as e:
             console.print(f"[red]✗ {e}[/red]")
@@ -1083,6 +1132,7 @@ def tunnel_list():
         table.add_column("PID", justify="right")
         table.add_column("Connection")
 
+        dead_count = 0
         for tunnel_obj in tunnels:
             status = tunnel_obj.get_status()
 
@@ -1090,6 +1140,7 @@ def tunnel_list():
                 status_str = "[green]●[/green] Active"
             else:
                 status_str = "[red]●[/red] Dead"
+                dead_count += 1
 
             table.add_row(
                 status["pod_id"],
@@ -1105,7 +1156,6 @@ def tunnel_list():
         console.print()
 
         # Show cleanup suggestion if there are dead tunnels
-        dead_count = sum(1 for t in tunnels if not t.is_active())
         if dead_count > 0:
             console.print(f"[dim]Tip: Run 'autopod tunnel cleanup' to remove {dead_count} dead tunnel(s)[/dim]\n")
 
@@ -1171,6 +1221,7 @@ def tunnel_stop_all(yes):
         console.print(f"\n[bold]Stopping {active_count} tunnel(s)...[/bold]\n")
 
         stopped = tunnel_manager.stop_all_tunnels()
+        tunnel_manager.close_control_masters()
 
         console.print(f"[green]✓ Stopped {stopped} tunnel(s)[/green]\n")
 
@@ -4,15 +4,19 @@ This module handles loading, saving, and validating autopod configuration,
 including API keys, SSH keys, and default preferences.
 """
 
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 
 console = Console()
 
+# Last config loaded: (path, mtime_ns, size, config)
+_config_cache: Optional[Tuple[Path, int, int, Dict]] = None
+
 
 def get_config_dir() -> Path:
     """Get the autopod configuration directory path.
@@ -96,17 +100,28 @@ def load_config() -> Dict:
         FileNotFoundError: If config file doesn't exist
         json.JSONDecodeError: If config file is malformed
     """
+    global _config_cache
+
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration file not found at {config_path}. "
             "Run 'autopod config init' to create it."
-        )
+        ) from None
+
+    # Reuse the parsed file while it is unchanged on disk; callers get a
+    # copy so their edits don't leak into the cache
+    cached = _config_cache
+    if cached and cached[:3] == (config_path, stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[3])
 
     with open(config_path, 'r') as f:
         config = json.load(f)
 
+    _config_cache = (config_path, stat.st_mtime_ns, stat.st_size, copy.deepcopy(config))
     return config
 
 
@@ -116,8 +131,11 @@ def save_config(config: Dict) -> None:
     Args:
         config: Configuration dictionary to save
     """
+    global _config_cache
+
     ensure_config_dir()
     config_path = get_config_path()
+    _config_cache = None
 
     # Write config file
     with open(config_path, 'w') as f:
@@ -4,17 +4,148 @@ This module implements the CloudProvider interface for RunPod,
 providing pod creation, management, and monitoring capabilities.
 """
 
+import atexit
+import json
 import os
+import queue
+import re
+import threading
 import time
-from typing import Dict, Optional, List
-from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, List, Tuple
+from datetime import date, datetime
 
-import runpod
+from autopod._lazy import lazy_import
 from autopod.providers.base import CloudProvider
 from autopod.logging import get_logger
 
 logger = get_logger(__name__)
 
+# The RunPod SDK takes over a second to import; commands that never call the
+# API (tunnel list/stop, config) should not pay for it
+runpod = lazy_import("runpod")
+
+# Pod names generated by autopod: autopod-YYYY-MM-DD-NNN
+_POD_NAME_RE = re.compile(r"^autopod-(\d{4}-\d{2}-\d{2})-(\d{3,})$")
+
+
+class _PodMetadataWriter:
+    """Background writer for pod metadata (~/.autopod/pods.json).
+
+    Callers enqueue updates and return immediately. A daemon thread collects
+    updates that arrive within ``batch_window`` seconds and applies them with a
+    single read-modify-write per file. Pending writes are flushed before
+    metadata is read and at interpreter exit, so no update is lost.
+    """
+
+    def __init__(self, batch_window: float = 0.05):
+        """Initialize the writer.
+
+        Args:
+            batch_window: Seconds to wait for more updates before writing
+        """
+        self.batch_window = batch_window
+        self._queue: "queue.Queue[Tuple[Path, str, Dict]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def submit(self, pods_file: Path, pod_id: str, pod_data: Dict) -> None:
+        """Queue a metadata update for a pod.
+
+        Args:
+            pods_file: Metadata file to update
+            pod_id: Pod identifier
+            pod_data: Metadata to store for the pod
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="autopod-metadata-writer",
+                    daemon=True
+                )
+                self._thread.start()
+
+        self._queue.put((pods_file, pod_id, pod_data))
+
+    def flush(self) -> None:
+        """Block until all queued updates have been written."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        """Writer loop: drain the queue in batches and persist them."""
+        while True:
+            batch = [self._queue.get()]
+
+            # Coalesce updates that arrive shortly after the first one
+            time.sleep(self.batch_window)
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                updates: Dict[Path, Dict[str, Dict]] = {}
+                for pods_file, pod_id, pod_data in batch:
+                    updates.setdefault(pods_file, {})[pod_id] = pod_data
+
+                for pods_file, pods in updates.items():
+                    self._write(pods_file, pods)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(pods_file: Path, pods: Dict[str, Dict]) -> None:
+        """Merge pod metadata into a file.
+
+        Args:
+            pods_file: Metadata file to update
+            pods: Dictionary of pod_id -> metadata
+        """
+        # Load existing data
+        pods_data = {}
+        if pods_file.exists():
+            try:
+                with open(pods_file, "r") as f:
+                    pods_data = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not load pods metadata: {e}")
+
+        pods_data.update(pods)
+
+        # Save back to file, created owner-only so it's never world-readable;
+        # the mode only applies on creation, so tighten an existing file too
+        try:
+            fd = os.open(pods_file, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                os.fchmod(f.fileno(), 0o600)
+                json.dump(pods_data, f, indent=2)
+            logger.debug("Saved metadata for %d pod(s)", len(pods))
+        except Exception as e:
+            logger.error(f"Failed to save pod metadata: {e}")
+
+
+_metadata_writer = _PodMetadataWriter()
+
+# Today's date and its "YYYY-MM-DD" form, reformatted only when the date changes
+_date_cache: Tuple[Optional[date], str] = (None, "")
+
+
+def _today_str() -> str:
+    """Get today's date formatted as YYYY-MM-DD.
+
+    Returns:
+        Cached date string, regenerated when the local date rolls over
+    """
+    global _date_cache
+    today = date.today()
+    if _date_cache[0] != today:
+        _date_cache = (today, today.isoformat())
+    return _date_cache[1]
+
 
 class RunPodProvider(CloudProvider):
     """RunPod cloud provider implementation."""
@@ -33,6 +164,9 @@ class RunPodProvider(CloudProvider):
     # Reverse mapping for lookups
     DISPLAY_NAME_TO_GPU_ID = {v: k for k, v in GPU_TYPE_MAP.items()}
 
+    # How long get_pod_status() results are reused (seconds)
+    STATUS_CACHE_TTL = 2.0
+
     def __init__(self, api_key: str):
         """Initialize RunPod provider.
 
@@ -48,11 +182,40 @@ class RunPodProvider(CloudProvider):
         self.api_key = api_key
         runpod.api_key = api_key
 
+        # Pod metadata storage (~/.autopod/pods.json)
+        self._autopod_dir = Path.home() / ".autopod"
+        self._autopod_dir.mkdir(exist_ok=True, mode=0o700)
+        self._pods_file = self._autopod_dir / "pods.json"
+
+        # GPU catalog from runpod.get_gpus() and resolved gpu_type -> GPU ID
+        self._gpu_catalog: Optional[List[Dict]] = None
+        self._gpu_id_cache: Dict[str, str] = {}
+        # Held while the catalog is fetched, so concurrent lookups share one
+        self._gpu_catalog_lock = threading.Lock()
+
+        # pod_id -> (monotonic timestamp, status dict)
+        self._status_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._status_cache_lock = threading.Lock()
+        # pod_id -> lock held while that pod's status is being fetched, so
+        # concurrent cache misses share one API round-trip
+        self._status_fetch_locks: Dict[str, threading.Lock] = {}
+
+        # Held while a pod name is chosen, with the last sequence number
+        # handed out per date: a pod still being created isn't listed by
+        # get_pods() yet, so concurrent creates would otherwise share a name
+        self._pod_name_lock = threading.Lock()
+        self._last_pod_numbers: Dict[str, int] = {}
+
+        # Key last validated by authenticate(), so repeat calls skip the API
+        self._authenticated_key: Optional[str] = None
+
         logger.info("RunPod provider initialized")
 
     def authenticate(self, api_key: str) -> bool:
         """Validate API credentials with RunPod.
 
+        A key that already validated on this provider is not checked again.
+
         Args:
             api_key: API key to validate
 
@@ -64,16 +227,23 @@ class RunPodProvider(CloudProvider):
             if provider.authenticate(api_key):
                 print("Valid credentials")
         """
-        try:
-            # Set API key
-            runpod.api_key = api_key
-            self.api_key = api_key
+        # Set API key. Also done for an already validated key: a failed
+        # attempt with another key, or another provider, may have replaced
+        # the SDK's process-wide key since
+        runpod.api_key = api_key
+        self.api_key = api_key
 
-            # Try to fetch GPU list as authentication test
-            gpus = runpod.get_gpus()
+        if api_key == self._authenticated_key:
+            return True
+
+        try:
+            # Fetch the account record as authentication test - a much
+            # smaller response than the full GPU catalog
+            user = runpod.get_user()
 
-            if gpus is not None:
+            if user is not None:
                 logger.info("Authentication successful")
+                self._authenticated_key = api_key
                 return True
             else:
                 logger.warning("Authentication failed - invalid API key")
@@ -114,39 +284,11 @@ class RunPodProvider(CloudProvider):
                 print(f"  Spot: ${info['spot_price']}/hr")
         """
         try:
-            logger.debug(f"Checking availability for GPU: {gpu_type} (count: {gpu_count})")
-
-            # First get basic GPU list to find the correct GPU ID
-            gpus = runpod.get_gpus()
-            gpu_id = None
-
-            # Try to find matching GPU by display name or ID
-            for gpu in gpus:
-                gpu_display = gpu.get("displayName", "")
-                gpu_full_id = gpu.get("id", "")
-
-                # Match by display name or full ID
-                if (gpu_type.lower() in gpu_display.lower() or
-                    gpu_type.lower() in gpu_full_id.lower() or
-                    gpu_display.lower() in gpu_type.lower()):
-                    gpu_id = gpu_full_id
-                    break
+            logger.debug("Checking availability for GPU: %s (count: %s)", gpu_type, gpu_count)
 
+            gpu_id = self._resolve_gpu_id(gpu_type)
             if not gpu_id:
-                logger.info(f"GPU type '{gpu_type}' not found in catalog")
-                return {
-                    "available": False,
-                    "gpu_type_id": None,
-                    "display_name": gpu_type,
-                    "memory_gb": 0,
-                    "max_gpu_count": 0,
-                    "cost_per_hour": 0.0,
-                    "secure_price": 0.0,
-                    "community_price": 0.0,
-                    "spot_price": 0.0,
-                    "secure_cloud": False,
-                    "community_cloud": False,
-                }
+                raise ValueError("not in RunPod GPU catalog")
 
             # Get detailed GPU information with pricing
             gpu_details = runpod.get_gpu(gpu_id, gpu_quantity=gpu_count)
@@ -184,44 +326,89 @@ class RunPodProvider(CloudProvider):
             }
 
             logger.info(
-                f"GPU '{gpu_type}' available: ${cost_per_hour}/hr "
-                f"(secure: ${secure_price}, community: ${community_price}, spot: ${spot_price}) "
-                f"{result['memory_gb']}GB VRAM"
+                "GPU '%s' available: $%s/hr (secure: $%s, community: $%s, spot: $%s) %sGB VRAM",
+                gpu_type, cost_per_hour, secure_price, community_price, spot_price,
+                result["memory_gb"]
             )
 
             return result
 
         except ValueError as e:
-            # GPU not found
+            # GPU not found (catalog lookup or runpod.get_gpu)
             logger.warning(f"GPU '{gpu_type}' not found: {e}")
-            return {
-                "available": False,
-                "gpu_type_id": None,
-                "display_name": gpu_type,
-                "memory_gb": 0,
-                "max_gpu_count": 0,
-                "cost_per_hour": 0.0,
-                "secure_price": 0.0,
-                "community_price": 0.0,
-                "spot_price": 0.0,
-                "secure_cloud": False,
-                "community_cloud": False,
-            }
+            return self._unavailable_gpu(gpu_type)
         except Exception as e:
             logger.error(f"Error checking GPU availability: {e}", exc_info=True)
-            return {
-                "available": False,
-                "gpu_type_id": None,
-                "display_name": gpu_type,
-                "memory_gb": 0,
-                "max_gpu_count": 0,
-                "cost_per_hour": 0.0,
-                "secure_price": 0.0,
-                "community_price": 0.0,
-                "spot_price": 0.0,
-                "secure_cloud": False,
-                "community_cloud": False,
-            }
+            return self._unavailable_gpu(gpu_type)
+
+    def _resolve_gpu_id(self, gpu_type: str) -> Optional[str]:
+        """Resolve a GPU display name or ID to a RunPod GPU type ID.
+
+        Known RunPod IDs are returned as-is. Other names are matched against
+        the GPU catalog once and the result is remembered for later calls.
+
+        Args:
+            gpu_type: GPU display name (e.g., "RTX A40") or GPU ID
+
+        Returns:
+            RunPod GPU type ID, or None if no catalog entry matches
+        """
+        if gpu_type in self.GPU_TYPE_MAP:
+            # Already a RunPod GPU type ID - skip the catalog lookup
+            return gpu_type
+
+        if gpu_type in self._gpu_id_cache:
+            return self._gpu_id_cache[gpu_type]
+
+        query = gpu_type.lower()
+        for gpu in self._get_gpu_catalog():
+            gpu_display = gpu.get("displayName", "").lower()
+            gpu_full_id = gpu.get("id", "")
+
+            # Match by display name or full ID
+            if (query in gpu_display or
+                query in gpu_full_id.lower() or
+                gpu_display in query):
+                self._gpu_id_cache[gpu_type] = gpu_full_id
+                return gpu_full_id
+
+        return None
+
+    def _get_gpu_catalog(self) -> List[Dict]:
+        """Get the RunPod GPU catalog, fetching it once per provider.
+
+        Returns:
+            List of GPU dictionaries from runpod.get_gpus()
+        """
+        if self._gpu_catalog is None:
+            with self._gpu_catalog_lock:
+                if self._gpu_catalog is None:
+                    self._gpu_catalog = runpod.get_gpus() or []
+        return self._gpu_catalog
+
+    @staticmethod
+    def _unavailable_gpu(gpu_type: str) -> Dict:
+        """Build the availability result for a GPU that can't be used.
+
+        Args:
+            gpu_type: GPU type that was requested
+
+        Returns:
+            Availability dictionary with available=False and zeroed pricing
+        """
+        return {
+            "available": False,
+            "gpu_type_id": None,
+            "display_name": gpu_type,
+            "memory_gb": 0,
+            "max_gpu_count": 0,
+            "cost_per_hour": 0.0,
+            "secure_price": 0.0,
+            "community_price": 0.0,
+            "spot_price": 0.0,
+            "secure_cloud": False,
+            "community_cloud": False,
+        }
 
     def get_volume_info(self, volume_id: str) -> Optional[Dict]:
         """Get information about a network volume.
@@ -258,7 +445,7 @@ class RunPodProvider(CloudProvider):
             # Find the requested volume
             for volume in volumes:
                 if volume.get("id") == volume_id:
-                    logger.info(f"Found volume {volume_id}: {volume.get('name')} in {volume.get('dataCenterId')}")
+                    logger.info("Found volume %s: %s in %s", volume_id, volume.get("name"), volume.get("dataCenterId"))
                     return volume
 
             # Volume not found
@@ -342,7 +529,7 @@ class RunPodProvider(CloudProvider):
             template = config.get("template", "runpod/pytorch:latest")
             cloud_type = config.get("cloud_type", "SECURE")  # SECURE or ALL
 
-            logger.info(f"Creating pod: gpu={gpu_type}, count={gpu_count}, template={template}")
+            logger.info("Creating pod: gpu=%s, count=%s, template=%s", gpu_type, gpu_count, template)
 
             # Get GPU type ID
             gpu_info = self.get_gpu_availability(gpu_type)
@@ -375,9 +562,9 @@ class RunPodProvider(CloudProvider):
                     else:
                         # If no datacenter specified, use volume's datacenter
                         datacenter_id = volume_info.get("dataCenterId")
-                        logger.info(f"Using volume's datacenter: {datacenter_id}")
+                        logger.info("Using volume's datacenter: %s", datacenter_id)
 
-                    logger.info(f"Attaching network volume {volume_id} ({volume_info.get('name')}) at {volume_mount}")
+                    logger.info("Attaching network volume %s (%s) at %s", volume_id, volume_info.get("name"), volume_mount)
 
                 except ConnectionError as e:
                     # Non-fatal: continue without volume validation
@@ -413,9 +600,9 @@ class RunPodProvider(CloudProvider):
                     # Convert list to RunPod format: "8188/http,22/tcp"
                     ports = ",".join(ports)
                 pod_params["ports"] = ports
-                logger.info(f"Exposing ports: {ports}")
+                logger.info("Exposing ports: %s", ports)
 
-            logger.debug(f"Pod creation params: {pod_params}")
+            logger.debug("Pod creation params: %s", pod_params)
 
             # Create pod using RunPod SDK
             pod = runpod.create_pod(**pod_params)
@@ -430,7 +617,7 @@ class RunPodProvider(CloudProvider):
             if "machine" in pod and pod["machine"]:
                 pod_host_id = pod["machine"].get("podHostId")
 
-            logger.info(f"Pod created successfully: {pod_id}, podHostId: {pod_host_id}")
+            logger.info("Pod created successfully: %s, podHostId: %s", pod_id, pod_host_id)
 
             # Store pod metadata for SSH access, volume info, and exposed ports
             if pod_host_id:
@@ -455,11 +642,15 @@ class RunPodProvider(CloudProvider):
             logger.error(f"Error creating pod: {e}", exc_info=True)
             raise RuntimeError(f"Failed to create pod: {e}") from e
 
-    def get_pod_status(self, pod_id: str) -> Dict:
+    def get_pod_status(self, pod_id: str, force: bool = False) -> Dict:
         """Get detailed status and metrics for a pod.
 
+        Results are cached for STATUS_CACHE_TTL seconds so that several
+        callers polling the same pod share one API round-trip.
+
         Args:
             pod_id: Pod identifier
+            force: Bypass the status cache and always query RunPod
 
         Returns:
             Dictionary with pod status:
@@ -476,107 +667,189 @@ class RunPodProvider(CloudProvider):
                 "machine_id": str,  # Machine ID for SSH connection
             }
         """
+        if force:
+            return self._fetch_status(pod_id)
+
+        cached = self._cached_status(pod_id)
+        if cached is not None:
+            return cached
+
+        # Callers that waited on an in-flight fetch pick up its result from
+        # the cache instead of issuing their own request
+        with self._status_fetch_lock(pod_id):
+            cached = self._cached_status(pod_id)
+            if cached is not None:
+                return cached
+            return self._fetch_status(pod_id)
+
+    def _cached_status(self, pod_id: str) -> Optional[Dict]:
+        """Return a copy of a pod's cached status if still fresh, else None."""
+        with self._status_cache_lock:
+            cached = self._status_cache.get(pod_id)
+        if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            logger.debug("Using cached status for pod %s", pod_id)
+            return dict(cached[1])
+        return None
+
+    def _status_fetch_lock(self, pod_id: str) -> threading.Lock:
+        """Return the lock serializing status fetches for a pod."""
+        with self._status_cache_lock:
+            return self._status_fetch_locks.setdefault(pod_id, threading.Lock())
+
+    def _fetch_status(self, pod_id: str) -> Dict:
+        """Query RunPod for a pod's status and refresh the cache.
+
+        Args:
+            pod_id: Pod identifier
+
+        Returns:
+            Status dictionary (see get_pod_status)
+
+        Raises:
+            RuntimeError: If the pod is not found or the API call fails
+        """
         try:
-            logger.debug(f"Getting status for pod: {pod_id}")
+            logger.debug("Getting status for pod: %s", pod_id)
 
             # Get pod details from RunPod
             pod = runpod.get_pod(pod_id)
-            logger.debug(f"Raw pod data from RunPod API: {pod}")
+            logger.debug("Raw pod data from RunPod API: %s", pod)
 
             if not pod:
                 raise RuntimeError(f"Pod {pod_id} not found")
 
-            # Extract status information
-            status = pod.get("desiredStatus", "UNKNOWN")
-            gpu_count = pod.get("gpuCount", 0)
-            cost_per_hour = pod.get("costPerHr", 0.0)
-            machine_id = pod.get("machineId", "")
+            return self._build_status(pod_id, pod)
 
-            # Calculate runtime and cost from createdAt timestamp
-            runtime_minutes = 0.0
-            total_cost = 0.0
-            created_at_source = None
+        except Exception as e:
+            logger.error(f"Error getting pod status: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to get pod status: {e}") from e
 
-            # Try RunPod API createdAt first
-            if "createdAt" in pod and pod["createdAt"]:
-                created_at_source = pod["createdAt"]
-            else:
-                # Fallback to metadata created_at (saved when pod was created)
-                metadata = self._load_pod_metadata(pod_id)
-                if metadata and "created_at" in metadata:
-                    created_at_source = metadata["created_at"]
-                    logger.debug(f"Using metadata created_at for pod {pod_id}")
-
-            if created_at_source:
-                # Parse ISO 8601 timestamp
-                try:
-                    from datetime import datetime
-                    created_at = datetime.fromisoformat(created_at_source.replace('Z', '+00:00'))
-                    runtime_seconds = (datetime.now(created_at.tzinfo) - created_at).total_seconds()
-                    runtime_minutes = runtime_seconds / 60.0
-                    total_cost = (runtime_minutes / 60.0) * cost_per_hour
-                    logger.debug(f"Runtime calculated: {runtime_minutes:.2f} minutes, cost: ${total_cost:.4f}")
-                except (ValueError, AttributeError) as e:
-                    logger.warning(f"Failed to parse created_at timestamp: {e}")
-            else:
-                logger.warning(f"Pod {pod_id} missing created_at, runtime calculation unavailable")
-
-            # RunPod SSH connection details
-            # RunPod uses SSH proxy at ssh.runpod.io, NOT direct port mapping
-            # Connection format: {pod_id}-{machine_id}@ssh.runpod.io
-            ssh_host = ""
-            ssh_ready = False
-
-            # SSH is available when runtime data exists (container is running)
-            if "runtime" in pod and pod["runtime"]:
-                ssh_host = "ssh.runpod.io"
-                ssh_ready = True
-                logger.debug(f"SSH ready for pod {pod_id}: {pod_id}-{machine_id}@{ssh_host}")
-
-            # Get GPU type display name
-            gpu_type = "Unknown"
-            # Try machine.gpuDisplayName first (most reliable)
-            if "machine" in pod and pod["machine"] and "gpuDisplayName" in pod["machine"]:
-                gpu_type = pod["machine"]["gpuDisplayName"]
-            elif "gpuTypeId" in pod:
-                # Fallback: Try to map back to display name
-                for display_name, gpu_id in self.DISPLAY_NAME_TO_GPU_ID.items():
-                    if gpu_id == pod["gpuTypeId"]:
-                        gpu_type = display_name
-                        break
+    def get_pod_status_batched(self, pod_ids: List[str]) -> List[Optional[Dict]]:
+        """Get status for several pods with a single API query.
 
-            result = {
-                "pod_id": pod_id,
-                "status": status,
-                "gpu_type": gpu_type,
-                "gpu_count": gpu_count,
-                "cost_per_hour": cost_per_hour,
-                "runtime_minutes": runtime_minutes,
-                "total_cost": total_cost,
-                "ssh_host": ssh_host,
-                "ssh_port": 0,  # Not used for RunPod proxy
-                "machine_id": machine_id,
-                "ssh_ready": ssh_ready,
-            }
+        Fetches all account pods in one ``get_pods`` round-trip instead of
+        one ``get_pod`` call per pod. Results refresh the status cache.
 
-            # Add volume info from metadata if available
-            metadata = self._load_pod_metadata(pod_id)
-            if metadata:
-                if "volume_id" in metadata:
-                    result["volume_id"] = metadata["volume_id"]
-                    result["volume_mount"] = metadata.get("volume_mount", "/workspace")
+        Args:
+            pod_ids: Pod identifiers
 
-            logger.info(
-                f"Pod {pod_id} status: {status}, runtime: {runtime_minutes:.1f}min, "
-                f"cost: ${total_cost:.4f}, ssh_ready: {ssh_ready}"
-            )
+        Returns:
+            Status dictionaries (see get_pod_status) in the same order as
+            pod_ids, with None for pods that no longer exist
+        """
+        try:
+            logger.debug("Getting status for pods: %s", pod_ids)
+            pods = {pod.get("id"): pod for pod in runpod.get_pods()}
 
-            return result
+            return [
+                self._build_status(pod_id, pods[pod_id]) if pod_id in pods else None
+                for pod_id in pod_ids
+            ]
 
         except Exception as e:
             logger.error(f"Error getting pod status: {e}", exc_info=True)
             raise RuntimeError(f"Failed to get pod status: {e}") from e
 
+    def _build_status(self, pod_id: str, pod: Dict) -> Dict:
+        """Convert raw RunPod pod data into a status dictionary and cache it.
+
+        Args:
+            pod_id: Pod identifier
+            pod: Pod data as returned by the RunPod API
+
+        Returns:
+            Status dictionary (see get_pod_status)
+        """
+        # Extract status information
+        status = pod.get("desiredStatus", "UNKNOWN")
+        gpu_count = pod.get("gpuCount", 0)
+        cost_per_hour = pod.get("costPerHr", 0.0)
+        machine_id = pod.get("machineId", "")
+
+        # Calculate runtime and cost from createdAt timestamp
+        runtime_minutes = 0.0
+        total_cost = 0.0
+        created_at_source = None
+
+        # Try RunPod API createdAt first
+        if "createdAt" in pod and pod["createdAt"]:
+            created_at_source = pod["createdAt"]
+        else:
+            # Fallback to metadata created_at (saved when pod was created)
+            metadata = self._load_pod_metadata(pod_id)
+            if metadata and "created_at" in metadata:
+                created_at_source = metadata["created_at"]
+                logger.debug("Using metadata created_at for pod %s", pod_id)
+
+        if created_at_source:
+            # Parse ISO 8601 timestamp
+            try:
+                from datetime import datetime
+                created_at = datetime.fromisoformat(created_at_source.replace('Z', '+00:00'))
+                runtime_seconds = (datetime.now(created_at.tzinfo) - created_at).total_seconds()
+                runtime_minutes = runtime_seconds / 60.0
+                total_cost = (runtime_minutes / 60.0) * cost_per_hour
+                logger.debug("Runtime calculated: %.2f minutes, cost: $%.4f", runtime_minutes, total_cost)
+            except (ValueError, AttributeError) as e:
+                logger.warning(f"Failed to parse created_at timestamp: {e}")
+        else:
+            logger.warning(f"Pod {pod_id} missing created_at, runtime calculation unavailable")
+
+        # RunPod SSH connection details
+        # RunPod uses SSH proxy at ssh.runpod.io, NOT direct port mapping
+        # Connection format: {pod_id}-{machine_id}@ssh.runpod.io
+        ssh_host = ""
+        ssh_ready = False
+
+        # SSH is available when runtime data exists (container is running)
+        if "runtime" in pod and pod["runtime"]:
+            ssh_host = "ssh.runpod.io"
+            ssh_ready = True
+            logger.debug("SSH ready for pod %s: %s-%s@%s", pod_id, pod_id, machine_id, ssh_host)
+
+        # Get GPU type display name
+        gpu_type = "Unknown"
+        # Try machine.gpuDisplayName first (most reliable)
+        if "machine" in pod and pod["machine"] and "gpuDisplayName" in pod["machine"]:
+            gpu_type = pod["machine"]["gpuDisplayName"]
+        elif "gpuTypeId" in pod:
+            # Fallback: Try to map back to display name
+            for display_name, gpu_id in self.DISPLAY_NAME_TO_GPU_ID.items():
+                if gpu_id == pod["gpuTypeId"]:
+                    gpu_type = display_name
+                    break
+
+        result = {
+            "pod_id": pod_id,
+            "status": status,
+            "gpu_type": gpu_type,
+            "gpu_count": gpu_count,
+            "cost_per_hour": cost_per_hour,
+            "runtime_minutes": runtime_minutes,
+            "total_cost": total_cost,
+            "ssh_host": ssh_host,
+            "ssh_port": 0,  # Not used for RunPod proxy
+            "machine_id": machine_id,
+            "ssh_ready": ssh_ready,
+        }
+
+        # Add volume info from metadata if available
+        metadata = self._load_pod_metadata(pod_id)
+        if metadata:
+            if "volume_id" in metadata:
+                result["volume_id"] = metadata["volume_id"]
+                result["volume_mount"] = metadata.get("volume_mount", "/workspace")
+
+        logger.info(
+            "Pod %s status: %s, runtime: %.1fmin, cost: $%.4f, ssh_ready: %s",
+            pod_id, status, runtime_minutes, total_cost, ssh_ready
+        )
+
+        with self._status_cache_lock:
+            self._status_cache[pod_id] = (time.monotonic(), result)
+
+        return dict(result)
+
     def stop_pod(self, pod_id: str) -> bool:
         """Stop (pause) a running pod.
 
@@ -587,12 +860,13 @@ class RunPodProvider(CloudProvider):
             True if successful, False otherwise
         """
         try:
-            logger.info(f"Stopping pod: {pod_id}")
+            logger.info("Stopping pod: %s", pod_id)
 
             # RunPod SDK's stop_pod() returns None on success, raises on failure
             runpod.stop_pod(pod_id)
+            self._invalidate_status(pod_id)
 
-            logger.info(f"Pod {pod_id} stopped successfully")
+            logger.info("Pod %s stopped successfully", pod_id)
             return True
 
         except Exception as e:
@@ -612,7 +886,7 @@ class RunPodProvider(CloudProvider):
             True if successful, False otherwise
         """
         try:
-            logger.info(f"Starting pod: {pod_id}")
+            logger.info("Starting pod: %s", pod_id)
 
             # Get pod info to retrieve GPU count (required by resume_pod)
             pod = runpod.get_pod(pod_id)
@@ -620,12 +894,13 @@ class RunPodProvider(CloudProvider):
                 raise RuntimeError(f"Pod {pod_id} not found")
 
             gpu_count = pod.get("gpuCount", 1)
-            logger.debug(f"Resuming pod {pod_id} with {gpu_count} GPU(s)")
+            logger.debug("Resuming pod %s with %s GPU(s)", pod_id, gpu_count)
 
             # RunPod SDK's resume_pod() requires pod_id and gpu_count
             runpod.resume_pod(pod_id, gpu_count)
+            self._invalidate_status(pod_id)
 
-            logger.info(f"Pod {pod_id} started successfully")
+            logger.info("Pod %s started successfully", pod_id)
             logger.warning(
                 f"Pod {pod_id} resumed - GPU availability not guaranteed. "
                 "Check pod status to verify GPU type."
@@ -646,12 +921,13 @@ class RunPodProvider(CloudProvider):
             True if successful, False otherwise
         """
         try:
-            logger.info(f"Terminating pod: {pod_id}")
+            logger.info("Terminating pod: %s", pod_id)
 
             # RunPod SDK's terminate_pod() returns None on success, raises on failure
             runpod.terminate_pod(pod_id)
+            self._invalidate_status(pod_id)
 
-            logger.info(f"Pod {pod_id} terminated successfully")
+            logger.info("Pod %s terminated successfully", pod_id)
             return True
 
         except Exception as e:
@@ -681,7 +957,7 @@ class RunPodProvider(CloudProvider):
             # Returns: "abc123xyz-64411540@ssh.runpod.io"
         """
         try:
-            logger.debug(f"Getting SSH connection for pod: {pod_id}")
+            logger.debug("Getting SSH connection for pod: %s", pod_id)
 
             # Get pod status to check if SSH is ready
             status = self.get_pod_status(pod_id)
@@ -706,7 +982,7 @@ class RunPodProvider(CloudProvider):
             # RunPod SSH proxy format: {podHostId}@ssh.runpod.io
             conn_string = f"{pod_host_id}@{ssh_host}"
 
-            logger.info(f"SSH connection string for pod {pod_id}: {conn_string}")
+            logger.info("SSH connection string for pod %s: %s", pod_id, conn_string)
 
             return conn_string
 
@@ -714,6 +990,15 @@ class RunPodProvider(CloudProvider):
             logger.error(f"Error getting SSH connection string: {e}", exc_info=True)
             raise RuntimeError(f"Failed to get SSH connection string: {e}") from e
 
+    def _invalidate_status(self, pod_id: str) -> None:
+        """Drop any cached status for a pod after it changes state.
+
+        Args:
+            pod_id: Pod identifier
+        """
+        with self._status_cache_lock:
+            self._status_cache.pop(pod_id, None)
+
     def _generate_pod_name(self) -> str:
         """Generate a unique pod name with format: autopod-YYYY-MM-DD-NNN
 
@@ -725,41 +1010,37 @@ class RunPodProvider(CloudProvider):
             "autopod-2025-11-08-042"
         """
         # Get current date
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d")
+        date_str = _today_str()
 
-        # Get list of existing pods to find next number
-        try:
-            pods = runpod.get_pods()
+        with self._pod_name_lock:
+            # Get list of existing pods to find next number
+            try:
+                pods = runpod.get_pods()
 
-            # Filter pods created today with autopod prefix
-            today_prefix = f"autopod-{date_str}-"
-            today_pods = [p for p in pods if p.get("name", "").startswith(today_prefix)]
+                # Find the highest sequence number among today's autopod pods
+                max_num = 0
+                for pod in pods:
+                    match = _POD_NAME_RE.match(pod.get("name") or "")
+                    if match and match.group(1) == date_str:
+                        max_num = max(max_num, int(match.group(2)))
 
-            # Extract numbers and find max
-            max_num = 0
-            for pod in today_pods:
-                name = pod.get("name", "")
-                # Extract number from end of name
-                try:
-                    num_str = name.split("-")[-1]
-                    num = int(num_str)
-                    max_num = max(max_num, num)
-                except (ValueError, IndexError):
-                    continue
+                # Next number is max + 1
+                next_num = max_num + 1
 
-            # Next number is max + 1
-            next_num = max_num + 1
+            except Exception as e:
+                # If we can't get pods list, just use timestamp
+                logger.warning(f"Could not get pods list for naming: {e}")
+                now = datetime.now()
+                next_num = (now.hour * 10000 + now.minute * 100 + now.second) % 1000  # Use time as number
 
-        except Exception as e:
-            # If we can't get pods list, just use timestamp
-            logger.warning(f"Could not get pods list for naming: {e}")
-            next_num = int(now.strftime("%H%M%S")) % 1000  # Use time as number
+            # Never reuse a number this provider already handed out today
+            next_num = max(next_num, self._last_pod_numbers.get(date_str, 0) + 1)
+            self._last_pod_numbers[date_str] = next_num
 
         # Format: autopod-YYYY-MM-DD-NNN
         pod_name = f"autopod-{date_str}-{next_num:03d}"
 
-        logger.debug(f"Generated pod name: {pod_name}")
+        logger.debug("Generated pod name: %s", pod_name)
 
         return pod_name
 
@@ -832,6 +1113,9 @@ class RunPodProvider(CloudProvider):
         for SSH access and volume tracking. This is necessary because get_pod() doesn't
         return the podHostId or attached volume details.
 
+        The write is queued on a background thread and this method returns
+        immediately; _load_pod_metadata() flushes pending writes first.
+
         Args:
             pod_id: Pod identifier
             metadata: Dictionary with pod metadata:
@@ -839,40 +1123,14 @@ class RunPodProvider(CloudProvider):
                 - volume_id (optional): Network volume ID
                 - volume_mount (optional): Volume mount path
         """
-        import json
-        from pathlib import Path
-
-        # Ensure ~/.autopod directory exists
-        autopod_dir = Path.home() / ".autopod"
-        autopod_dir.mkdir(exist_ok=True, mode=0o700)
-
-        pods_file = autopod_dir / "pods.json"
-
-        # Load existing data
-        pods_data = {}
-        if pods_file.exists():
-            try:
-                with open(pods_file, "r") as f:
-                    pods_data = json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load pods metadata: {e}")
-
         # Update with new pod (merge with metadata)
         pod_data = {
             "created_at": datetime.now().isoformat(),
         }
         pod_data.update(metadata)  # Add all metadata fields
-        pods_data[pod_id] = pod_data
 
-        # Save back to file
-        try:
-            with open(pods_file, "w") as f:
-                json.dump(pods_data, f, indent=2)
-            # Secure permissions
-            pods_file.chmod(0o600)
-            logger.debug(f"Saved metadata for pod {pod_id}")
-        except Exception as e:
-            logger.error(f"Failed to save pod metadata: {e}")
+        # Hand off to the background writer - the caller doesn't wait on disk I/O
+        _metadata_writer.submit(self._pods_file, pod_id, pod_data)
 
     def _load_pod_metadata(self, pod_id: str) -> Optional[Dict]:
         """Load pod metadata from persistent storage.
@@ -883,16 +1141,14 @@ class RunPodProvider(CloudProvider):
         Returns:
             Dictionary with pod metadata, or None if not found
         """
-        import json
-        from pathlib import Path
-
-        pods_file = Path.home() / ".autopod" / "pods.json"
+        # Make sure any queued writes have reached disk before reading
+        _metadata_writer.flush()
 
-        if not pods_file.exists():
+        if not self._pods_file.exists():
             return None
 
         try:
-            with open(pods_file, "r") as f:
+            with open(self._pods_file, "r") as f:
                 pods_data = json.load(f)
             return pods_data.get(pod_id)
         except Exception as e:
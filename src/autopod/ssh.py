@@ -5,16 +5,92 @@ remote RunPod instances. Supports port forwarding (for ComfyUI API access)
 and direct shell access.
 """
 
+import asyncio
+import errno
+import functools
+import os
+import re
+import selectors
 import subprocess
 from subprocess import TimeoutExpired
 import time
 import socket
 import logging
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# SSH connection string: user@host or user@host:port
+_CONN_RE = re.compile(r"^(?P<user>[^@]+)@(?P<host>[^:@]+)(?::(?P<port>\d+))?$")
+
+# How long a ControlMaster connection stays open after its last client exits
+CONTROL_PERSIST = "10m"
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_path(path: str) -> str:
+    """Expand ~ in a path, caching the result.
+
+    Args:
+        path: Path that may start with ~
+
+    Returns:
+        Expanded path as a string
+    """
+    return str(Path(path).expanduser())
+
+
+def default_control_dir() -> Path:
+    """Get the directory holding ControlMaster sockets (~/.autopod/controlmasters).
+
+    Shells, ssh.py tunnels and TunnelManager tunnels all share it, so any of
+    them can attach to a master another one opened.
+
+    Returns:
+        Path to the control socket directory
+    """
+    return Path.home() / ".autopod" / "controlmasters"
+
+
+def _control_path(control_dir: Optional[Path] = None) -> Path:
+    """Get the ControlPath pattern for sockets in a control directory.
+
+    ssh expands %C to a hash of the local host, remote host, port and user,
+    so every destination gets its own socket.
+
+    Args:
+        control_dir: Control socket directory (default: default_control_dir())
+
+    Returns:
+        ControlPath pattern
+    """
+    return (control_dir or default_control_dir()) / "cm-%C"
+
+
+def multiplex_options(control_dir: Optional[Path] = None) -> List[str]:
+    """Build SSH options that share one connection per destination.
+
+    The first ssh invocation becomes the master; later tunnels and shells to
+    the same destination attach to it over a local Unix socket and skip the
+    TCP handshake, key exchange and authentication.
+
+    Args:
+        control_dir: Control socket directory, created owner-only if missing
+            (default: default_control_dir())
+
+    Returns:
+        List of ssh command-line arguments
+    """
+    control_dir = control_dir or default_control_dir()
+    control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={_control_path(control_dir)}",
+        "-o", f"ControlPersist={CONTROL_PERSIST}",
+    ]
+
 
 class SSHTunnel:
     """Manages SSH tunnel to a remote pod for port forwarding.
@@ -43,7 +119,9 @@ class SSHTunnel:
         local_port: int = 8188,
         remote_port: int = 8188,
         ssh_key_path: Optional[str] = None,
-        ssh_user: str = "root"
+        ssh_user: str = "root",
+        multiplex: bool = False,
+        log_path: Optional[Path] = None
     ):
         """Initialize SSH tunnel configuration.
 
@@ -54,19 +132,30 @@ class SSHTunnel:
             remote_port: Remote service port (default: 8188 for ComfyUI)
             ssh_key_path: Path to SSH private key (optional)
             ssh_user: SSH username (default: "root")
+            multiplex: Share one SSH connection per destination via
+                ControlMaster (default: False)
+            log_path: File to append the ssh process's stderr to (optional,
+                discarded by default)
         """
         self.ssh_host = ssh_host
         self.ssh_port = ssh_port
         self.local_port = local_port
         self.remote_port = remote_port
         self.ssh_key_path = ssh_key_path
+        self._ssh_key_path_expanded = _expand_path(ssh_key_path) if ssh_key_path else None
         self.ssh_user = ssh_user
+        self.multiplex = multiplex
+        self.log_path = log_path
         self.process: Optional[subprocess.Popen] = None
 
+        # Selector + pidfd that signal SSH process exit (Linux only)
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._exit_fd: Optional[int] = None
+
         port_info = f":{ssh_port}" if ssh_port else ""
         logger.debug(
-            f"SSHTunnel initialized: {ssh_user}@{ssh_host}{port_info} "
-            f"(local:{local_port} -> remote:{remote_port})"
+            "SSHTunnel initialized: %s@%s%s (local:%s -> remote:%s)",
+            ssh_user, ssh_host, port_info, local_port, remote_port
         )
 
     def create_tunnel(self, timeout: int = 10) -> bool:
@@ -89,6 +178,83 @@ class SSHTunnel:
             logger.warning("SSH tunnel already exists and is running")
             return True
 
+        cmd = self._build_command()
+
+        logger.info(
+            "Creating SSH tunnel: localhost:%s -> %s:%s",
+            self.local_port, self.ssh_host, self.remote_port
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SSH command: %s", " ".join(cmd))
+
+        try:
+            self._spawn(cmd)
+
+            # Wait for tunnel to be ready
+            if not self.wait_for_connection(timeout=timeout):
+                self.close()
+                raise RuntimeError(f"SSH tunnel failed to establish within {timeout}s")
+
+            logger.info("SSH tunnel established successfully")
+            return True
+
+        except Exception as e:
+            logger.error("Failed to create SSH tunnel: %s", e, exc_info=True)
+            if self.process:
+                self.close()
+            raise RuntimeError(f"SSH tunnel creation failed: {e}")
+
+    async def create_tunnel_async(self, timeout: int = 10) -> bool:
+        """Create the SSH tunnel without blocking the event loop.
+
+        Same as create_tunnel(), but waits for the tunnel with asyncio so
+        several tunnels can be brought up concurrently (see create_tunnels()).
+
+        Args:
+            timeout: Maximum time to wait for tunnel creation (seconds)
+
+        Returns:
+            True if tunnel was created successfully
+
+        Raises:
+            RuntimeError: If tunnel creation fails
+        """
+        if self.process and self.is_alive():
+            logger.warning("SSH tunnel already exists and is running")
+            return True
+
+        cmd = self._build_command()
+
+        logger.info(
+            "Creating SSH tunnel: localhost:%s -> %s:%s",
+            self.local_port, self.ssh_host, self.remote_port
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SSH command: %s", " ".join(cmd))
+
+        try:
+            self._spawn(cmd)
+
+            # Wait for tunnel to be ready
+            if not await self._wait_for_connection_async(timeout=timeout):
+                self.close()
+                raise RuntimeError(f"SSH tunnel failed to establish within {timeout}s")
+
+            logger.info("SSH tunnel established successfully")
+            return True
+
+        except Exception as e:
+            logger.error("Failed to create SSH tunnel: %s", e, exc_info=True)
+            if self.process:
+                self.close()
+            raise RuntimeError(f"SSH tunnel creation failed: {e}")
+
+    def _build_command(self) -> List[str]:
+        """Build the ssh command line for this tunnel.
+
+        Returns:
+            ssh argument list
+        """
         # Build SSH command
         # -N: No remote command (just port forwarding)
         # -L: Local port forwarding
@@ -112,41 +278,41 @@ class SSHTunnel:
             "-o", "ServerAliveCountMax=3",
         ])
 
+        # Reuse an existing connection to this destination if there is one
+        if self.multiplex:
+            cmd.extend(multiplex_options())
+
         # Add SSH key if provided
-        if self.ssh_key_path:
-            expanded_path = str(Path(self.ssh_key_path).expanduser())
-            cmd.extend(["-i", expanded_path])
+        if self._ssh_key_path_expanded:
+            cmd.extend(["-i", self._ssh_key_path_expanded])
 
         # Add user@host
         cmd.append(f"{self.ssh_user}@{self.ssh_host}")
 
-        logger.info(f"Creating SSH tunnel: localhost:{self.local_port} -> {self.ssh_host}:{self.remote_port}")
-        logger.debug(f"SSH command: {' '.join(cmd)}")
+        return cmd
+
+    def _spawn(self, cmd: List[str]) -> None:
+        """Start the SSH process in the background.
 
+        Args:
+            cmd: ssh argument list from _build_command()
+        """
+        # Nothing reads the tunnel's output, so don't give it pipes - a full
+        # pipe buffer would block ssh. Forwarded traffic never uses them.
+        stderr = open(self.log_path, "ab", buffering=0) if self.log_path else subprocess.DEVNULL
         try:
-            # Start SSH process in background
             self.process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
                 stdin=subprocess.DEVNULL
             )
+        finally:
+            if stderr is not subprocess.DEVNULL:
+                stderr.close()
 
-            logger.info(f"SSH tunnel process started (PID: {self.process.pid})")
-
-            # Wait for tunnel to be ready
-            if not self.wait_for_connection(timeout=timeout):
-                self.close()
-                raise RuntimeError(f"SSH tunnel failed to establish within {timeout}s")
-
-            logger.info("SSH tunnel established successfully")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to create SSH tunnel: {e}", exc_info=True)
-            if self.process:
-                self.close()
-            raise RuntimeError(f"SSH tunnel creation failed: {e}")
+        logger.info("SSH tunnel process started (PID: %s)", self.process.pid)
+        self._watch_process()
 
     def is_alive(self) -> bool:
         """Check if the SSH tunnel process is still running.
@@ -160,47 +326,194 @@ class SSHTunnel:
         # Check if process is still running
         return self.process.poll() is None
 
-    def wait_for_connection(self, timeout: int = 30, interval: float = 0.5) -> bool:
+    def wait_for_connection(self, timeout: int = 30, interval: float = 0.1) -> bool:
         """Wait for the SSH tunnel to become ready for connections.
 
-        Polls the local port to check if it's accepting connections.
-        This ensures the tunnel is fully established before returning.
+        Probes the local port with a non-blocking connect and waits on the
+        socket with a selector, so readiness is detected as soon as the
+        handshake completes. Refused attempts are retried with exponential
+        backoff (5 ms doubling up to ``interval``). When the SSH process is
+        watched via a pidfd, its exit wakes the same selector, so a dead
+        tunnel is reported immediately instead of on the next poll.
+
+        Args:
+            timeout: Maximum time to wait (seconds)
+            interval: Maximum time between connection attempts (seconds)
+
+        Returns:
+            True if tunnel is ready, False if timeout reached
+        """
+        logger.debug("Waiting for SSH tunnel on localhost:%s...", self.local_port)
+
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        selector = self._selector or selectors.DefaultSelector()
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                # Without a pidfd, check if process is still alive by polling
+                if self._exit_fd is None and not self.is_alive():
+                    logger.error("SSH tunnel process died while waiting for connection")
+                    return False
+
+                # Try to connect to local port
+                try:
+                    ready = self._probe_local_port(selector, remaining)
+                except Exception as e:
+                    logger.debug("Connection attempt failed: %s", e)
+                    ready = False
+
+                if ready is None:
+                    logger.error("SSH tunnel process died while waiting for connection")
+                    return False
+                if ready:
+                    logger.debug("SSH tunnel ready on localhost:%s", self.local_port)
+                    return True
+
+                # Back off before the next attempt. With a pidfd registered,
+                # select() doubles as the sleep and wakes if the process exits.
+                pause = min(delay, max(remaining, 0))
+                if self._exit_fd is not None:
+                    if selector.select(timeout=pause):
+                        logger.error("SSH tunnel process died while waiting for connection")
+                        return False
+                else:
+                    time.sleep(pause)
+                delay = min(delay * 2, interval)
+        finally:
+            if selector is not self._selector:
+                selector.close()
+
+        logger.warning("SSH tunnel not ready after %ss", timeout)
+        return False
+
+    async def _wait_for_connection_async(self, timeout: int = 30, interval: float = 0.1) -> bool:
+        """Async variant of wait_for_connection().
 
         Args:
             timeout: Maximum time to wait (seconds)
-            interval: Time between connection attempts (seconds)
+            interval: Maximum time between connection attempts (seconds)
 
         Returns:
             True if tunnel is ready, False if timeout reached
         """
-        logger.debug(f"Waiting for SSH tunnel on localhost:{self.local_port}...")
+        logger.debug("Waiting for SSH tunnel on localhost:%s...", self.local_port)
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
 
-        while time.time() - start_time < timeout:
-            # Check if process is still alive
             if not self.is_alive():
                 logger.error("SSH tunnel process died while waiting for connection")
                 return False
 
-            # Try to connect to local port
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', self.local_port))
-                sock.close()
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection("127.0.0.1", self.local_port),
+                    timeout=remaining
+                )
+                writer.close()
+                logger.debug("SSH tunnel ready on localhost:%s", self.local_port)
+                return True
+            except (OSError, asyncio.TimeoutError) as e:
+                logger.debug("Connection attempt failed: %s", e)
+
+            await asyncio.sleep(min(delay, max(remaining, 0)))
+            delay = min(delay * 2, interval)
+
+        logger.warning("SSH tunnel not ready after %ss", timeout)
+        return False
 
-                if result == 0:
-                    logger.debug(f"SSH tunnel ready on localhost:{self.local_port}")
-                    return True
+    def _probe_local_port(self, selector: selectors.BaseSelector, timeout: float) -> Optional[bool]:
+        """Attempt one non-blocking connection to the local tunnel port.
 
-            except Exception as e:
-                logger.debug(f"Connection attempt failed: {e}")
+        Args:
+            selector: Selector used to wait for the connect to complete
+            timeout: Maximum time to wait for the handshake (seconds)
 
-            time.sleep(interval)
+        Returns:
+            True if the connection succeeded, False if it failed, or None if
+            the watched SSH process exited while waiting
+        """
+        sock = self._new_probe_socket()
+        try:
+            # 127.0.0.1 rather than "localhost" - no name resolution per attempt
+            result = sock.connect_ex(("127.0.0.1", self.local_port))
+
+            if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                selector.register(sock, selectors.EVENT_WRITE)
+                try:
+                    events = selector.select(timeout=timeout)
+                finally:
+                    selector.unregister(sock)
+
+                if any(key.fileobj is not sock for key, _ in events):
+                    return None
+                if not events:
+                    return False
+                result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+
+            return result == 0
+        finally:
+            sock.close()
 
-        logger.warning(f"SSH tunnel not ready after {timeout}s")
-        return False
+    @staticmethod
+    def _new_probe_socket() -> socket.socket:
+        """Create a non-blocking TCP socket for probing the tunnel port.
+
+        A TCP socket can't be reconnected after a refused connect, so each
+        failed attempt needs a fresh one. TCP_NODELAY and (on Linux)
+        TCP_QUICKACK make the handshake result visible without delayed-ACK
+        latency.
+
+        Returns:
+            Configured socket
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        return sock
+
+    def _watch_process(self) -> None:
+        """Register the SSH process exit with a persistent selector.
+
+        Uses a Linux pidfd, which becomes readable when the process exits.
+        Where pidfds aren't available, wait_for_connection() falls back to
+        polling is_alive().
+        """
+        self._unwatch_process()
+
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None or not isinstance(self.process.pid, int):
+            return
+
+        try:
+            self._exit_fd = pidfd_open(self.process.pid)
+        except OSError as e:
+            logger.debug("pidfd unavailable, polling SSH process instead: %s", e)
+            return
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._exit_fd, selectors.EVENT_READ)
+
+    def _unwatch_process(self) -> None:
+        """Release the selector and pidfd created by _watch_process()."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._exit_fd is not None:
+            os.close(self._exit_fd)
+            self._exit_fd = None
 
     def close(self) -> None:
         """Close the SSH tunnel and cleanup resources.
@@ -212,9 +525,13 @@ class SSHTunnel:
             logger.debug("No SSH tunnel process to close")
             return
 
-        logger.info(f"Closing SSH tunnel (PID: {self.process.pid})")
+        logger.info("Closing SSH tunnel (PID: %s)", self.process.pid)
 
         try:
+            # A multiplexed forward lives in the master - release it there
+            if self.multiplex:
+                self._cancel_forward()
+
             # Try graceful termination first
             self.process.terminate()
 
@@ -230,10 +547,33 @@ class SSHTunnel:
                 logger.info("SSH tunnel force killed")
 
         except Exception as e:
-            logger.error(f"Error closing SSH tunnel: {e}", exc_info=True)
+            logger.error("Error closing SSH tunnel: %s", e, exc_info=True)
         finally:
+            self._unwatch_process()
             self.process = None
 
+    def _cancel_forward(self) -> None:
+        """Ask the ControlMaster to drop this tunnel's port forward."""
+        cmd = [
+            "ssh", "-O", "cancel",
+            "-L", f"{self.local_port}:localhost:{self.remote_port}",
+            "-o", f"ControlPath={_control_path()}",
+        ]
+        # The port is part of the socket name, so it must match the master's
+        if self.ssh_port is not None:
+            cmd.extend(["-p", str(self.ssh_port)])
+        cmd.append(f"{self.ssh_user}@{self.ssh_host}")
+
+        try:
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=10
+            )
+        except Exception as e:
+            logger.warning("Could not cancel multiplexed port forward: %s", e)
+
     def __enter__(self):
         """Context manager entry - create tunnel."""
         self.create_tunnel()
@@ -245,12 +585,43 @@ class SSHTunnel:
         return False
 
 
+def create_tunnels(tunnels: List[SSHTunnel], timeout: int = 10) -> List[bool]:
+    """Bring up several SSH tunnels concurrently.
+
+    Each tunnel's ssh process is started immediately and all readiness
+    waits run in parallel, so total time is close to the slowest tunnel
+    rather than the sum of all of them.
+
+    Args:
+        tunnels: Tunnels to start
+        timeout: Maximum time to wait for each tunnel (seconds)
+
+    Returns:
+        List of booleans (same order as tunnels), True where the tunnel
+        came up
+
+    Example:
+        >>> tunnels = [SSHTunnel("ssh.runpod.io", local_port=p, ssh_user=u)
+        ...            for p, u in [(8188, "pod-a"), (8189, "pod-b")]]
+        >>> create_tunnels(tunnels)
+        [True, True]
+    """
+    async def _create_all():
+        return await asyncio.gather(
+            *(tunnel.create_tunnel_async(timeout=timeout) for tunnel in tunnels),
+            return_exceptions=True
+        )
+
+    return [result is True for result in asyncio.run(_create_all())]
+
+
 def open_shell(
     ssh_host: str,
     ssh_port: Optional[int] = None,
     ssh_key_path: Optional[str] = None,
     ssh_user: str = "root",
-    timeout: int = 30
+    timeout: int = 30,
+    multiplex: bool = False
 ) -> int:
     """Open an interactive SSH shell to a remote pod.
 
@@ -264,6 +635,8 @@ def open_shell(
         ssh_key_path: Path to SSH private key (optional)
         ssh_user: SSH username (default: "root")
         timeout: Connection timeout in seconds
+        multiplex: Share one SSH connection per destination via
+            ControlMaster (default: False)
 
     Returns:
         Exit code from SSH session (0 = success, non-zero = error)
@@ -278,7 +651,7 @@ def open_shell(
         >>> # User can now run commands interactively
     """
     port_info = f":{ssh_port}" if ssh_port else ""
-    logger.info(f"Opening SSH shell to {ssh_user}@{ssh_host}{port_info}")
+    logger.info("Opening SSH shell to %s@%s%s", ssh_user, ssh_host, port_info)
 
     # Build SSH command for interactive shell
     cmd = ["ssh"]
@@ -293,22 +666,26 @@ def open_shell(
         "-o", f"ConnectTimeout={timeout}",
     ])
 
+    # Reuse an existing connection to this destination if there is one
+    if multiplex:
+        cmd.extend(multiplex_options())
+
     # Add SSH key if provided
     if ssh_key_path:
-        expanded_path = str(Path(ssh_key_path).expanduser())
-        cmd.extend(["-i", expanded_path])
+        cmd.extend(["-i", _expand_path(ssh_key_path)])
 
     # Add user@host
     cmd.append(f"{ssh_user}@{ssh_host}")
 
-    logger.debug(f"SSH shell command: {' '.join(cmd)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SSH shell command: %s", " ".join(cmd))
 
     try:
         # Run SSH in foreground (interactive)
         # This replaces the current process with SSH
         result = subprocess.run(cmd)
 
-        logger.info(f"SSH shell exited with code {result.returncode}")
+        logger.info("SSH shell exited with code %s", result.returncode)
         return result.returncode
 
     except KeyboardInterrupt:
@@ -316,11 +693,79 @@ def open_shell(
         return 130  # Standard exit code for SIGINT
 
     except Exception as e:
-        logger.error(f"SSH shell failed: {e}", exc_info=True)
+        logger.error("SSH shell failed: %s", e, exc_info=True)
         return 1
 
 
-def parse_ssh_connection_string(conn_str: str) -> Dict[str, any]:
+def close_control_master(
+    ssh_host: str,
+    ssh_port: Optional[int] = None,
+    ssh_user: str = "root"
+) -> bool:
+    """Shut down the shared ControlMaster connection for a destination.
+
+    Tunnels and shells still attached to the master are disconnected.
+
+    Args:
+        ssh_host: SSH host address
+        ssh_port: SSH port number (optional)
+        ssh_user: SSH username (default: "root")
+
+    Returns:
+        True if a master was running and has exited, False otherwise
+    """
+    control_dir = default_control_dir()
+    if not control_dir.is_dir() or not any(path.is_socket() for path in control_dir.iterdir()):
+        logger.debug("No SSH control master for %s@%s", ssh_user, ssh_host)
+        return False
+
+    cmd = ["ssh", "-O", "exit", "-o", f"ControlPath={_control_path(control_dir)}"]
+    # The port is part of the socket name, so it must match the master's
+    if ssh_port is not None:
+        cmd.extend(["-p", str(ssh_port)])
+    cmd.append(f"{ssh_user}@{ssh_host}")
+
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
+    except Exception as e:
+        logger.warning("Failed to close SSH control master: %s", e)
+        return False
+
+    if result.returncode != 0:
+        logger.debug("No SSH control master for %s@%s", ssh_user, ssh_host)
+        return False
+
+    logger.info("Closed SSH control master for %s@%s", ssh_user, ssh_host)
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_conn_fields(conn_str: str) -> Tuple[str, str, Optional[int]]:
+    """Split a connection string into (user, host, port), caching the result.
+
+    Args:
+        conn_str: SSH connection string
+
+    Returns:
+        Tuple of (user, host, port), port=None if not specified
+
+    Raises:
+        ValueError: If the string doesn't match either format
+    """
+    match = _CONN_RE.match(conn_str)
+    if not match:
+        raise ValueError(f"Invalid SSH connection string format: {conn_str}")
+
+    port = match.group("port")
+    return match.group("user"), match.group("host"), int(port) if port else None
+
+
+def parse_ssh_connection_string(conn_str: str) -> Dict[str, Any]:
     """Parse SSH connection string into components.
 
     Supports two formats:
@@ -333,6 +778,9 @@ def parse_ssh_connection_string(conn_str: str) -> Dict[str, any]:
     Returns:
         Dictionary with keys: user, host, port (port=None if not specified)
 
+    Raises:
+        ValueError: If the string doesn't match either format
+
     Examples:
         >>> parse_ssh_connection_string("abc-def@ssh.runpod.io")
         {'user': 'abc-def', 'host': 'ssh.runpod.io', 'port': None}
@@ -340,19 +788,8 @@ def parse_ssh_connection_string(conn_str: str) -> Dict[str, any]:
         >>> parse_ssh_connection_string("root@ssh.runpod.io:12345")
         {'user': 'root', 'host': 'ssh.runpod.io', 'port': 12345}
     """
-    if "@" not in conn_str:
-        raise ValueError(f"Invalid SSH connection string format: {conn_str}")
-
-    # Check if port is included
-    if ":" in conn_str:
-        # Format: user@host:port
-        user_host, port_str = conn_str.rsplit(":", 1)
-        user, host = user_host.split("@", 1)
-        port = int(port_str)
-    else:
-        # Format: user@host (RunPod proxy format)
-        user, host = conn_str.split("@", 1)
-        port = None
+    # Parsing is cached, but each caller gets its own dict to modify
+    user, host, port = _parse_conn_fields(conn_str)
 
     return {
         "user": user,
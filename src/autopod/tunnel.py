@@ -26,17 +26,87 @@ Example:
     >>> tunnel.is_active()  # True
 """
 
+import contextlib
+import functools
 import json
 import logging
+import os
+import shutil
+import socket
 import subprocess
+import tempfile
 import time
 from pathlib import Path
-from typing import Optional, Dict, List
-import requests
-import psutil
+from typing import Iterator, Optional, Dict, List, Sequence, Tuple
+
+from autopod._lazy import lazy_import
+from autopod.ssh import multiplex_options
 
 logger = logging.getLogger(__name__)
 
+# Only tunnel commands need psutil; see autopod._lazy
+psutil = lazy_import("psutil")
+
+# Absolute path to ssh, resolved once. posix_spawn needs a full path and
+# skips the PATH search Popen would otherwise do on every launch.
+_SSH_PATH = shutil.which("ssh")
+
+# How long start() waits for the forwarded port to accept connections
+STARTUP_TIMEOUT = 2.0
+STARTUP_POLL_INTERVAL = 0.02
+
+# Most of ssh's stderr that start() reports when the tunnel fails
+STDERR_REPORT_LIMIT = 4096
+
+# How long an is_active() result is reused before /proc is checked again
+ACTIVE_CACHE_TTL = 1.0
+
+# Parsed tunnels.json contents by path, keyed on the file's identity
+# (st_mtime_ns, st_ino, st_size) so an unchanged file is not re-parsed.
+# _save_state replaces the file atomically, so every write gets a new inode.
+_STATE_CACHE: Dict[Path, Tuple[Tuple[int, int, int], bytes, Dict]] = {}
+
+# How long a tunnel gets to exit after SIGTERM before it is killed
+STOP_TIMEOUT = 5
+
+
+def _spawn_detached(cmd: Sequence[str], stderr_fd: int) -> int:
+    """Launch a command in its own session using posix_spawn.
+
+    posix_spawn is vfork-backed on modern libcs, so launch cost does not grow
+    with the size of the Python process the way fork+exec does. subprocess
+    only takes that fast path without start_new_session, which tunnels need
+    to survive the terminal closing, so spawn directly with setsid=True.
+
+    Args:
+        cmd: Command argv (cmd[0] is used as the process name)
+        stderr_fd: File descriptor the child's stderr is attached to
+
+    Returns:
+        Process ID of the child
+    """
+    return os.posix_spawn(
+        _SSH_PATH,
+        cmd,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, stderr_fd, 2),
+        ],
+        setsid=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config_dir() -> Path:
+    """Get the default configuration directory (~/.autopod), resolved once.
+
+    Returns:
+        Path to ~/.autopod
+    """
+    return Path.home() / ".autopod"
+
 
 class SSHTunnel:
     """Manages a single SSH tunnel to a pod.
@@ -55,10 +125,25 @@ class SSHTunnel:
         local_port: Local port to bind (e.g., 8188)
         remote_port: Remote port to forward (e.g., 8188 for ComfyUI)
         ssh_key_path: Path to SSH private key (optional, uses ssh-agent if not specified)
-        process: subprocess.Popen object for the SSH tunnel
+        process: psutil.Process handle for the SSH tunnel
         pid: Process ID of the SSH tunnel (for reconnection)
     """
 
+    __slots__ = (
+        "pod_id",
+        "ssh_connection_string",
+        "local_port",
+        "remote_port",
+        "ssh_key_path",
+        "control_dir",
+        "_port_marker",
+        "_ssh_argv",
+        "process",
+        "pid",
+        "_cached_active",
+        "_cache_ts",
+    )
+
     def __init__(
         self,
         pod_id: str,
@@ -66,7 +151,8 @@ class SSHTunnel:
         local_port: int,
         remote_port: int,
         ssh_key_path: Optional[str] = None,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        control_dir: Optional[Path] = None
     ):
         """Initialize SSH tunnel configuration.
 
@@ -77,14 +163,23 @@ class SSHTunnel:
             remote_port: Remote port to forward
             ssh_key_path: Path to SSH private key (optional)
             pid: Existing process ID (for reconnection)
+            control_dir: Directory for ControlMaster sockets. When set, tunnels
+                to the same host share one authenticated SSH connection
+                (optional, each tunnel connects separately by default)
         """
         self.pod_id = pod_id
         self.ssh_connection_string = ssh_connection_string
         self.local_port = local_port
         self.remote_port = remote_port
         self.ssh_key_path = ssh_key_path
-        self.process: Optional[subprocess.Popen] = None
+        self.control_dir = control_dir
+        # The -L forwarding spec; also how is_active() recognises our process
+        self._port_marker = f"{local_port}:localhost:{remote_port}"
+        self._ssh_argv = self._build_argv()
+        self.process: Optional[psutil.Process] = None
         self.pid = pid
+        self._cached_active: Optional[bool] = None
+        self._cache_ts = 0.0
 
         # If PID provided, try to reconnect to existing process
         if pid and psutil.pid_exists(pid):
@@ -103,7 +198,7 @@ class SSHTunnel:
     def start(self) -> bool:
         """Start the SSH tunnel.
 
-        Creates an SSH tunnel using subprocess with port forwarding:
+        Creates an SSH tunnel using posix_spawn with port forwarding:
         localhost:{local_port} -> pod:{remote_port}
 
         The tunnel runs as an independent background process that persists
@@ -115,6 +210,7 @@ class SSHTunnel:
         Raises:
             RuntimeError: If tunnel is already running
         """
+        self._invalidate_active()
         if self.is_active():
             raise RuntimeError(
                 f"Tunnel for pod {self.pod_id} is already running (PID: {self.pid})"
@@ -125,7 +221,55 @@ class SSHTunnel:
             f"localhost:{self.local_port} -> {self.remote_port}"
         )
 
-        # Build SSH command
+        logger.debug(f"SSH command: {' '.join(self._ssh_argv)}")
+
+        try:
+            if _SSH_PATH is None:
+                logger.error("SSH tunnel failed to start: ssh not found in PATH")
+                return False
+
+            # ssh's stderr goes to an unlinked temp file rather than a pipe:
+            # reading it after a failure never blocks, and a long-lived tunnel
+            # can't stall on (or be killed by) a pipe nobody reads. Our handle
+            # closes here; ssh keeps its own copy for as long as it runs.
+            with tempfile.TemporaryFile() as stderr_file:
+                # Start SSH tunnel as background process in its own session
+                # Process runs independently of autopod
+                self.pid = _spawn_detached(self._ssh_argv, stderr_file.fileno())
+                self.process = psutil.Process(self.pid)
+                self._invalidate_active()
+
+                if not self._wait_until_ready(STARTUP_TIMEOUT):
+                    # Process died immediately
+                    stderr_file.seek(0)
+                    error_msg = stderr_file.read(STDERR_REPORT_LIMIT).decode('utf-8', errors='ignore')
+                    logger.error(f"SSH tunnel failed to start: {error_msg}")
+                    self.pid = None
+                    self.process = None
+                    return False
+
+            logger.info(
+                f"SSH tunnel started successfully: "
+                f"localhost:{self.local_port} -> pod {self.pod_id}:{self.remote_port} "
+                f"(PID: {self.pid})"
+            )
+            return True
+
+        except Exception as e:
+            logger.exception(f"Failed to start SSH tunnel: {e}")
+            self.pid = None
+            self.process = None
+            return False
+
+    def _build_argv(self) -> Tuple[str, ...]:
+        """Build the ssh command line for this tunnel.
+
+        Everything in it is fixed for the tunnel's lifetime, so it is built
+        once in __init__ and reused by every start().
+
+        Returns:
+            SSH command argv
+        """
         # -N: No remote command (just forwarding)
         # -L: Local port forwarding
         # -o ServerAliveInterval=60: Keep connection alive
@@ -139,59 +283,99 @@ class SSHTunnel:
         cmd = [
             "ssh",
             "-N",
-            "-L", f"{self.local_port}:localhost:{self.remote_port}",
+            "-L", self._port_marker,
             "-o", "ServerAliveInterval=60",
             "-o", "ServerAliveCountMax=3",
             "-o", "ExitOnForwardFailure=yes",
             "-o", "StrictHostKeyChecking=no",
         ]
 
+        # Multiplex over a shared master connection: the first tunnel to a
+        # host does the handshake, later ones skip key exchange and auth
+        if self.control_dir is not None:
+            cmd.extend(self._control_options())
+
         # Add connection string
         cmd.append(self.ssh_connection_string)
 
-        logger.debug(f"SSH command: {' '.join(cmd)}")
+        return tuple(cmd)
+
+    def _control_options(self) -> List[str]:
+        """Build the ssh options that attach to the ControlMaster socket.
+
+        Returns:
+            List of ssh command-line arguments
+        """
+        return multiplex_options(self.control_dir)
+
+    def _cancel_forward(self) -> None:
+        """Ask the ControlMaster to drop this tunnel's port forward.
 
+        With multiplexing the listening socket can belong to the master, so
+        it outlives the tunnel's own ssh process unless cancelled.
+        """
         try:
-            # Start SSH tunnel as background process
-            # Process runs independently of autopod
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            subprocess.run(
+                [
+                    _SSH_PATH or "ssh",
+                    *self._control_options(),
+                    "-O", "cancel",
+                    "-L", self._port_marker,
+                    self.ssh_connection_string,
+                ],
                 stdin=subprocess.DEVNULL,
-                start_new_session=True  # Detach from parent process
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Could not cancel forward on control master: {e}")
+
+    def _wait_until_ready(self, timeout: float) -> bool:
+        """Wait for the tunnel's local port to start accepting connections.
+
+        ssh only binds the local port once it has authenticated, so a
+        successful connect means the tunnel is up. Returns as soon as that
+        happens rather than sleeping for a fixed time.
 
-            self.pid = self.process.pid
+        Args:
+            timeout: Maximum time to wait in seconds
 
-            # Give tunnel time to establish
-            time.sleep(2)
+        Returns:
+            False if the ssh process exited, True otherwise (including when
+            the port is still not listening at the deadline)
+        """
+        deadline = time.monotonic() + timeout
 
+        while True:
             # Check if process is still running
-            if self.process.poll() is not None:
-                # Process died immediately
-                _, stderr = self.process.communicate()
-                error_msg = stderr.decode('utf-8', errors='ignore')
-                logger.error(f"SSH tunnel failed to start: {error_msg}")
-                self.pid = None
+            exited_pid, _ = os.waitpid(self.pid, os.WNOHANG)
+            if exited_pid != 0:
                 return False
 
-            logger.info(
-                f"SSH tunnel started successfully: "
-                f"localhost:{self.local_port} -> pod {self.pod_id}:{self.remote_port} "
-                f"(PID: {self.pid})"
-            )
-            return True
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                if sock.connect_ex(("127.0.0.1", self.local_port)) == 0:
+                    return True
 
-        except Exception as e:
-            logger.exception(f"Failed to start SSH tunnel: {e}")
-            self.pid = None
-            return False
+            if time.monotonic() >= deadline:
+                logger.debug(
+                    f"Tunnel port {self.local_port} not listening after {timeout}s; "
+                    f"ssh is still running"
+                )
+                return True
+
+            time.sleep(STARTUP_POLL_INTERVAL)
 
-    def is_active(self) -> bool:
+    def is_active(self, procs: Optional[Dict[int, List[str]]] = None) -> bool:
         """Check if the SSH tunnel process is running.
 
         Works even if autopod was restarted - checks if PID exists in system.
+        The result is cached for ACTIVE_CACHE_TTL seconds, since callers such
+        as get_status() and TunnelManager check the same tunnel repeatedly.
+
+        Args:
+            procs: Snapshot from TunnelManager._snapshot_ssh_procs() to check
+                against instead of reading /proc for this PID (optional)
 
         Returns:
             True if tunnel process is active, False otherwise
@@ -199,30 +383,78 @@ class SSHTunnel:
         if self.pid is None:
             return False
 
+        now = time.monotonic()
+        if procs is not None:
+            self._cached_active = self._matches_cmdline(procs.get(self.pid))
+        elif self._cached_active is None or now - self._cache_ts >= ACTIVE_CACHE_TTL:
+            self._cached_active = self._check_active()
+        else:
+            return self._cached_active
+
+        self._cache_ts = now
+        return self._cached_active
+
+    def _invalidate_active(self) -> None:
+        """Forget the cached is_active() result."""
+        self._cached_active = None
+
+    def _get_process(self) -> "psutil.Process":
+        """Get the psutil handle for the tunnel process, creating it once.
+
+        Returns:
+            psutil.Process for self.pid
+        """
+        if self.process is None:
+            self.process = psutil.Process(self.pid)
+        return self.process
+
+    def _check_active(self) -> bool:
+        """Check /proc for the tunnel process, bypassing the cache.
+
+        Returns:
+            True if tunnel process is active, False otherwise
+        """
         # Check if PID exists in system
         if not psutil.pid_exists(self.pid):
             return False
 
         # Verify it's actually an SSH process (not a recycled PID)
         try:
-            proc = psutil.Process(self.pid)
-            cmdline = " ".join(proc.cmdline())
+            return self._matches_cmdline(self._get_process().cmdline())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
 
-            # Check if it's our SSH tunnel
-            if "ssh" in cmdline.lower() and str(self.local_port) in cmdline:
-                return True
-            else:
-                logger.warning(f"PID {self.pid} exists but is not our SSH tunnel")
-                return False
+    def _matches_cmdline(self, argv: Optional[List[str]]) -> bool:
+        """Check whether a process command line is this tunnel's ssh.
 
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        Args:
+            argv: Command line of the process running as self.pid, or None
+                if there is no such process
+
+        Returns:
+            True if argv belongs to our SSH tunnel, False otherwise
+        """
+        if not argv:
             return False
 
+        # Check if it's our SSH tunnel: an ssh binary carrying the exact -L
+        # argument start() passes, not just any process mentioning the port
+        if (
+            os.path.basename(argv[0]) == "ssh"
+            and self._port_marker in argv
+        ):
+            return True
+
+        logger.warning(f"PID {self.pid} exists but is not our SSH tunnel")
+        return False
+
     def test_connectivity(self, timeout: int = 5) -> bool:
-        """Test if the tunnel is working by making an HTTP request.
+        """Test if the tunnel is working by sending a minimal HTTP request.
 
-        Attempts to connect to localhost:{local_port} to verify the tunnel
-        is forwarding traffic correctly.
+        Connects to 127.0.0.1:{local_port} and waits for the first byte of a
+        reply. The TCP connect alone is not enough: ssh accepts connections
+        on the forwarded port even when nothing is listening on the pod, and
+        then closes them once the remote side refuses.
 
         Args:
             timeout: Request timeout in seconds (default: 5)
@@ -236,40 +468,50 @@ class SSHTunnel:
             )
             return False
 
-        try:
-            # Try to connect to localhost on the tunnel port
-            # Just checking if *something* responds (don't care about HTTP errors)
-            url = f"http://localhost:{self.local_port}"
-            logger.debug(f"Testing tunnel connectivity: {url}")
+        address = ("127.0.0.1", self.local_port)
+        logger.debug(f"Testing tunnel connectivity: {address[0]}:{address[1]}")
 
-            response = requests.get(url, timeout=timeout)
+        try:
+            with socket.create_connection(address, timeout=timeout) as sock:
+                sock.sendall(b"HEAD / HTTP/1.0\r\n\r\n")
+                reply = sock.recv(1)
 
             # Any HTTP response (even 404) means tunnel is working
-            logger.info(
-                f"Tunnel connectivity test passed: {url} returned {response.status_code}"
+            if reply:
+                logger.info(f"Tunnel connectivity test passed: port {self.local_port} responded")
+                return True
+
+            logger.warning(
+                f"Tunnel connectivity test failed: connection closed on port {self.local_port}"
             )
-            return True
+            return False
 
-        except requests.exceptions.ConnectionError:
+        except ConnectionRefusedError:
             logger.warning(
                 f"Tunnel connectivity test failed: connection refused on port {self.local_port}"
             )
             return False
-        except requests.exceptions.Timeout:
+        except socket.timeout:
             logger.warning(f"Tunnel connectivity test failed: timeout after {timeout}s")
             return False
-        except Exception as e:
+        except OSError as e:
             logger.warning(f"Tunnel connectivity test failed: {e}")
             return False
 
-    def stop(self) -> bool:
+    def stop(self, wait: bool = True) -> bool:
         """Stop the SSH tunnel.
 
         Terminates the SSH tunnel process gracefully.
 
+        Args:
+            wait: Wait up to STOP_TIMEOUT seconds for the process to exit and
+                kill it if it doesn't (default: True). Pass False to only send
+                SIGTERM and wait for several tunnels at once instead.
+
         Returns:
             True if tunnel stopped successfully, False otherwise
         """
+        self._invalidate_active()
         if not self.is_active():
             logger.warning(f"Tunnel for pod {self.pod_id} is not running")
             return False
@@ -277,22 +519,28 @@ class SSHTunnel:
         logger.info(f"Stopping SSH tunnel for pod {self.pod_id} (PID: {self.pid})")
 
         try:
-            proc = psutil.Process(self.pid)
+            proc = self._get_process()
 
             # Try graceful termination first
             proc.terminate()
 
             # Wait up to 5 seconds for process to exit
-            try:
-                proc.wait(timeout=5)
-            except psutil.TimeoutExpired:
-                # Force kill if graceful termination failed
-                logger.warning(f"Force killing SSH tunnel for pod {self.pod_id}")
-                proc.kill()
-                proc.wait()
+            if wait:
+                try:
+                    proc.wait(timeout=STOP_TIMEOUT)
+                except psutil.TimeoutExpired:
+                    # Force kill if graceful termination failed
+                    logger.warning(f"Force killing SSH tunnel for pod {self.pod_id}")
+                    proc.kill()
+                    proc.wait()
+
+            if self.control_dir is not None:
+                self._cancel_forward()
 
             logger.info(f"SSH tunnel stopped: pod {self.pod_id}")
             self.pid = None
+            self.process = None
+            self._invalidate_active()
             return True
 
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
@@ -334,7 +582,8 @@ class SSHTunnel:
             "local_port": self.local_port,
             "remote_port": self.remote_port,
             "ssh_key_path": self.ssh_key_path,
-            "pid": self.pid
+            "pid": self.pid,
+            "control_dir": str(self.control_dir) if self.control_dir else None
         }
 
     @classmethod
@@ -353,7 +602,8 @@ class SSHTunnel:
             local_port=data["local_port"],
             remote_port=data["remote_port"],
             ssh_key_path=data.get("ssh_key_path"),
-            pid=data.get("pid")
+            pid=data.get("pid"),
+            control_dir=Path(data["control_dir"]) if data.get("control_dir") else None
         )
 
 
@@ -384,41 +634,74 @@ class TunnelManager:
             config_dir: Configuration directory (default: ~/.autopod)
         """
         if config_dir is None:
-            config_dir = Path.home() / ".autopod"
+            config_dir = _default_config_dir()
 
         self.config_dir = config_dir
         self.state_file = config_dir / "tunnels.json"
+        self.control_dir = config_dir / "controlmasters"
+
+        # Ensure config directory exists (it almost always does already)
+        if not self.config_dir.is_dir():
+            self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Bytes last read from or written to state_file (skips no-op saves)
+        self._last_state_bytes: Optional[bytes] = None
+
+        # Set inside batched_save(): _save_state only marks the state dirty
+        self._defer_save = False
+        self._dirty = False
 
         # Load existing tunnels from disk
         self.tunnels: Dict[str, SSHTunnel] = self._load_state()
 
+        # local_port -> pod_id, kept in step with self.tunnels
+        self._port_index: Dict[int, str] = {
+            tunnel.local_port: pod_id for pod_id, tunnel in self.tunnels.items()
+        }
+
         logger.debug(f"TunnelManager initialized with {len(self.tunnels)} tunnels")
 
     def _load_state(self) -> Dict[str, SSHTunnel]:
         """Load tunnel state from disk.
 
-        Reconnects to existing SSH processes if they're still alive.
+        Reconnects to existing SSH processes if they're still alive. The
+        parsed file is cached in-process until it changes on disk.
 
         Returns:
             Dictionary of pod_id -> SSHTunnel
         """
-        if not self.state_file.exists():
+        try:
+            st = os.stat(self.state_file)
+        except FileNotFoundError:
             logger.debug("No existing tunnel state found")
             return {}
 
         try:
-            data = json.loads(self.state_file.read_text())
+            key = (st.st_mtime_ns, st.st_ino, st.st_size)
+            cached = _STATE_CACHE.get(self.state_file)
+            if cached is not None and cached[0] == key:
+                _, raw, data = cached
+            else:
+                raw = self.state_file.read_bytes()
+                data = json.loads(raw)
+                _STATE_CACHE[self.state_file] = (key, raw, data)
+
+            self._last_state_bytes = raw
             tunnels = {}
+            procs = self._snapshot_ssh_procs()
 
             for pod_id, info in data.items():
                 try:
+                    # Skip dead PIDs before SSHTunnel tries to reconnect to
+                    # them; only live tunnels pay for a psutil handle
+                    if info.get("pid") not in procs:
+                        logger.info(f"Removing stale tunnel: {pod_id}")
+                        continue
+
                     tunnel = SSHTunnel.from_dict(info)
 
                     # Only keep tunnel if SSH process is still alive
-                    if tunnel.is_active():
+                    if tunnel.is_active(procs):
                         tunnels[pod_id] = tunnel
                         logger.info(f"Reconnected to tunnel: {pod_id} (PID: {tunnel.pid})")
                     else:
@@ -433,31 +716,122 @@ class TunnelManager:
             logger.error(f"Failed to load tunnel state: {e}")
             return {}
 
-    def _save_state(self) -> None:
+    @classmethod
+    def _snapshot_ssh_procs(cls) -> Dict[int, List[str]]:
+        """Collect the command lines of all running ssh processes in one pass.
+
+        Checking many tunnels against one snapshot replaces a separate
+        pid_exists + Process + cmdline lookup per tunnel.
+
+        Returns:
+            Dictionary of pid -> argv for processes whose argv[0] contains "ssh"
+        """
+        return {
+            p.pid: p.info["cmdline"]
+            for p in psutil.process_iter(["cmdline"])
+            if p.info["cmdline"] and "ssh" in p.info["cmdline"][0]
+        }
+
+    def _active_snapshot(
+        self, procs: Optional[Dict[int, List[str]]] = None
+    ) -> List[Tuple[str, Dict]]:
+        """Serialize the active tunnels in a single pass.
+
+        Calls is_active() once per tunnel, so callers that need both the
+        active set and its serialized form don't walk the tunnels twice.
+
+        Args:
+            procs: Snapshot from _snapshot_ssh_procs() to check against
+                (optional, passed through to is_active())
+
+        Returns:
+            List of (pod_id, tunnel.to_dict()) for active tunnels
+        """
+        return [
+            (pod_id, tunnel.to_dict())
+            for pod_id, tunnel in self.tunnels.items()
+            if tunnel.is_active(procs)
+        ]
+
+    def _save_state(self, active: Optional[List[Tuple[str, Dict]]] = None) -> None:
         """Save tunnel state to disk.
 
-        Only saves tunnels that are currently active.
+        Only saves tunnels that are currently active. The file is written to a
+        temporary path and renamed over tunnels.json, so a crash mid-write
+        never leaves a truncated state file. Nothing is written if the state
+        is unchanged since the last load or save.
+
+        Inside batched_save() the write is postponed until the block exits.
+
+        Args:
+            active: Result of _active_snapshot() if the caller already has
+                one (optional, computed here otherwise)
         """
+        if self._defer_save:
+            self._dirty = True
+            return
+
         try:
             # Only persist active tunnels
-            data = {}
-            for pod_id, tunnel in self.tunnels.items():
-                if tunnel.is_active():
-                    data[pod_id] = tunnel.to_dict()
-
-            self.state_file.write_text(json.dumps(data, indent=2))
+            if active is None:
+                active = self._active_snapshot()
+            data = dict(active)
+
+            # Compact and key-sorted: the file is machine-read, and stable bytes
+            # let the unchanged-state check below skip the write
+            payload = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+            if payload == self._last_state_bytes:
+                logger.debug("Tunnel state unchanged, skipping save")
+                return
+
+            tmp_file = self.state_file.with_suffix(".json.tmp")
+            fd = os.open(tmp_file, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+
+            self._last_state_bytes = payload
+            st = os.stat(self.state_file)
+            _STATE_CACHE[self.state_file] = ((st.st_mtime_ns, st.st_ino, st.st_size), payload, data)
             logger.debug(f"Saved {len(data)} tunnel(s) to {self.state_file}")
 
         except Exception as e:
             logger.error(f"Failed to save tunnel state: {e}")
 
+    @contextlib.contextmanager
+    def batched_save(self) -> Iterator[None]:
+        """Write tunnel state at most once for a block of changes.
+
+        Example:
+            >>> with manager.batched_save():
+            ...     for pod_id in pod_ids:
+            ...         manager.remove_tunnel(pod_id)
+        """
+        if self._defer_save:
+            # Already batching; the outermost block saves
+            yield
+            return
+
+        self._defer_save = True
+        self._dirty = False
+        try:
+            yield
+        finally:
+            self._defer_save = False
+            if self._dirty:
+                self._dirty = False
+                self._save_state()
+
     def create_tunnel(
         self,
         pod_id: str,
         ssh_connection_string: str,
         local_port: int,
         remote_port: int,
-        ssh_key_path: Optional[str] = None
+        ssh_key_path: Optional[str] = None,
+        multiplex: bool = False
     ) -> SSHTunnel:
         """Create a new SSH tunnel.
 
@@ -467,6 +841,8 @@ class TunnelManager:
             local_port: Local port to bind
             remote_port: Remote port to forward
             ssh_key_path: Path to SSH private key (optional)
+            multiplex: Share one SSH connection per host via ControlMaster
+                (default: False)
 
         Returns:
             SSHTunnel instance
@@ -488,15 +864,23 @@ class TunnelManager:
                 f"Choose a different port or stop the existing tunnel."
             )
 
+        control_dir = None
+        if multiplex:
+            control_dir = self.control_dir
+            control_dir.mkdir(mode=0o700, exist_ok=True)
+
         tunnel = SSHTunnel(
             pod_id=pod_id,
             ssh_connection_string=ssh_connection_string,
             local_port=local_port,
             remote_port=remote_port,
-            ssh_key_path=ssh_key_path
+            ssh_key_path=ssh_key_path,
+            control_dir=control_dir
         )
 
+        self._remove_tunnel_nosave(pod_id)
         self.tunnels[pod_id] = tunnel
+        self._port_index[local_port] = pod_id
         return tunnel
 
     def get_tunnel(self, pod_id: str) -> Optional[SSHTunnel]:
@@ -529,31 +913,48 @@ class TunnelManager:
         Returns:
             True if tunnel was removed, False if not found
         """
-        if pod_id in self.tunnels:
-            del self.tunnels[pod_id]
+        if self._remove_tunnel_nosave(pod_id):
             self._save_state()
             logger.info(f"Removed tunnel: {pod_id}")
             return True
         return False
 
+    def _remove_tunnel_nosave(self, pod_id: str) -> bool:
+        """Remove tunnel from tracking without writing state to disk.
+
+        Args:
+            pod_id: Pod identifier
+
+        Returns:
+            True if tunnel was removed, False if not found
+        """
+        if self.tunnels.pop(pod_id, None) is None:
+            return False
+
+        # A pod has at most one entry; removals are rare next to lookups
+        for port, owner in self._port_index.items():
+            if owner == pod_id:
+                del self._port_index[port]
+                break
+        return True
+
     def cleanup_stale_tunnels(self) -> int:
         """Remove tunnels for dead SSH processes.
 
         Returns:
             Number of stale tunnels removed
         """
-        stale_pods = []
-
-        for pod_id, tunnel in self.tunnels.items():
-            if not tunnel.is_active():
-                stale_pods.append(pod_id)
+        # One pass decides liveness and serializes the survivors for the save
+        active = self._active_snapshot(self._snapshot_ssh_procs())
+        active_pods = {pod_id for pod_id, _ in active}
+        stale_pods = [pod_id for pod_id in self.tunnels if pod_id not in active_pods]
 
         for pod_id in stale_pods:
-            self.remove_tunnel(pod_id)
+            self._remove_tunnel_nosave(pod_id)
             logger.info(f"Cleaned up stale tunnel: {pod_id}")
 
         if stale_pods:
-            self._save_state()
+            self._save_state(active)
 
         return len(stale_pods)
 
@@ -563,19 +964,72 @@ class TunnelManager:
         Returns:
             Number of tunnels stopped
         """
-        stopped = 0
-
+        # Send SIGTERM to every tunnel first, then wait for all of them
+        # together, so N tunnels take one grace period rather than N
+        procs = []
         for tunnel in self.tunnels.values():
             if tunnel.is_active():
-                if tunnel.stop():
-                    stopped += 1
+                # stop() drops the handle, so take it first
+                proc = tunnel._get_process()
+                if tunnel.stop(wait=False):
+                    procs.append(proc)
+
+        _, alive = psutil.wait_procs(procs, timeout=STOP_TIMEOUT)
+        for proc in alive:
+            # Force kill if graceful termination failed
+            logger.warning(f"Force killing SSH tunnel (PID: {proc.pid})")
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+        if alive:
+            psutil.wait_procs(alive)
+
+        stopped = len(procs)
 
         # Clean up state
         self.tunnels.clear()
+        self._port_index.clear()
         self._save_state()
 
         return stopped
 
+    def close_control_masters(self) -> int:
+        """Shut down all ControlMaster connections opened for tunnels.
+
+        Masters otherwise linger for autopod.ssh.CONTROL_PERSIST after their
+        last client.
+
+        Returns:
+            Number of master connections closed
+        """
+        if not self.control_dir.is_dir():
+            return 0
+
+        closed = 0
+        for control_path in self.control_dir.iterdir():
+            if not control_path.is_socket():
+                continue
+
+            # ControlPath is literal here, so the host argument is unused
+            try:
+                result = subprocess.run(
+                    [_SSH_PATH or "ssh", "-o", f"ControlPath={control_path}", "-O", "exit", "autopod"],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Could not close control master {control_path}: {e}")
+                continue
+
+            if result.returncode == 0:
+                closed += 1
+
+        logger.debug(f"Closed {closed} control master connection(s)")
+        return closed
+
     def _is_port_in_use(self, port: int) -> bool:
         """Check if a local port is already in use by any tunnel.
 
@@ -585,7 +1039,9 @@ class TunnelManager:
         Returns:
             True if port is in use, False otherwise
         """
-        for tunnel in self.tunnels.values():
-            if tunnel.local_port == port and tunnel.is_active():
-                return True
-        return False
+        pod_id = self._port_index.get(port)
+        if pod_id is None:
+            return False
+
+        tunnel = self.tunnels.get(pod_id)
+        return tunnel is not None and tunnel.is_active()
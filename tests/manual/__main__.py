@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Run the provider and PodManager integration suites back to back.
+
+Usage (from the repository root, after ``pip install -e .``):
+    python tests/manual
+
+Both suites share one interpreter, so Rich and the autopod provider stack
+are imported once, and one start prompt covers both runs.
+Total expected cost: < $0.04
+"""
+
+from _common import console, wait_for_start
+
+import test_pod_manager_integration
+import test_runpod_integration
+
+
+if __name__ == "__main__":
+    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds (Enter to start now)...[/bold]")
+    try:
+        wait_for_start()
+        test_runpod_integration.main()
+        test_pod_manager_integration.main()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Test cancelled by user[/yellow]")
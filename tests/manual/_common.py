@@ -0,0 +1,634 @@
+"""Shared console, test harness and autopod CLI helpers for the manual tests.
+
+The scripts import autopod directly, so install it first with
+``pip install -e .`` from the repository root.
+"""
+
+import functools
+import json
+import os
+import random
+import re
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.table import Table
+
+from autopod.logging import get_logger
+
+console = Console()
+logger = get_logger("manual")
+
+# Result cells for the summary table
+_PASS = "[green]✓ PASS[/green]"
+_FAIL = "[red]✗ FAIL[/red]"
+
+# Output is decoded as UTF-8 rather than the locale encoding, so make the
+# child write UTF-8 too (Rich prints ✓/✗ glyphs)
+_CHILD_ENV = {**os.environ, "PYTHONIOENCODING": "utf-8"}
+
+# Append-only log of pods created by the suites, replayed on the next run so
+# a pod left running (see AUTOPOD_KEEP_TEST_POD) is reused instead of
+# paying for a fresh create
+_CHECKPOINT_FILE = Path.home() / ".autopod" / "test_state.jsonl"
+
+# Set to keep the test pod running when a suite fails, for the next run
+KEEP_TEST_POD = os.getenv("AUTOPOD_KEEP_TEST_POD", "").lower() in ("1", "true", "yes")
+
+# Host keys accepted by the SSH scripts' own ssh commands, kept apart from
+# ~/.ssh/known_hosts so ephemeral pod endpoints don't pile up there
+_KNOWN_HOSTS_FILE = Path.home() / ".autopod" / "test_known_hosts"
+
+# Set by CI runners; nobody is there to cancel, so skip the start prompt
+CI = os.getenv("CI", "").lower() in ("1", "true", "yes")
+
+# Set by a parent harness that has already confirmed the run
+NONINTERACTIVE = os.getenv("AUTOPOD_NONINTERACTIVE", "").lower() in ("1", "true", "yes")
+
+# Pattern: "Pod created successfully: <pod-id>"
+# or "Pod created: <pod-id>"
+_POD_ID_PATTERNS = tuple(re.compile(p) for p in (
+    r"Pod created successfully:\s*(\S+)",
+    r"Pod created:\s*(\S+)",
+    r"✓ Pod created.*:\s*(\S+)",
+))
+
+
+def run_cli_command(args, input_text=None, capture_output=True, timeout=120):
+    """Run autopod CLI command.
+
+    Args:
+        args: List of command arguments (e.g., ['connect', '--gpu', 'RTX A5000'])
+        input_text: Optional input for interactive prompts
+        capture_output: Whether to capture output
+        timeout: Command timeout in seconds
+
+    Returns:
+        subprocess.CompletedProcess result
+    """
+    cmd = [sys.executable, "-m", "autopod"] + args
+
+    console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
+
+    result = subprocess.run(
+        cmd,
+        input=input_text,
+        capture_output=capture_output,
+        encoding="utf-8",
+        errors="replace",
+        env=_CHILD_ENV,
+        timeout=timeout
+    )
+
+    return result
+
+
+def wait_for_start(timeout=3.0):
+    """Give the user a window to cancel before a script starts.
+
+    Waits on stdin rather than sleeping, so pressing Enter starts the run
+    immediately while Ctrl+C still cancels it. Returns at once under CI,
+    with AUTOPOD_NONINTERACTIVE set, or when stdin is not a terminal.
+
+    Args:
+        timeout: Seconds to wait before starting anyway
+    """
+    if CI or NONINTERACTIVE or not sys.stdin.isatty():
+        return
+    if select.select([sys.stdin], [], [], timeout)[0]:
+        sys.stdin.readline()
+
+
+def wait_until(predicate, timeout=10, interval=0.3, factor=1.0, max_interval=5.0):
+    """Poll predicate until it returns True or the timeout elapses.
+
+    Used instead of fixed sleeps so a check finishes as soon as the
+    observable state changes. The predicate is always called at least once.
+    With factor > 1 the pause grows after each miss (exponential backoff),
+    so a short first interval catches fast transitions without hammering
+    the API on slow ones.
+
+    Args:
+        predicate: Zero-argument callable returning a truthy value when done
+        timeout: Maximum time to wait in seconds
+        interval: Pause after the first miss in seconds
+        factor: Multiplier applied to the pause after each miss
+        max_interval: Upper bound on the pause in seconds
+
+    Returns:
+        True if the predicate succeeded within the timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    delay = interval
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, max_interval)
+
+
+def with_retry(func, attempts=5, base=0.5, max_delay=8.0):
+    """Wrap a provider call so transient API errors are retried.
+
+    Failed calls are retried after base * 2**n seconds plus up to 0.25s of
+    jitter, capped at max_delay. The SDK does not expose response headers,
+    so Retry-After cannot be honoured; the backoff alone keeps retries
+    under the rate limit. "not found" errors are final and re-raised at
+    once, since the termination checks poll for them.
+
+    Args:
+        func: Provider method to wrap
+        attempts: Total number of calls before giving up
+        base: Delay before the first retry in seconds
+        max_delay: Upper bound on any single delay in seconds
+
+    Returns:
+        Wrapped callable with the same signature
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(attempts):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if "not found" in str(e).lower() or attempt == attempts - 1:
+                    raise
+                delay = min(base * 2 ** attempt + random.uniform(0, 0.25), max_delay)
+                logger.warning("%s failed (%s), retrying in %.1fs", func.__name__, e, delay)
+                time.sleep(delay)
+    return wrapper
+
+
+def retry_provider_calls(provider):
+    """Retry transient failures of the provider's pod status lookups.
+
+    The wrapper is set on the instance, so a PodManager sharing the
+    provider retries too. Only get_pod_status() raises on failure:
+    stop_pod() and terminate_pod() catch every error and return False, so
+    there is nothing for with_retry() to act on, and a False can't be told
+    apart from a pod that is already gone. create_pod() is left alone: a
+    retry after a timed-out but successful create would leave a second,
+    billed pod.
+
+    Args:
+        provider: Provider instance to patch in place
+
+    Returns:
+        The same provider, for chaining
+    """
+    provider.get_pod_status = with_retry(provider.get_pod_status)
+    return provider
+
+
+def wait_for_ssh(provider, pod_id, timeout=180, base=1.0, max_delay=8.0, show_progress=True):
+    """Poll for the pod's SSH connection string with a progress bar.
+
+    Retries while the provider reports SSH as not available, backing off
+    exponentially (1s, 2s, 4s, ... capped at max_delay) with +/-20% jitter,
+    so a fast boot is caught within a second or two and slow ones cost
+    few API calls. The bar tracks elapsed time against the timeout.
+
+    Args:
+        provider: Provider with get_ssh_connection_string()
+        pod_id: Pod to wait for
+        timeout: Overall budget in seconds
+        base: Delay after the first miss in seconds
+        max_delay: Upper bound on any single delay in seconds
+        show_progress: Render the progress bar; Rich allows only one live
+            display at a time, so pass False when waiting on several pods.
+            When output is not a terminal, a dot per attempt is written to
+            stderr instead
+
+    Returns:
+        Tuple of (connection string, seconds waited)
+
+    Raises:
+        RuntimeError: If SSH is not available within the timeout, or the
+            provider fails with any other error
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+
+    # Redirected output gets plain dots rather than repainted bar frames
+    dots = show_progress and not console.is_terminal
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        console=console,
+        disable=not show_progress or dots
+    ) as progress:
+        task = progress.add_task("[cyan]Waiting for SSH...", total=timeout)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if dots:
+                print(".", end="", file=sys.stderr, flush=True)
+            progress.update(
+                task,
+                completed=time.monotonic() - start,
+                description=f"[cyan]Checking SSH (attempt {attempt})..."
+            )
+            try:
+                conn_str = provider.get_ssh_connection_string(pod_id)
+            except RuntimeError as e:
+                if "not available" not in str(e):
+                    if dots:
+                        print(file=sys.stderr)
+                    progress.update(task, description="[red]✗ SSH check failed")
+                    raise
+            else:
+                if dots:
+                    print(file=sys.stderr)
+                progress.update(task, completed=timeout, description="[green]✓ SSH Available!")
+                return conn_str, time.monotonic() - start
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if dots:
+                    print(file=sys.stderr)
+                progress.update(task, description="[red]✗ SSH timeout")
+                raise RuntimeError(f"SSH not available after {timeout}s")
+
+            delay = min(max_delay, base * 2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+            progress.update(
+                task,
+                description=f"[yellow]Container initializing... (attempt {attempt})"
+            )
+            time.sleep(min(delay, remaining))
+
+
+def known_hosts_options(max_entries=1000):
+    """Build ssh options that use the manual tests' own known_hosts file.
+
+    Entries are stored unhashed, so OpenSSH can match them directly, and
+    the file is emptied once it grows past max_entries.
+
+    Args:
+        max_entries: Entry count at which the file is truncated
+
+    Returns:
+        List of ssh command-line arguments
+    """
+    try:
+        with open(_KNOWN_HOSTS_FILE) as f:
+            entries = sum(1 for _ in f)
+        if entries > max_entries:
+            _KNOWN_HOSTS_FILE.write_text("")
+    except FileNotFoundError:
+        _KNOWN_HOSTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+    return [
+        "-o", f"UserKnownHostsFile={_KNOWN_HOSTS_FILE}",
+        "-o", "GlobalKnownHostsFile=/dev/null",
+        "-o", "HashKnownHosts=no",
+    ]
+
+
+def key_in_agent(ssh_key_path):
+    """Check whether ssh-agent already holds the key.
+
+    Args:
+        ssh_key_path: Private key path
+
+    Returns:
+        True if the key's fingerprint is listed by ``ssh-add -l``
+    """
+    try:
+        fingerprint = subprocess.run(
+            ["ssh-keygen", "-lf", os.path.expanduser(ssh_key_path)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()[1]
+    except (subprocess.CalledProcessError, IndexError):
+        return False
+
+    # Exit code 1 means no identities, 2 means no agent
+    listed = subprocess.run(["ssh-add", "-l"], capture_output=True, text=True)
+    return listed.returncode == 0 and fingerprint in listed.stdout
+
+
+def ssh_preflight(ssh_key_path):
+    """Exit early if SSH to a pod could not work with this key.
+
+    Checks that the key exists and is usable without a prompt: either it
+    has no passphrase or ssh-agent already holds it. Run this before
+    creating a pod, so a misconfiguration costs nothing.
+
+    Args:
+        ssh_key_path: Private key path from the config
+
+    Raises:
+        SystemExit: If the key is missing or needs a passphrase that no
+            agent can supply
+    """
+    path = os.path.expanduser(ssh_key_path or "")
+    if not ssh_key_path or not os.path.isfile(path):
+        console.print(f"[red]✗ SSH key not found: {ssh_key_path or '(not configured)'}[/red]")
+        raise SystemExit(1)
+
+    # Deriving the public key with an empty passphrase fails on protected keys
+    unprotected = subprocess.run(
+        ["ssh-keygen", "-y", "-P", "", "-f", path],
+        capture_output=True
+    ).returncode == 0
+    if not unprotected and not key_in_agent(ssh_key_path):
+        console.print(f"[red]✗ SSH key {ssh_key_path} has a passphrase and is not in ssh-agent[/red]")
+        console.print(f"[dim]Run: ssh-add {ssh_key_path}[/dim]")
+        raise SystemExit(1)
+
+
+def run_ssh(cmd, input_text=None, timeout=15):
+    """Run an ssh command in its own session, killing the whole session on timeout.
+
+    subprocess.run(timeout=...) only kills ssh itself; anything it spawned
+    (a ControlMaster it forked, a ProxyCommand) would be left behind.
+
+    Args:
+        cmd: ssh command and arguments
+        input_text: Text fed to the command's stdin
+        timeout: Seconds before the session is killed
+
+    Returns:
+        subprocess.CompletedProcess with text stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command did not finish in time
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True
+    )
+    try:
+        stdout, stderr = proc.communicate(input_text, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        proc.communicate()
+        raise
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def stream_cli_command(args, timeout=120):
+    """Run autopod CLI command, echoing its output as it arrives.
+
+    stdout and stderr are merged and read line by line, so a long-running
+    command like ``connect`` cannot stall on a full pipe buffer and its
+    progress is visible while it runs. The pod ID is picked out of the
+    stream as soon as it appears.
+
+    Args:
+        args: List of command arguments
+        timeout: Command timeout in seconds
+
+    Returns:
+        Tuple of (return code, pod ID or None, combined output)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command outlives the timeout
+    """
+    cmd = [sys.executable, "-m", "autopod"] + args
+
+    console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+        errors="replace",
+        env=_CHILD_ENV,
+        bufsize=1
+    )
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+
+    pod_id = None
+    lines = []
+    try:
+        for line in proc.stdout:
+            console.out(line, end="", highlight=False)
+            lines.append(line)
+            if pod_id is None:
+                pod_id = extract_pod_id_from_output(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    output = "".join(lines)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+
+    return returncode, pod_id, output
+
+
+def extract_pod_id_from_output(output):
+    """Extract pod ID from CLI output.
+
+    Looks for patterns like "Pod created successfully: <pod-id>"
+
+    Args:
+        output: CLI stdout or stderr text
+
+    Returns:
+        Pod ID string or None if not found
+    """
+    for pattern in _POD_ID_PATTERNS:
+        match = pattern.search(output)
+        if match:
+            return match.group(1)
+
+    return None
+
+
+def test_method(method_name: str, test_func):
+    """Wrapper to test a method and report results."""
+    console.print(f"\n[cyan]Testing: {method_name}[/cyan]")
+    try:
+        result = test_func()
+        console.print(f"[green]✓ {method_name} - PASSED[/green]")
+        return True, result
+    except Exception as e:
+        # Traceback goes to the handlers installed by setup_logging()
+        logger.exception("%s failed", method_name)
+        console.print(f"[red]✗ {method_name} - FAILED: {e}[/red]")
+        return False, None
+
+
+def _load_checkpoints():
+    """Read the checkpoint records, skipping any torn trailing line."""
+    try:
+        lines = _CHECKPOINT_FILE.read_text().splitlines()
+    except FileNotFoundError:
+        return []
+
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def print_summary(title: str, results: dict, success_detail: str = None):
+    """Print the pass/fail table and totals for a test run.
+
+    Args:
+        title: Heading printed above the table
+        results: Test name -> passed (bool), in display order
+        success_detail: Optional extra line shown when every test passed
+    """
+    console.print("\n" + "="*60)
+    console.print(f"[bold cyan]{title}[/bold cyan]")
+    console.print("="*60 + "\n")
+
+    table = Table(title="Test Results")
+    table.add_column("Test", style="cyan")
+    table.add_column("Result", justify="center")
+
+    for test_name, passed in results.items():
+        table.add_row(test_name, _PASS if passed else _FAIL)
+
+    console.print(table)
+
+    total = len(results)
+    passed = sum(results.values())  # results are bools
+    console.print(f"\n[bold]Passed: {passed}/{total}[/bold]")
+
+    if passed == total:
+        console.print("\n[bold green]✓ ALL TESTS PASSED[/bold green]")
+        if success_detail:
+            console.print(f"[dim]{success_detail}[/dim]")
+    else:
+        console.print(f"\n[bold yellow]⚠️  {total - passed} test(s) failed[/bold yellow]")
+
+    console.print(f"\n[dim]Full logs: ~/.autopod/logs/autopod.log[/dim]")
+
+
+class SuiteRun:
+    """Results and cleanup hooks collected while a suite() block runs."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.results = {}
+        self._cleanups = []
+
+    def checkpoint(self, test: str, pod_id: str):
+        """Record that test passed with pod_id, for resume_pod() to replay."""
+        record = {"suite": self.name, "test": test, "pod_id": pod_id, "ts": time.time()}
+        _CHECKPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_CHECKPOINT_FILE, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def resume_pod(self, provider, max_age: float = 3600):
+        """Return the pod checkpointed by an earlier run if still RUNNING.
+
+        Args:
+            provider: Provider used to check the pod's status
+            max_age: Ignore checkpoints older than this many seconds
+
+        Returns:
+            Pod ID to reuse, or None to create a new pod
+        """
+        pod_id = None
+        for record in _load_checkpoints():
+            if record.get("suite") != self.name or not record.get("pod_id"):
+                continue
+            if time.time() - record.get("ts", 0) < max_age:
+                pod_id = record["pod_id"]
+        if not pod_id:
+            return None
+
+        try:
+            status = provider.get_pod_status(pod_id, force=True)
+        except Exception as e:
+            logger.info("Checkpointed pod %s not reusable: %s", pod_id, e)
+            return None
+        if status["status"] != "RUNNING":
+            return None
+
+        console.print(f"\n[dim]Reusing pod {pod_id} from the previous run[/dim]")
+        return pod_id
+
+    def clear_checkpoint(self):
+        """Drop this suite's checkpoints once its pod is gone."""
+        others = [r for r in _load_checkpoints() if r.get("suite") != self.name]
+        if _CHECKPOINT_FILE.exists():
+            _CHECKPOINT_FILE.write_text("".join(json.dumps(r) + "\n" for r in others))
+
+    def on_cleanup(self, func):
+        """Register func to run when the suite ends, even after an error.
+
+        Usable as a decorator; hooks run in reverse registration order.
+        """
+        self._cleanups.append(func)
+        return func
+
+
+@contextmanager
+def suite(name: str, description: str, expected_cost: str = "< $0.02", success_detail: str = None):
+    """Run a manual test suite with the shared banner, cleanup and summary.
+
+    Unexpected errors inside the block are reported rather than raised, so
+    cleanup hooks and the summary always run. KeyboardInterrupt still
+    propagates after cleanup.
+
+    Args:
+        name: Suite name, e.g. "PodManager Integration"
+        description: One-line description shown in the banner
+        expected_cost: Cost estimate shown in the banner
+        success_detail: Extra line printed when every test passed
+
+    Yields:
+        SuiteRun holding the results dict and cleanup registration
+    """
+    console.print(Panel.fit(
+        f"[bold yellow]⚠️  {name} Test - REAL API CALLS[/bold yellow]\n"
+        f"[dim]{description}[/dim]\n"
+        f"[dim]Expected cost: {expected_cost}[/dim]",
+        border_style="yellow"
+    ))
+
+    run = SuiteRun(name)
+    try:
+        yield run
+    except Exception as e:
+        console.print(f"\n[bold red]Unexpected error:[/bold red]")
+        console.print(f"[red]{e}[/red]")
+        console.print(traceback.format_exc())
+    finally:
+        for cleanup in reversed(run._cleanups):
+            cleanup()
+
+    print_summary(f"{name} Test Results", run.results, success_detail)
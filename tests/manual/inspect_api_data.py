@@ -4,11 +4,7 @@
 This shows exactly what data RunPod returns for GPUs, pods, etc.
 """
 
-import sys
 import json
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from rich.console import Console
 from rich.panel import Panel
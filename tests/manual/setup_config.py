@@ -7,9 +7,6 @@ This bypasses the interactive prompts for use in non-interactive environments.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from autopod.config import save_config, get_default_config
 
 # Edit these values:
@@ -13,80 +13,21 @@ Expected cost: < $0.02
 Runtime: ~2-3 minutes
 """
 
-import sys
+import shlex
 import time
 import subprocess
-from pathlib import Path
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
 
-console = Console()
+from _common import console, print_summary, run_cli_command, stream_cli_command, wait_for_start, wait_until
 
 # Secret message to verify SSH execution
 SECRET_MESSAGE = "AUTOPOD_SECRET_42_TEST_PASSED"
 
 
-def run_cli_command(args, input_text=None, capture_output=True, timeout=120):
-    """Run autopod CLI command.
-
-    Args:
-        args: List of command arguments (e.g., ['connect', '--gpu', 'RTX A5000'])
-        input_text: Optional input for interactive prompts
-        capture_output: Whether to capture output
-        timeout: Command timeout in seconds
-
-    Returns:
-        subprocess.CompletedProcess result
-    """
-    cmd = ["autopod"] + args
-
-    console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-
-    result = subprocess.run(
-        cmd,
-        input=input_text,
-        capture_output=capture_output,
-        text=True,
-        timeout=timeout
-    )
-
-    return result
-
-
-def extract_pod_id_from_output(output):
-    """Extract pod ID from CLI output.
-
-    Looks for patterns like "Pod created successfully: <pod-id>"
-
-    Args:
-        output: CLI stdout or stderr text
-
-    Returns:
-        Pod ID string or None if not found
-    """
-    import re
-
-    # Pattern: "Pod created successfully: <pod-id>"
-    # or "Pod created: <pod-id>"
-    patterns = [
-        r"Pod created successfully:\s*(\S+)",
-        r"Pod created:\s*(\S+)",
-        r"✓ Pod created.*:\s*(\S+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, output)
-        if match:
-            return match.group(1)
-
-    return None
-
-
 def main():
     """Run comprehensive CLI integration test."""
     console.print(Panel.fit(
@@ -104,87 +45,86 @@ def main():
         console.print("\n[bold cyan]Test 1: Create pod via CLI[/bold cyan]")
         console.print("[yellow]Running: autopod connect --gpu 'RTX A5000'[/yellow]")
 
-        result = run_cli_command([
+        # Streamed rather than captured: connect runs for minutes and the
+        # pod ID can be picked out of its output as it arrives
+        returncode, pod_id, _ = stream_cli_command([
             "connect",
             "--gpu", "RTX A5000",
             "--gpu-count", "1",
             "--disk-size", "10"
         ], timeout=180)
 
-        if result.returncode != 0:
+        if returncode != 0:
             console.print(f"[red]✗ Failed to create pod[/red]")
-            console.print(f"stdout: {result.stdout}")
-            console.print(f"stderr: {result.stderr}")
             test_results["create_pod"] = False
             return
 
-        # Extract pod ID from output
-        pod_id = extract_pod_id_from_output(result.stdout + result.stderr)
-
         if not pod_id:
             console.print(f"[red]✗ Could not extract pod ID from output[/red]")
-            console.print(f"Output: {result.stdout}")
             test_results["create_pod"] = False
             return
 
         console.print(f"[green]✓ Pod created: {pod_id}[/green]")
         test_results["create_pod"] = True
 
-        # ===== TEST 2: List pods =====
-        console.print("\n[bold cyan]Test 2: List pods[/bold cyan]")
-        console.print("[yellow]Running: autopod list[/yellow]")
-
-        time.sleep(2)  # Brief pause
-        result = run_cli_command(["list"])
+        # Tests 2 and 3 are independent reads on the same pod: start the SSH
+        # wait in the background and list pods while it runs.
+        # A single long-lived CLI invocation polls internally with backoff
+        # and exits as soon as SSH is ready
+        max_wait = 120
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            wait_future = executor.submit(
+                run_cli_command, ["wait-ssh", pod_id, "--timeout", str(max_wait)], timeout=max_wait + 10
+            )
+
+            # ===== TEST 2: List pods =====
+            console.print("\n[bold cyan]Test 2: List pods[/bold cyan]")
+            console.print("[yellow]Running: autopod list[/yellow]")
+
+            # Re-list until the new pod shows up rather than sleeping first
+            def pod_listed():
+                result = run_cli_command(["list"])
+                return result.returncode == 0 and pod_id in result.stdout
+
+            if wait_until(pod_listed, timeout=10, interval=1.0):
+                console.print(f"[green]✓ Pod {pod_id} found in list[/green]")
+                test_results["list_pods"] = True
+            else:
+                console.print(f"[yellow]⚠ Pod not found in list (may not be ready)[/yellow]")
+                test_results["list_pods"] = False
+
+            # ===== TEST 3: Wait for SSH ready =====
+            console.print("\n[bold cyan]Test 3: Wait for SSH ready[/bold cyan]")
+            console.print("[yellow]Waiting for SSH to become available...[/yellow]")
+
+            result = wait_future.result()
+            ssh_ready = result.returncode == 0
 
-        if result.returncode != 0:
-            console.print(f"[red]✗ List command failed[/red]")
-            test_results["list_pods"] = False
-        elif pod_id in result.stdout:
-            console.print(f"[green]✓ Pod {pod_id} found in list[/green]")
-            test_results["list_pods"] = True
+        if ssh_ready:
+            console.print(f"[green]✓ SSH ready after {time.monotonic() - start:.0f} seconds[/green]")
         else:
-            console.print(f"[yellow]⚠ Pod not found in list (may not be ready)[/yellow]")
-            test_results["list_pods"] = False
-
-        # ===== TEST 3: Wait for SSH ready =====
-        console.print("\n[bold cyan]Test 3: Wait for SSH ready[/bold cyan]")
-        console.print("[yellow]Waiting for SSH to become available...[/yellow]")
-
-        max_attempts = 24  # 24 * 5 = 120 seconds
-        ssh_ready = False
-
-        for attempt in range(1, max_attempts + 1):
-            console.print(f"[dim]Attempt {attempt}/{max_attempts}[/dim]")
-
-            result = run_cli_command(["info", pod_id])
-
-            if result.returncode == 0 and "SSH" in result.stdout and "Ready" in result.stdout:
-                console.print(f"[green]✓ SSH ready after {attempt * 5} seconds[/green]")
-                ssh_ready = True
-                test_results["wait_ssh"] = True
-                break
-
-            time.sleep(5)
-
-        if not ssh_ready:
-            console.print(f"[red]✗ SSH not ready after {max_attempts * 5} seconds[/red]")
-            test_results["wait_ssh"] = False
+            console.print(f"[red]✗ SSH not ready after {max_wait} seconds[/red]")
             # Continue anyway to test other commands
-
-        # Give SSH a few extra seconds to fully initialize
-        if ssh_ready:
-            console.print("[dim]Waiting 5 extra seconds for SSH to fully initialize...[/dim]")
-            time.sleep(5)
+        test_results["wait_ssh"] = ssh_ready
 
         # ===== TEST 4: Execute command via SSH =====
         console.print("\n[bold cyan]Test 4: Execute command via SSH[/bold cyan]")
         console.print(f"[yellow]Running: autopod ssh {pod_id} -c \"echo {SECRET_MESSAGE}\"[/yellow]")
 
-        result = run_cli_command([
-            "ssh", pod_id,
-            "-c", f"echo {SECRET_MESSAGE}"
-        ], timeout=30)
+        # sshd can lag the ready flag by a few seconds; retry until it
+        # answers instead of always sleeping before the first attempt
+        ssh_attempts = []
+
+        def secret_echoed():
+            ssh_attempts.append(run_cli_command([
+                "ssh", pod_id,
+                "-c", f"echo {shlex.quote(SECRET_MESSAGE)}"
+            ], timeout=30))
+            return ssh_attempts[-1].returncode == 0 and SECRET_MESSAGE in ssh_attempts[-1].stdout
+
+        wait_until(secret_echoed, timeout=15 if ssh_ready else 0, interval=1.0)
+        result = ssh_attempts[-1]
 
         if result.returncode != 0:
             console.print(f"[red]✗ SSH command failed (exit code {result.returncode})[/red]")
@@ -226,6 +166,7 @@ def main():
         console.print(f"[yellow]Running: autopod kill {pod_id} -y[/yellow]")
 
         result = run_cli_command(["kill", pod_id, "-y"])
+        killed_pod_id = pod_id
 
         if result.returncode != 0:
             console.print(f"[red]✗ Terminate command failed[/red]")
@@ -237,11 +178,12 @@ def main():
 
         # ===== TEST 7: Verify pod removed from list =====
         console.print("\n[bold cyan]Test 7: Verify pod removed[/bold cyan]")
-        time.sleep(3)
 
-        result = run_cli_command(["list"])
+        def pod_unlisted():
+            result = run_cli_command(["list"])
+            return result.returncode == 0 and killed_pod_id not in result.stdout
 
-        if result.returncode == 0 and (pod_id is None or pod_id not in result.stdout):
+        if wait_until(pod_unlisted, timeout=10, interval=1.0):
             console.print(f"[green]✓ Pod removed from list[/green]")
             test_results["verify_removed"] = True
         else:
@@ -255,7 +197,6 @@ def main():
     except Exception as e:
         console.print(f"\n[bold red]✗ Unexpected error:[/bold red]")
         console.print(f"[red]{e}[/red]")
-        import traceback
         console.print(traceback.format_exc())
     finally:
         # Cleanup: Make sure pod is terminated
@@ -268,39 +209,16 @@ def main():
                 console.print("[dim]Error during cleanup (pod may already be terminated)[/dim]")
 
     # ===== RESULTS SUMMARY =====
-    console.print("\n" + "="*60)
-    console.print("[bold cyan]CLI Integration Test Results[/bold cyan]")
-    console.print("="*60 + "\n")
-
-    from rich.table import Table
-    table = Table(title="Test Results")
-    table.add_column("Test", style="cyan")
-    table.add_column("Result", justify="center")
-
-    for test_name, passed in test_results.items():
-        result_str = "[green]✓ PASS[/green]" if passed else "[red]✗ FAIL[/red]"
-        table.add_row(test_name.replace("_", " ").title(), result_str)
-
-    console.print(table)
-
-    total = len(test_results)
-    passed = sum(1 for r in test_results.values() if r)
-
-    console.print(f"\n[bold]Passed: {passed}/{total}[/bold]")
-
-    if passed == total:
-        console.print("\n[bold green]✓ ALL CLI TESTS PASSED[/bold green]")
-        console.print("[dim]autopod CLI is fully operational![/dim]")
-    else:
-        console.print(f"\n[bold yellow]⚠️  {total - passed} test(s) failed[/bold yellow]")
-
-    console.print(f"\n[dim]Full logs: ~/.autopod/logs/autopod.log[/dim]")
-
+    print_summary(
+        "CLI Integration Test Results",
+        {test_name.replace("_", " ").title(): passed for test_name, passed in test_results.items()},
+        "autopod CLI is fully operational!",
+    )
 
 if __name__ == "__main__":
-    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds...[/bold]")
+    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds (Enter to start now)...[/bold]")
     try:
-        time.sleep(3)
+        wait_for_start()
         main()
     except KeyboardInterrupt:
         console.print("\n[yellow]Test cancelled by user[/yellow]")
@@ -8,13 +8,8 @@ Usage:
     python tests/manual/test_pod_creation.py
 """
 
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Confirm
@@ -22,18 +17,16 @@ from autopod.config import load_config
 from autopod.providers import RunPodProvider
 from autopod.logging import setup_logging
 
-console = Console()
+from _common import console
+
 logger = setup_logging()
 
 
-def run_authentication_test():
+def run_authentication_test(api_key: str):
     """Test RunPod authentication."""
     console.print("\n[bold cyan]1. Testing Authentication[/bold cyan]")
 
     try:
-        config = load_config()
-        api_key = config["providers"]["runpod"]["api_key"]
-
         provider = RunPodProvider(api_key=api_key)
 
         if provider.authenticate(api_key):
@@ -43,17 +36,17 @@ def run_authentication_test():
             console.print("[red]✗ Authentication failed[/red]")
             return None
 
-    except FileNotFoundError as e:
-        console.print(f"[red]✗ Config not found: {e}[/red]")
-        console.print("\n[yellow]Run 'python -c \"from autopod.config import config_init_wizard; config_init_wizard()\"' to set up your config[/yellow]")
-        return None
     except Exception as e:
         console.print(f"[red]✗ Error: {e}[/red]")
         return None
 
 
-def run_gpu_availability_test(provider: RunPodProvider):
-    """Test GPU availability checking."""
+def run_gpu_availability_test(provider: RunPodProvider) -> dict:
+    """Test GPU availability checking.
+
+    Returns:
+        Availability info keyed by GPU type, for reuse by later tests
+    """
     console.print("\n[bold cyan]2. Testing GPU Availability[/bold cyan]")
 
     # GPU types to test
@@ -68,8 +61,13 @@ def run_gpu_availability_test(provider: RunPodProvider):
     table.add_column("Spot", justify="right", style="magenta")
     table.add_column("Max GPUs", justify="center", style="dim")
 
+    # Each lookup is an independent API round-trip; fetch them concurrently
+    # and build the table in the original order once all have returned
+    with ThreadPoolExecutor(max_workers=len(gpu_types)) as executor:
+        results = dict(zip(gpu_types, executor.map(provider.get_gpu_availability, gpu_types)))
+
     for gpu_type in gpu_types:
-        info = provider.get_gpu_availability(gpu_type)
+        info = results[gpu_type]
 
         if info["available"]:
             vram = f"{info['memory_gb']} GB"
@@ -88,9 +86,18 @@ def run_gpu_availability_test(provider: RunPodProvider):
 
     console.print(table)
 
+    return results
+
+
+def run_pod_creation_test(provider: RunPodProvider, config: dict, availability: dict):
+    """Test pod creation (with confirmation).
 
-def run_pod_creation_test(provider: RunPodProvider, config: dict):
-    """Test pod creation (with confirmation)."""
+    Args:
+        provider: Authenticated provider
+        config: Loaded autopod config
+        availability: GPU availability already fetched by
+            run_gpu_availability_test; only GPUs missing from it are queried
+    """
     console.print("\n[bold cyan]3. Test Pod Creation[/bold cyan]")
 
     # Get GPU preferences from config
@@ -105,7 +112,9 @@ def run_pod_creation_test(provider: RunPodProvider, config: dict):
     available_gpu = None
 
     for gpu_type in gpu_preferences:
-        info = provider.get_gpu_availability(gpu_type)
+        info = availability.get(gpu_type)
+        if info is None:
+            info = availability[gpu_type] = provider.get_gpu_availability(gpu_type)
         if info["available"]:
             available_gpu = info
             console.print(f"[green]✓ {gpu_type} available at ${info['cost_per_hour']:.2f}/hr[/green]")
@@ -195,16 +204,16 @@ def main():
         console.print("Run: [cyan]python -c \"from autopod.config import config_init_wizard; config_init_wizard()\"[/cyan]")
         return
 
-    # Test authentication
-    provider = run_authentication_test()
+    # Test authentication (config is loaded once above and reused)
+    provider = run_authentication_test(config["providers"]["runpod"]["api_key"])
     if not provider:
         return
 
     # Test GPU availability
-    run_gpu_availability_test(provider)
+    availability = run_gpu_availability_test(provider)
 
     # Test pod creation (with confirmation)
-    run_pod_creation_test(provider, config)
+    run_pod_creation_test(provider, config, availability)
 
     console.print("\n[bold green]✓ Manual tests complete[/bold green]")
 
@@ -5,19 +5,15 @@ This script makes REAL API calls and will create a real pod.
 Uses RTX A5000 (cheapest GPU at ~$0.11/hr spot).
 """
 
-import sys
 import time
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from rich.console import Console
 from rich.panel import Panel
 from autopod.config import load_config
 from autopod.providers import RunPodProvider
 from autopod.logging import setup_logging
 
-console = Console()
+from _common import console, wait_for_start
+
 logger = setup_logging()
 
 
@@ -68,7 +64,7 @@ def main():
 
         # Get pod status
         console.print("\n[cyan]Step 4: Getting pod status...[/cyan]")
-        status = provider.get_pod_status(pod_id)
+        status = provider.get_pod_status(pod_id, force=True)
 
         console.print(f"[green]✓ Pod status retrieved[/green]")
         console.print(f"  Status: {status['status']}")
@@ -96,7 +92,7 @@ def main():
         time.sleep(2)
 
         try:
-            final_status = provider.get_pod_status(pod_id)
+            final_status = provider.get_pod_status(pod_id, force=True)
             console.print(f"  Final status: {final_status['status']}")
             console.print(f"  Total cost: ${final_status['total_cost']:.4f}")
         except Exception as e:
@@ -118,10 +114,10 @@ def main():
 
 if __name__ == "__main__":
     console.print("\n[bold]Press Ctrl+C to cancel before pod creation[/bold]")
-    console.print("[dim]Starting in 3 seconds...[/dim]\n")
+    console.print("[dim]Starting in 3 seconds (Enter to start now)...[/dim]\n")
 
     try:
-        time.sleep(3)
+        wait_for_start()
         main()
     except KeyboardInterrupt:
         console.print("\n[yellow]Test cancelled by user[/yellow]")
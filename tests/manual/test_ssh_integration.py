@@ -14,35 +14,40 @@ Uses RTX A5000 (cheapest at ~$0.11/hr spot).
 Total expected cost: < $0.01
 """
 
-import sys
+import threading
 import time
-from pathlib import Path
+from dataclasses import dataclass, fields
+from typing import Optional
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from rich.console import Console
 from rich.panel import Panel
 from autopod.config import load_config
 from autopod.providers import RunPodProvider
-from autopod.ssh import SSHTunnel, open_shell, parse_ssh_connection_string
+from autopod.ssh import (
+    SSHTunnel, close_control_master, multiplex_options, open_shell, parse_ssh_connection_string,
+)
 from autopod.logging import setup_logging
 
-console = Console()
+from _common import (
+    console, known_hosts_options, print_summary, run_ssh, ssh_preflight, test_method, wait_for_ssh,
+    wait_for_start,
+)
+
 logger = setup_logging()
 
 
-def test_method(method_name: str, test_func):
-    """Wrapper to test a method and report results."""
-    console.print(f"\n[cyan]Testing: {method_name}[/cyan]")
-    try:
-        result = test_func()
-        console.print(f"[green]✓ {method_name} - PASSED[/green]")
-        return True, result
-    except Exception as e:
-        console.print(f"[red]✗ {method_name} - FAILED: {e}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
-        return False, None
+@dataclass(slots=True)
+class Results:
+    """Outcome of each test, in run order; None means the test was skipped."""
+
+    create_pod: Optional[bool] = None
+    get_ssh_connection_string: Optional[bool] = None
+    parse_ssh_connection_string: Optional[bool] = None
+    create_tunnel: Optional[bool] = None
+    is_alive: Optional[bool] = None
+    wait_for_connection: Optional[bool] = None
+    ssh_command: Optional[bool] = None
+    close_tunnel: Optional[bool] = None
+    terminate_pod: Optional[bool] = None
 
 
 def main():
@@ -54,9 +59,12 @@ def main():
         border_style="yellow"
     ))
 
-    results = {}
+    results = Results()
     pod_id = None
+    cleanup_thread = None
+    cleanup_errors = []
     tunnel = None
+    ssh_info = None
 
     try:
         # Load config
@@ -64,6 +72,9 @@ def main():
         api_key = config["providers"]["runpod"]["api_key"]
         ssh_key_path = config["providers"]["runpod"]["ssh_key_path"]
 
+        # Fail before any pod is billed if SSH could not work anyway
+        ssh_preflight(ssh_key_path)
+
         # Create provider
         provider = RunPodProvider(api_key=api_key)
 
@@ -86,72 +97,28 @@ def main():
             return pod_id
 
         success, pod_id = test_method("create_pod()", test_create_pod)
-        results["create_pod"] = success
+        results.create_pod = success
         if not success:
             console.print("[red]Cannot continue without pod[/red]")
             return
 
         # Wait for pod to initialize and SSH to become available
-        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-
         console.print("\n[yellow]Waiting for container to start and SSH to become available...[/yellow]")
         console.print("[dim]ComfyUI containers can take 2-5 minutes for dependency installation[/dim]")
         console.print("[dim]Cold starts are slower than restarts[/dim]\n")
 
         # ===== TEST 2: Get SSH connection string (with retry) =====
         def test_get_ssh_connection():
-            max_attempts = 36  # 36 attempts * 5 seconds = 180 seconds (3 minutes)
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(
-                    "[cyan]Waiting for SSH...",
-                    total=max_attempts
-                )
-
-                for attempt in range(1, max_attempts + 1):
-                    try:
-                        # Update progress
-                        progress.update(
-                            task,
-                            completed=attempt,
-                            description=f"[cyan]Attempt {attempt}/{max_attempts} - Checking SSH..."
-                        )
-
-                        conn_str = provider.get_ssh_connection_string(pod_id)
-                        assert "@" in conn_str, "Invalid connection string format"
-                        assert ":" in conn_str, "Missing port in connection string"
-
-                        # Success!
-                        progress.update(task, description="[green]✓ SSH Available!")
-                        console.print(f"\n[green]✓ SSH ready after {attempt * 5} seconds ({attempt} attempts)[/green]")
-                        console.print(f"  Connection: {conn_str}")
-                        return conn_str
-
-                    except RuntimeError as e:
-                        if "not available" in str(e) and attempt < max_attempts:
-                            # SSH not ready yet, wait and retry
-                            progress.update(
-                                task,
-                                description=f"[yellow]Container initializing... (attempt {attempt}/{max_attempts})"
-                            )
-                            time.sleep(5)
-                            continue
-                        else:
-                            # Either different error or last attempt
-                            progress.update(task, description="[red]✗ SSH timeout")
-                            raise
-
-            raise RuntimeError(f"SSH not available after {max_attempts * 5} seconds (3 minutes)")
+            conn_str, waited = wait_for_ssh(provider, pod_id, timeout=180)
+            assert "@" in conn_str, "Invalid connection string format"
+            assert ":" in conn_str, "Missing port in connection string"
+
+            console.print(f"\n[green]✓ SSH ready after {waited:.0f} seconds[/green]")
+            console.print(f"  Connection: {conn_str}")
+            return conn_str
 
         success, conn_str = test_method("get_ssh_connection_string() [with retry]", test_get_ssh_connection)
-        results["get_ssh_connection_string"] = success
+        results.get_ssh_connection_string = success
         if not success:
             console.print("[red]Cannot continue without SSH connection info[/red]")
             return
@@ -169,7 +136,7 @@ def main():
             return parsed
 
         success, ssh_info = test_method("parse_ssh_connection_string()", test_parse_connection)
-        results["parse_ssh_connection_string"] = success
+        results.parse_ssh_connection_string = success
         if not success:
             return
 
@@ -184,7 +151,8 @@ def main():
                 local_port=8188,
                 remote_port=8188,
                 ssh_key_path=ssh_key_path,
-                ssh_user=ssh_info["user"]
+                ssh_user=ssh_info["user"],
+                multiplex=True
             )
 
             result = tunnel.create_tunnel(timeout=30)
@@ -194,7 +162,7 @@ def main():
             return tunnel
 
         success, tunnel = test_method("SSHTunnel.create_tunnel()", test_create_tunnel)
-        results["create_tunnel"] = success
+        results.create_tunnel = success
         if not success:
             console.print("[yellow]Skipping tunnel tests (tunnel creation failed)[/yellow]")
         else:
@@ -206,7 +174,7 @@ def main():
                 return alive
 
             success, _ = test_method("SSHTunnel.is_alive()", test_tunnel_alive)
-            results["is_alive"] = success
+            results.is_alive = success
 
             # ===== TEST 6: Verify tunnel connection ready =====
             def test_tunnel_ready():
@@ -218,16 +186,17 @@ def main():
                 return ready
 
             success, _ = test_method("SSHTunnel.wait_for_connection()", test_tunnel_ready)
-            results["wait_for_connection"] = success
+            results.wait_for_connection = success
 
             # ===== TEST 7: Test SSH command execution (non-interactive) =====
             def test_ssh_command():
-                import subprocess
-
                 console.print("\n[yellow]Testing SSH command execution...[/yellow]")
 
-                # Build SSH command (handle RunPod proxy format without port)
+                # Build SSH command (handle RunPod proxy format without port).
+                # The tunnel above is the ControlMaster for this destination,
+                # so this attaches to its connection instead of a new handshake
                 cmd = ["ssh"]
+                cmd.extend(multiplex_options())
 
                 # Add port if specified (legacy format)
                 if ssh_info["port"] is not None:
@@ -236,25 +205,22 @@ def main():
                 # Add SSH key and options
                 cmd.extend([
                     "-i", ssh_key_path,
+                    "-o", "IdentitiesOnly=yes",
                     "-o", "StrictHostKeyChecking=accept-new",
+                    *known_hosts_options(),
                     "-o", "ConnectTimeout=10",
                     f"{ssh_info['user']}@{ssh_info['host']}",
                     "echo 'SSH connection successful' && hostname"
                 ])
 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=15
-                )
+                result = run_ssh(cmd, timeout=15)
 
                 assert result.returncode == 0, f"SSH command failed: {result.stderr}"
                 console.print(f"  Output: {result.stdout.strip()}")
                 return result.stdout
 
             success, output = test_method("SSH command execution", test_ssh_command)
-            results["ssh_command"] = success
+            results.ssh_command = success
 
             # ===== TEST 8: Close tunnel gracefully =====
             def test_close_tunnel():
@@ -267,7 +233,7 @@ def main():
                 return True
 
             success, _ = test_method("SSHTunnel.close()", test_close_tunnel)
-            results["close_tunnel"] = success
+            results.close_tunnel = success
 
         # ===== TEST 9: Terminate pod =====
         def test_terminate():
@@ -277,7 +243,7 @@ def main():
             return success
 
         success, _ = test_method("terminate_pod()", test_terminate)
-        results["terminate_pod"] = success
+        results.terminate_pod = success
 
         # Verify termination
         console.print("\n[dim]Waiting 3 seconds to verify termination...[/dim]")
@@ -309,48 +275,45 @@ def main():
             except:
                 console.print("[dim]Error closing tunnel[/dim]")
 
-        # Make sure pod is cleaned up
-        if pod_id:
-            console.print(f"\n[yellow]Ensuring pod {pod_id} is terminated...[/yellow]")
-            try:
-                provider.terminate_pod(pod_id)
-                console.print("✓ Cleanup complete")
-            except:
-                console.print("[dim]Pod already terminated or error cleaning up[/dim]")
-
-    # Print summary
-    console.print("\n" + "="*60)
-    console.print("[bold cyan]SSH Integration Test Results[/bold cyan]")
-    console.print("="*60 + "\n")
-
-    from rich.table import Table
-    table = Table(title="SSH Integration Test Results")
-    table.add_column("Test", style="cyan")
-    table.add_column("Result", justify="center")
+        # Shut down the shared SSH connection rather than leave it persisting
+        if ssh_info:
+            close_control_master(ssh_info["host"], ssh_info["port"], ssh_info["user"])
 
-    for test_name, passed in results.items():
-        result = "[green]✓ PASS[/green]" if passed else "[red]✗ FAIL[/red]"
-        table.add_row(test_name, result)
-
-    console.print(table)
+        # Make sure pod is cleaned up. Termination is an API round-trip, so
+        # it runs alongside the summary rather than in front of it; the
+        # thread is non-daemon, so the process still waits for it
+        if pod_id and not results.terminate_pod:
+            console.print(f"\n[yellow]Ensuring pod {pod_id} is terminated...[/yellow]")
 
-    total = len(results)
-    passed = sum(1 for r in results.values() if r)
-    console.print(f"\n[bold]Passed: {passed}/{total}[/bold]")
+            def terminate_pod():
+                try:
+                    provider.terminate_pod(pod_id)
+                except Exception as e:
+                    cleanup_errors.append(e)
 
-    if passed == total:
-        console.print("\n[bold green]✓ ALL SSH TESTS PASSED[/bold green]")
-        console.print("[dim]SSH tunnel functionality is fully operational![/dim]")
-    else:
-        console.print(f"\n[bold yellow]⚠️  {total - passed} test(s) failed[/bold yellow]")
+            cleanup_thread = threading.Thread(target=terminate_pod, name="pod-cleanup")
+            cleanup_thread.start()
 
-    console.print(f"\n[dim]Full logs: ~/.autopod/logs/autopod.log[/dim]")
+    # Print summary
+    ran = {f.name: getattr(results, f.name) for f in fields(results)}
+    print_summary(
+        "SSH Integration Test Results",
+        {test_name: passed for test_name, passed in ran.items() if passed is not None},
+        "SSH tunnel functionality is fully operational!",
+    )
+
+    if cleanup_thread:
+        cleanup_thread.join()
+        if cleanup_errors:
+            console.print("[dim]Pod already terminated or error cleaning up[/dim]")
+        else:
+            console.print("✓ Cleanup complete")
 
 
 if __name__ == "__main__":
-    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds...[/bold]")
+    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds (Enter to start now)...[/bold]")
     try:
-        time.sleep(3)
+        wait_for_start()
         main()
     except KeyboardInterrupt:
         console.print("\n[yellow]Test cancelled by user[/yellow]")
@@ -5,142 +5,121 @@ Uses a lightweight PyTorch template (faster startup than ComfyUI).
 Tests:
 1. Create pod with simple template
 2. Wait for SSH (with progress bar)
-3. Execute nvidia-smi command via SSH
+3. Execute hostname, nvidia-smi and uptime via one SSH session
 4. Parse CUDA version from output
 5. Terminate pod
 
-Expected cost: < $0.01
+Usage:
+    python test_ssh_simple.py                      # one RTX A5000 pod
+    python test_ssh_simple.py "RTX A5000" "RTX A4000"
+
+With several GPU types, one pod per type is created and the pods run
+through the steps concurrently, so the run takes as long as the slowest
+boot rather than the sum of them.
+
+Expected cost: < $0.01 per pod
 Startup time: ~30-60 seconds (faster than ComfyUI)
 """
 
+import os
 import sys
-import time
 import subprocess
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from concurrent.futures import ThreadPoolExecutor
 
-from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from autopod.config import load_config
 from autopod.providers import RunPodProvider
 from autopod.logging import setup_logging
+from autopod.ssh import close_control_master, multiplex_options, parse_ssh_connection_string
+
+from _common import (
+    console, key_in_agent, known_hosts_options, run_ssh, ssh_preflight, wait_for_ssh, wait_for_start, wait_until,
+)
 
-console = Console()
 logger = setup_logging()
 
+DEFAULT_GPU_TYPES = ["RTX A5000"]
 
-def main():
-    """Test SSH command execution with simple template."""
-    console.print(Panel.fit(
-        "[bold yellow]⚠️  Simple SSH Test - REAL API CALLS[/bold yellow]\n"
-        "[dim]Testing SSH command execution with PyTorch template[/dim]\n"
-        "[dim]Expected cost: < $0.01[/dim]",
-        border_style="yellow"
-    ))
+DEBUG = os.getenv("AUTOPOD_DEBUG", "").lower() in ("1", "true", "yes")
 
-    pod_id = None
+# All remote checks, run over one SSH exec; each section's output follows
+# its "== name" marker
+REMOTE_SCRIPT = """set -e
+echo "== hostname"
+hostname
+echo "== gpu"
+nvidia-smi --query-gpu=name,driver_version,cuda_version --format=csv,noheader
+echo "== uptime"
+uptime
+"""
 
-    try:
-        # Load config
-        config = load_config()
-        api_key = config["providers"]["runpod"]["api_key"]
-        ssh_key_path = config["providers"]["runpod"]["ssh_key_path"]
 
-        provider = RunPodProvider(api_key=api_key)
+def split_sections(output):
+    """Split REMOTE_SCRIPT output into {section name: text}."""
+    sections = {}
+    name = None
+    for line in output.splitlines():
+        if line.startswith("== "):
+            name = line[3:].strip()
+            sections[name] = []
+        elif name:
+            sections[name].append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+
+def run_one(provider, pod_config, ssh_key_path, show_progress=True):
+    """Create one pod, run nvidia-smi on it over SSH and terminate it.
+
+    Args:
+        provider: Shared RunPodProvider
+        pod_config: Pod configuration for create_pod()
+        ssh_key_path: Private key for the SSH command
+        show_progress: Show the SSH wait progress bar (only one can be
+            live at a time, so this is off when pods run concurrently)
+
+    Returns:
+        True if the SSH command succeeded
+    """
+    label = f"[{pod_config['gpu_type']}]"
+    pod_id = None
+    ssh_info = None
 
+    try:
         # Create pod with SIMPLE template (faster startup)
-        console.print("\n[cyan]Creating pod with PyTorch template...[/cyan]")
+        console.print(f"\n[cyan]{label} Creating pod with PyTorch template...[/cyan]")
         console.print("[dim]Template: runpod/pytorch:2.1.0-py3.10-cuda11.8.0-devel[/dim]")
 
-        pod_config = {
-            "gpu_type": "RTX A5000",
-            "gpu_count": 1,
-            "template": "runpod/pytorch:2.1.0-py3.10-cuda11.8.0-devel-ubuntu22.04",
-            "cloud_type": "ALL",
-            "disk_size_gb": 10,
-        }
-
         pod_id = provider.create_pod(pod_config)
-        console.print(f"[green]✓ Pod created: {pod_id}[/green]")
+        console.print(f"[green]{label} ✓ Pod created: {pod_id}[/green]")
 
         # Wait for SSH with progress bar
-        console.print("\n[yellow]Waiting for SSH to become available...[/yellow]")
+        console.print(f"\n[yellow]{label} Waiting for SSH to become available...[/yellow]")
         console.print("[dim]PyTorch templates usually ready in 30-60 seconds[/dim]\n")
 
-        conn_str = None
-        max_attempts = 24  # 24 * 5 = 120 seconds (2 minutes)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("[cyan]Waiting for SSH...", total=max_attempts)
-
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    progress.update(
-                        task,
-                        completed=attempt,
-                        description=f"[cyan]Checking SSH (attempt {attempt}/{max_attempts})..."
-                    )
-
-                    conn_str = provider.get_ssh_connection_string(pod_id)
-
-                    # Success!
-                    progress.update(task, description="[green]✓ SSH Available!")
-                    console.print(f"\n[green]✓ SSH ready after {attempt * 5} seconds[/green]")
-                    console.print(f"  Connection: {conn_str}")
-                    break
-
-                except RuntimeError as e:
-                    if "not available" in str(e) and attempt < max_attempts:
-                        time.sleep(5)
-                        continue
-                    elif attempt >= max_attempts:
-                        progress.update(task, description="[red]✗ SSH timeout")
-                        raise RuntimeError(f"SSH not available after {max_attempts * 5}s")
-                    else:
-                        raise
-
-        if not conn_str:
-            console.print("[red]✗ Failed to get SSH connection[/red]")
-            return
+        conn_str, waited = wait_for_ssh(provider, pod_id, timeout=120, show_progress=show_progress)
+        console.print(f"\n[green]{label} ✓ SSH ready after {waited:.0f} seconds[/green]")
+        console.print(f"  Connection: {conn_str}")
 
         # Parse SSH connection
-        from autopod.ssh import parse_ssh_connection_string
         ssh_info = parse_ssh_connection_string(conn_str)
 
-        # Give SSH service a few extra seconds to fully initialize
-        console.print("\n[dim]Waiting 5 seconds for SSH service to fully initialize...[/dim]")
-        time.sleep(5)
-
-        # Add SSH key to agent (needed for passphrase-protected keys in non-interactive mode)
-        console.print("\n[dim]Adding SSH key to ssh-agent...[/dim]")
-        try:
-            # Start ssh-agent if not running and add key
-            subprocess.run(["ssh-add", ssh_key_path], check=True, capture_output=True)
-            console.print("[dim]✓ Key added to ssh-agent[/dim]")
-        except subprocess.CalledProcessError as e:
-            console.print(f"[yellow]⚠ Could not add key to ssh-agent: {e}[/yellow]")
-            console.print("[yellow]SSH may fail if key has passphrase[/yellow]")
-
         # Test SSH command execution: nvidia-smi
-        console.print("\n[cyan]Testing SSH command execution...[/cyan]")
+        console.print(f"\n[cyan]{label} Testing SSH command execution...[/cyan]")
         console.print(f"[dim]Connection: {ssh_info['user']}@{ssh_info['host']}[/dim]")
         console.print(f"[dim]SSH key: {ssh_key_path}[/dim]")
-        console.print("[dim]Running: nvidia-smi --query-gpu=name,driver_version,cuda_version --format=csv[/dim]")
+        console.print("[dim]Running: hostname, nvidia-smi and uptime in one session[/dim]")
 
         # Build SSH command (RunPod proxy doesn't need -p flag)
         cmd = ["ssh"]
 
-        # Add verbose output for debugging
-        cmd.append("-v")
+        # Add verbose output for debugging; kilobytes of handshake detail
+        # otherwise buffered on every run, so only with AUTOPOD_DEBUG
+        if DEBUG:
+            cmd.append("-v")
+
+        # Share one connection per destination, so any follow-up command
+        # skips the handshake
+        cmd.extend(multiplex_options())
 
         # Add port if specified (legacy format)
         if ssh_info["port"] is not None:
@@ -149,63 +128,150 @@ def main():
         # Add SSH key and options
         cmd.extend([
             "-i", ssh_key_path,
+            "-o", "IdentitiesOnly=yes",
             "-o", "StrictHostKeyChecking=accept-new",
+            *known_hosts_options(),
             "-o", "ConnectTimeout=10",
             f"{ssh_info['user']}@{ssh_info['host']}",
-            "nvidia-smi --query-gpu=name,driver_version,cuda_version --format=csv,noheader"
+            "bash -s"
         ])
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=15
-        )
-
-        if result.returncode == 0:
-            console.print(f"[green]✓ SSH command successful![/green]")
-            console.print(f"\n[bold]GPU Info:[/bold]")
-            console.print(result.stdout.strip())
-
-            # Parse CUDA version
-            parts = result.stdout.strip().split(", ")
-            if len(parts) >= 3:
-                gpu_name = parts[0]
-                driver_ver = parts[1]
-                cuda_ver = parts[2]
-                console.print(f"\n[cyan]GPU:[/cyan] {gpu_name}")
-                console.print(f"[cyan]Driver:[/cyan] {driver_ver}")
-                console.print(f"[cyan]CUDA:[/cyan] {cuda_ver}")
-        else:
-            console.print(f"[red]✗ SSH command failed (exit code {result.returncode})[/red]")
-            console.print(f"[dim]stderr: {result.stderr}[/dim]")
+        # sshd may still be starting once the API reports SSH; retry until
+        # it accepts instead of pausing a fixed time up front. Exit code 255
+        # is ssh's own connection failure, not the remote command's
+        result = None
 
-        console.print("\n[bold green]✓ SSH test passed![/bold green]")
-        console.print("[dim]SSH tunnel and command execution work correctly[/dim]")
+        def command_ran():
+            nonlocal result
+            result = run_ssh(cmd, input_text=REMOTE_SCRIPT, timeout=15)
+            return result.returncode != 255
+
+        wait_until(command_ran, timeout=20, interval=0.5, factor=2.0, max_interval=4.0)
+
+        if result.returncode != 0:
+            console.print(f"[red]{label} ✗ SSH command failed (exit code {result.returncode})[/red]")
+            console.print(f"[dim]stderr: {result.stderr}[/dim]")
+            return False
+
+        sections = split_sections(result.stdout)
+        console.print(f"[green]{label} ✓ SSH command successful![/green]")
+        console.print(f"  Host: {sections.get('hostname', '?')}")
+        console.print(f"  Uptime: {sections.get('uptime', '?')}")
+        console.print(f"\n[bold]{label} GPU Info:[/bold]")
+        console.print(sections.get("gpu", ""))
+
+        # Parse CUDA version
+        parts = sections.get("gpu", "").split(", ")
+        if len(parts) >= 3:
+            gpu_name = parts[0]
+            driver_ver = parts[1]
+            cuda_ver = parts[2]
+            console.print(f"\n[cyan]GPU:[/cyan] {gpu_name}")
+            console.print(f"[cyan]Driver:[/cyan] {driver_ver}")
+            console.print(f"[cyan]CUDA:[/cyan] {cuda_ver}")
+        return True
 
     except Exception as e:
-        console.print(f"\n[bold red]✗ Test failed:[/bold red]")
+        console.print(f"\n[bold red]{label} ✗ Test failed:[/bold red]")
         console.print(f"[red]{e}[/red]")
 
         import traceback
         console.print("\n[dim]Traceback:[/dim]")
         console.print(traceback.format_exc())
+        return False
 
     finally:
         # Cleanup
+        if ssh_info:
+            close_control_master(ssh_info["host"], ssh_info["port"], ssh_info["user"])
         if pod_id:
-            console.print(f"\n[yellow]Terminating pod {pod_id}...[/yellow]")
+            console.print(f"\n[yellow]{label} Terminating pod {pod_id}...[/yellow]")
             try:
                 provider.terminate_pod(pod_id)
-                console.print("[green]✓ Pod terminated[/green]")
+                console.print(f"[green]{label} ✓ Pod terminated[/green]")
             except:
                 console.print("[dim]Error terminating pod (may already be gone)[/dim]")
 
 
+def main(gpu_types=None):
+    """Test SSH command execution with simple template.
+
+    Args:
+        gpu_types: GPU types to test, one pod each (default: RTX A5000)
+    """
+    gpu_types = gpu_types or DEFAULT_GPU_TYPES
+
+    console.print(Panel.fit(
+        "[bold yellow]⚠️  Simple SSH Test - REAL API CALLS[/bold yellow]\n"
+        "[dim]Testing SSH command execution with PyTorch template[/dim]\n"
+        f"[dim]Pods: {len(gpu_types)} ({', '.join(gpu_types)})[/dim]\n"
+        f"[dim]Expected cost: < ${0.01 * len(gpu_types):.2f}[/dim]",
+        border_style="yellow"
+    ))
+
+    try:
+        # Load config
+        config = load_config()
+        api_key = config["providers"]["runpod"]["api_key"]
+        ssh_key_path = config["providers"]["runpod"]["ssh_key_path"]
+    except Exception as e:
+        console.print(f"\n[bold red]✗ Test failed:[/bold red]")
+        console.print(f"[red]{e}[/red]")
+        return
+
+    provider = RunPodProvider(api_key=api_key)
+
+    # Add SSH key to agent (needed for passphrase-protected keys in non-interactive mode)
+    console.print("\n[dim]Adding SSH key to ssh-agent...[/dim]")
+    try:
+        if key_in_agent(ssh_key_path):
+            console.print("[dim]✓ Key already in ssh-agent[/dim]")
+        else:
+            # Start ssh-agent if not running and add key
+            subprocess.run(["ssh-add", ssh_key_path], check=True, capture_output=True)
+            console.print("[dim]✓ Key added to ssh-agent[/dim]")
+    except subprocess.CalledProcessError as e:
+        console.print(f"[yellow]⚠ Could not add key to ssh-agent: {e}[/yellow]")
+        console.print("[yellow]SSH may fail if key has passphrase[/yellow]")
+
+    # Fail before any pod is billed if SSH could not work anyway
+    ssh_preflight(ssh_key_path)
+
+    pod_configs = [
+        {
+            "gpu_type": gpu_type,
+            "gpu_count": 1,
+            "template": "runpod/pytorch:2.1.0-py3.10-cuda11.8.0-devel-ubuntu22.04",
+            "cloud_type": "ALL",
+            "disk_size_gb": 10,
+        }
+        for gpu_type in gpu_types
+    ]
+
+    if len(pod_configs) == 1:
+        results = [run_one(provider, pod_configs[0], ssh_key_path)]
+    else:
+        # Pods boot concurrently; the wait for each is pure I/O. Each
+        # worker's create_pod() may be the first use of the RunPod SDK;
+        # lazy_import serializes that first load across threads
+        with ThreadPoolExecutor(max_workers=len(pod_configs)) as executor:
+            results = list(executor.map(
+                lambda pod_config: run_one(provider, pod_config, ssh_key_path, show_progress=False),
+                pod_configs
+            ))
+
+    passed = sum(results)
+    if passed == len(results):
+        console.print("\n[bold green]✓ SSH test passed![/bold green]")
+        console.print("[dim]SSH tunnel and command execution work correctly[/dim]")
+    else:
+        console.print(f"\n[bold red]✗ SSH test failed on {len(results) - passed}/{len(results)} pod(s)[/bold red]")
+
+
 if __name__ == "__main__":
-    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds...[/bold]")
+    console.print("\n[bold]Press Ctrl+C to cancel within 3 seconds (Enter to start now)...[/bold]")
     try:
-        time.sleep(3)
-        main()
+        wait_for_start()
+        main(sys.argv[1:])
     except KeyboardInterrupt:
         console.print("\n[yellow]Test cancelled[/yellow]")
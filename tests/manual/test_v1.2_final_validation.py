@@ -27,10 +27,6 @@ This proves V1.2 works end-to-end with SSH-only access.
 import sys
 import os
 import time
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from autopod.config import load_config
 from autopod.providers.runpod import RunPodProvider
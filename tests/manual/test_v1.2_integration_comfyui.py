@@ -23,10 +23,6 @@ The test will:
 import sys
 import os
 import time
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from autopod.config import load_config
 from autopod.providers.runpod import RunPodProvider
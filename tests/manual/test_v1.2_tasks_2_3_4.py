@@ -15,9 +15,6 @@ import sys
 import os
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from autopod.tunnel import SSHTunnel, TunnelManager
 from autopod.comfyui import ComfyUIClient
 import json
@@ -26,10 +26,6 @@ import sys
 import os
 import time
 import subprocess
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from autopod.config import load_config
 from autopod.providers.runpod import RunPodProvider
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
@@ -75,3 +78,49 @@ def test_comfy_info_not_ready(MockComfyUIClient, mock_get_pod, mock_get_single_p
     assert "URL: https://pod-123-8188.proxy.runpod.net" in result.output
     assert "The service may still be starting up" in result.output
     mock_comfy_client_instance.is_ready.assert_called_once()
+
+@patch('autopod.cli.time.sleep')
+@patch('autopod.cli.load_provider')
+def test_wait_ssh_ready(mock_load_provider, mock_sleep, runner):
+    """Test 'autopod wait-ssh' exits 0 once the pod reports SSH ready."""
+    mock_provider = MagicMock()
+    mock_provider.get_pod_status.side_effect = [
+        {"ssh_ready": False},
+        {"ssh_ready": False},
+        {"ssh_ready": True},
+    ]
+    mock_load_provider.return_value = mock_provider
+
+    result = runner.invoke(cli, ['wait-ssh', 'pod-123', '--timeout', '120'])
+
+    assert result.exit_code == 0
+    assert "SSH is ready on pod pod-123" in result.output
+    mock_provider.get_pod_status.assert_called_with('pod-123', force=True)
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 1.5]
+
+@patch('autopod.cli.time.sleep')
+@patch('autopod.cli.load_provider')
+def test_wait_ssh_timeout(mock_load_provider, mock_sleep, runner):
+    """Test 'autopod wait-ssh' exits 1 when SSH never becomes ready."""
+    mock_provider = MagicMock()
+    mock_provider.get_pod_status.return_value = {"ssh_ready": False}
+    mock_load_provider.return_value = mock_provider
+
+    result = runner.invoke(cli, ['wait-ssh', 'pod-123', '--timeout', '0'])
+
+    assert result.exit_code == 1
+    assert "SSH not ready after 0s" in result.output
+    mock_provider.get_pod_status.assert_called_once()
+    mock_sleep.assert_not_called()
+
+def test_python_m_autopod_runs_cli():
+    """Test 'python -m autopod' dispatches to the click app."""
+    result = subprocess.run(
+        [sys.executable, "-m", "autopod", "--version"],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert result.returncode == 0
+    assert "autopod, version" in result.stdout
@@ -110,6 +110,23 @@ def test_save_and_load_config(temp_config_dir):
     assert loaded_config["providers"]["runpod"]["api_key"] == "test-api-key-123"
 
 
+def test_load_config_reuses_unchanged_file(temp_config_dir):
+    """Test that load_config skips re-reading an unchanged file."""
+    save_config(get_default_config())
+    first = load_config()
+    first["defaults"]["gpu_count"] = 4
+
+    with patch("builtins.open") as mock_open:
+        second = load_config()
+
+    mock_open.assert_not_called()
+    assert second == get_default_config()
+
+    # A save is picked up on the next load
+    save_config(first)
+    assert load_config()["defaults"]["gpu_count"] == 4
+
+
 def test_load_config_file_not_found(temp_config_dir):
     """Test that load_config raises FileNotFoundError if config doesn't exist."""
     with pytest.raises(FileNotFoundError):
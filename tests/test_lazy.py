@@ -0,0 +1,70 @@
+"""Tests for deferred module imports."""
+
+import sys
+import threading
+from types import ModuleType
+
+import pytest
+
+from autopod._lazy import lazy_import
+
+
+@pytest.fixture
+def slow_module(tmp_path, monkeypatch):
+    """A module whose body sets one attribute, sleeps, then sets another."""
+    (tmp_path / "autopod_slow_mod.py").write_text(
+        "import time\n"
+        "api_key = None\n"
+        "early = 1\n"
+        "time.sleep(0.2)\n"
+        "late = 2\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "autopod_slow_mod"
+    sys.modules.pop("autopod_slow_mod", None)
+
+
+def test_lazy_import_defers_module_code(slow_module):
+    """The module's code runs on first attribute access, once."""
+    loaded = []
+    module = lazy_import(slow_module, on_load=loaded.append)
+
+    assert loaded == []
+    assert module.late == 2
+    assert loaded == [module]
+    assert type(module) is ModuleType
+    assert sys.modules[slow_module] is module
+
+
+def test_lazy_import_keeps_attributes_assigned_before_loading(slow_module):
+    """Assigning an attribute doesn't load the module or get overwritten."""
+    loaded = []
+    module = lazy_import(slow_module, on_load=loaded.append)
+
+    module.api_key = "key"
+    assert loaded == []
+
+    assert module.late == 2
+    assert module.api_key == "key"
+
+
+def test_lazy_import_first_access_is_thread_safe(slow_module):
+    """Threads touching the module at once all see it fully loaded."""
+    module = lazy_import(slow_module)
+    barrier = threading.Barrier(2)
+    results = []
+
+    def read_late():
+        barrier.wait()
+        try:
+            results.append(module.late)
+        except AttributeError as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=read_late) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [2, 2]
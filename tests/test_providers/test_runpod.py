@@ -1,8 +1,15 @@
 """Tests for RunPod provider implementation."""
 
+import subprocess
+import sys
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+
+
 from autopod.providers.runpod import RunPodProvider
 
 
@@ -36,18 +43,46 @@ def test_init_with_empty_api_key():
 
 def test_authenticate_success(provider, mock_runpod):
     """Test successful authentication."""
-    mock_runpod.get_gpus.return_value = [{"id": "gpu1"}]
+    mock_runpod.get_user.return_value = {"id": "user-123"}
 
     result = provider.authenticate("test-key")
 
     assert result is True
     assert provider.api_key == "test-key"
-    mock_runpod.get_gpus.assert_called_once()
+    mock_runpod.get_user.assert_called_once()
+    mock_runpod.get_gpus.assert_not_called()
+
+
+def test_authenticate_skips_already_validated_key(provider, mock_runpod):
+    """Test repeat authentication with the same key makes no API call."""
+    mock_runpod.get_user.return_value = {"id": "user-123"}
+
+    assert provider.authenticate("test-key") is True
+    assert provider.authenticate("test-key") is True
+    mock_runpod.get_user.assert_called_once()
+
+    # A different key is validated again
+    assert provider.authenticate("other-key") is True
+    assert mock_runpod.get_user.call_count == 2
+
+
+def test_authenticate_restores_validated_key_after_failure(provider, mock_runpod):
+    """Test re-authenticating a validated key after a failed one restores it."""
+    mock_runpod.get_user.return_value = {"id": "user-123"}
+    assert provider.authenticate("good-key") is True
+
+    mock_runpod.get_user.return_value = None
+    assert provider.authenticate("bad-key") is False
+
+    assert provider.authenticate("good-key") is True
+    assert mock_runpod.api_key == "good-key"
+    assert provider.api_key == "good-key"
+    assert mock_runpod.get_user.call_count == 2
 
 
 def test_authenticate_failure(provider, mock_runpod):
     """Test failed authentication."""
-    mock_runpod.get_gpus.return_value = None
+    mock_runpod.get_user.return_value = None
 
     result = provider.authenticate("invalid-key")
 
@@ -56,7 +91,7 @@ def test_authenticate_failure(provider, mock_runpod):
 
 def test_authenticate_exception(provider, mock_runpod):
     """Test authentication with exception."""
-    mock_runpod.get_gpus.side_effect = Exception("Network error")
+    mock_runpod.get_user.side_effect = Exception("Network error")
 
     result = provider.authenticate("test-key")
 
@@ -138,6 +173,69 @@ def test_get_gpu_availability_exception(provider, mock_runpod):
     assert result["cost_per_hour"] == 0.0
 
 
+def test_get_gpu_availability_with_gpu_type_id(provider, mock_runpod):
+    """Test GPU availability check skips catalog lookup for a known GPU ID."""
+    mock_runpod.get_gpu.return_value = {
+        "id": "NVIDIA RTX A40",
+        "displayName": "RTX A40",
+        "memoryInGb": 48,
+        "securePrice": 0.40,
+        "secureCloud": True,
+        "communityCloud": False
+    }
+
+    result = provider.get_gpu_availability("NVIDIA RTX A40")
+
+    assert result["available"] is True
+    assert result["gpu_type_id"] == "NVIDIA RTX A40"
+    mock_runpod.get_gpus.assert_not_called()
+    mock_runpod.get_gpu.assert_called_once_with("NVIDIA RTX A40", gpu_quantity=1)
+
+
+def test_get_gpu_availability_reuses_catalog(provider, mock_runpod):
+    """Test repeated lookups by display name fetch the GPU catalog once."""
+    mock_runpod.get_gpus.return_value = [{"id": "NVIDIA A40", "displayName": "A40"}]
+    mock_runpod.get_gpu.return_value = {"id": "NVIDIA A40", "secureCloud": True}
+
+    provider.get_gpu_availability("RTX A40")
+    provider.get_gpu_availability("RTX A40")
+
+    mock_runpod.get_gpus.assert_called_once()
+    assert mock_runpod.get_gpu.call_count == 2
+
+
+def test_get_gpu_availability_concurrent_lookups_share_catalog(provider, mock_runpod):
+    """Test concurrent lookups by display name fetch the GPU catalog once."""
+    def slow_get_gpus():
+        time.sleep(0.1)
+        return [{"id": "NVIDIA A40", "displayName": "A40"}]
+
+    mock_runpod.get_gpus.side_effect = slow_get_gpus
+    mock_runpod.get_gpu.return_value = {"id": "NVIDIA A40", "secureCloud": True}
+
+    threads = [
+        threading.Thread(target=lambda: provider.get_gpu_availability("RTX A40"))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    mock_runpod.get_gpus.assert_called_once()
+
+
+def test_get_gpu_availability_sdk_not_found(provider, mock_runpod):
+    """Test GPU availability check when runpod.get_gpu rejects the ID."""
+    mock_runpod.get_gpu.side_effect = ValueError("No GPU found with the specified ID")
+
+    result = provider.get_gpu_availability("NVIDIA RTX A40")
+
+    assert result["available"] is False
+    assert result["gpu_type_id"] is None
+    assert result["display_name"] == "NVIDIA RTX A40"
+
+
 def test_create_pod_success(provider, mock_runpod):
     """Test successful pod creation."""
     # Mock GPU availability
@@ -235,6 +333,79 @@ def test_get_pod_status_not_found(provider, mock_runpod):
         provider.get_pod_status("pod-nonexistent")
 
 
+def test_get_pod_status_cached(provider, mock_runpod):
+    """Test repeated status calls within the TTL reuse the cached result."""
+    mock_runpod.get_pod.return_value = {
+        "id": "pod-abc123",
+        "desiredStatus": "RUNNING",
+        "gpuCount": 1,
+        "costPerHr": 0.40,
+    }
+
+    first = provider.get_pod_status("pod-abc123")
+    second = provider.get_pod_status("pod-abc123")
+
+    assert first == second
+    assert mock_runpod.get_pod.call_count == 1
+
+    # force=True always goes to the API
+    provider.get_pod_status("pod-abc123", force=True)
+    assert mock_runpod.get_pod.call_count == 2
+
+
+def test_get_pod_status_concurrent_misses_share_one_request(provider, mock_runpod):
+    """Test concurrent cache misses for one pod issue a single API call."""
+    def slow_get_pod(pod_id):
+        time.sleep(0.1)
+        return {"id": pod_id, "desiredStatus": "RUNNING"}
+
+    mock_runpod.get_pod.side_effect = slow_get_pod
+    statuses = []
+
+    threads = [
+        threading.Thread(target=lambda: statuses.append(provider.get_pod_status("pod-abc123")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [s["status"] for s in statuses] == ["RUNNING"] * 4
+    assert mock_runpod.get_pod.call_count == 1
+
+
+def test_get_pod_status_batched(provider, mock_runpod):
+    """Test batched status uses one get_pods call and fills the cache."""
+    mock_runpod.get_pods.return_value = [
+        {"id": "pod-a", "desiredStatus": "RUNNING", "gpuCount": 1, "runtime": {"ports": []}},
+        {"id": "pod-b", "desiredStatus": "EXITED", "gpuCount": 2},
+    ]
+
+    statuses = provider.get_pod_status_batched(["pod-b", "pod-gone", "pod-a"])
+
+    assert [s and s["status"] for s in statuses] == ["EXITED", None, "RUNNING"]
+    assert statuses[2]["ssh_ready"] is True
+    mock_runpod.get_pods.assert_called_once()
+    mock_runpod.get_pod.assert_not_called()
+
+    # Batched results are served from the cache on the next single lookup
+    assert provider.get_pod_status("pod-a")["status"] == "RUNNING"
+    mock_runpod.get_pod.assert_not_called()
+
+
+def test_stop_pod_invalidates_status_cache(provider, mock_runpod):
+    """Test stopping a pod drops its cached status."""
+    mock_runpod.get_pod.return_value = {"id": "pod-abc123", "desiredStatus": "RUNNING"}
+    provider.get_pod_status("pod-abc123")
+
+    mock_runpod.get_pod.return_value = {"id": "pod-abc123", "desiredStatus": "EXITED"}
+    provider.stop_pod("pod-abc123")
+
+    assert provider.get_pod_status("pod-abc123")["status"] == "EXITED"
+    assert mock_runpod.get_pod.call_count == 2
+
+
 def test_stop_pod_success(provider, mock_runpod):
     """Test successful pod stop."""
     # RunPod SDK returns None on success
@@ -343,6 +514,23 @@ def test_generate_pod_name_increments(provider, mock_runpod):
     assert name.endswith("-006")
 
 
+def test_generate_pod_name_ignores_other_pods(provider, mock_runpod):
+    """Test pod name generation skips other dates and non-autopod names."""
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    mock_runpod.get_pods.return_value = [
+        {"name": f"autopod-{today}-003"},
+        {"name": "autopod-2020-01-01-099"},
+        {"name": f"autopod-{today}-abc"},
+        {"name": "my-custom-pod-050"},
+        {"name": None},
+    ]
+
+    name = provider._generate_pod_name()
+
+    assert name == f"autopod-{today}-004"
+
+
 def test_generate_pod_name_no_existing_pods(provider, mock_runpod):
     """Test pod name generation with no existing pods."""
     mock_runpod.get_pods.return_value = []
@@ -353,6 +541,27 @@ def test_generate_pod_name_no_existing_pods(provider, mock_runpod):
     assert name.endswith("-001")
 
 
+def test_generate_pod_name_concurrent_calls_unique(provider, mock_runpod):
+    """Test concurrent pod name generation never hands out the same name."""
+    def slow_get_pods():
+        time.sleep(0.05)
+        return []
+
+    mock_runpod.get_pods.side_effect = slow_get_pods
+    names = []
+
+    threads = [
+        threading.Thread(target=lambda: names.append(provider._generate_pod_name()))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(name[-3:] for name in names) == ["001", "002", "003", "004"]
+
+
 def test_retry_with_backoff_success_first_try(provider):
     """Test retry succeeds on first attempt."""
     mock_func = Mock(return_value="success")
@@ -421,3 +630,58 @@ def test_get_pod_status_runtime_with_creationTimeMillis(provider, mock_runpod):
     assert 59.9 < status["runtime_minutes"] < 60.1
     # Check if total cost is approximately cost_per_hour
     assert 0.49 < status["total_cost"] < 0.51
+
+
+def test_save_pod_metadata_roundtrip(provider, tmp_path):
+    """Test saved metadata is visible to a subsequent load."""
+    provider._pods_file = tmp_path / "pods.json"
+
+    provider._save_pod_metadata("pod-abc123", {"pod_host_id": "abc123-xyz"})
+    metadata = provider._load_pod_metadata("pod-abc123")
+
+    assert metadata["pod_host_id"] == "abc123-xyz"
+    assert "created_at" in metadata
+    assert (tmp_path / "pods.json").stat().st_mode & 0o777 == 0o600
+
+
+def test_save_pod_metadata_tightens_existing_file(provider, tmp_path):
+    """Test saving metadata makes an existing world-readable pods.json owner-only."""
+    from autopod.providers.runpod import _metadata_writer
+
+    pods_file = tmp_path / "pods.json"
+    pods_file.write_text("{}")
+    pods_file.chmod(0o644)
+    provider._pods_file = pods_file
+
+    provider._save_pod_metadata("pod-abc123", {"pod_host_id": "abc123-xyz"})
+    _metadata_writer.flush()
+
+    assert pods_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_save_pod_metadata_coalesces_updates(provider, tmp_path):
+    """Test multiple queued saves all land in pods.json."""
+    import json
+    from autopod.providers.runpod import _metadata_writer
+
+    provider._pods_file = tmp_path / "pods.json"
+
+    provider._save_pod_metadata("pod-1", {"pod_host_id": "host-1"})
+    provider._save_pod_metadata("pod-2", {"pod_host_id": "host-2"})
+    _metadata_writer.flush()
+
+    pods_data = json.loads((tmp_path / "pods.json").read_text())
+    assert pods_data["pod-1"]["pod_host_id"] == "host-1"
+    assert pods_data["pod-2"]["pod_host_id"] == "host-2"
+
+
+def test_import_does_not_load_runpod_sdk():
+    """Test that importing the CLI defers loading the RunPod SDK until first use."""
+    code = (
+        "import sys, autopod.cli\n"
+        "assert 'runpod.api' not in sys.modules\n"
+        "import autopod.providers.runpod as provider\n"
+        "provider.runpod.get_gpus\n"
+        "assert 'runpod.api' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -3,7 +3,9 @@
 import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock, call
-from autopod.ssh import SSHTunnel, open_shell, parse_ssh_connection_string
+from autopod.ssh import (
+    SSHTunnel, open_shell, parse_ssh_connection_string, close_control_master, create_tunnels
+)
 
 
 @pytest.fixture
@@ -123,6 +125,58 @@ def test_create_tunnel_with_ssh_key(mock_subprocess, mock_socket):
     assert call_args[key_index + 1].endswith(".ssh/id_ed25519_runpod")
 
 
+def test_create_tunnel_multiplexed(mock_subprocess, mock_socket, tmp_path):
+    """Test SSH tunnel shares a ControlMaster connection only when asked to."""
+    mock_process = Mock()
+    mock_process.poll.return_value = None
+    mock_subprocess.Popen.return_value = mock_process
+
+    mock_sock = Mock()
+    mock_sock.connect_ex.return_value = 0
+    mock_socket.socket.return_value = mock_sock
+
+    with patch('autopod.ssh.Path.home', return_value=tmp_path):
+        SSHTunnel(ssh_host="ssh.runpod.io", local_port=8188, ssh_user="abc-def", multiplex=True).create_tunnel(timeout=10)
+        multiplexed = mock_subprocess.Popen.call_args[0][0]
+
+        SSHTunnel(ssh_host="ssh.runpod.io", local_port=8189).create_tunnel(timeout=10)
+        direct = mock_subprocess.Popen.call_args[0][0]
+
+    assert "ControlMaster=auto" in multiplexed
+    assert f"ControlPath={tmp_path}/.autopod/controlmasters/cm-%C" in multiplexed
+    assert (tmp_path / ".autopod" / "controlmasters").stat().st_mode & 0o777 == 0o700
+    assert "ControlMaster=auto" not in direct
+
+
+def test_close_control_master_not_running(mock_subprocess, tmp_path):
+    """Test closing a control master that was never started."""
+    with patch('autopod.ssh.Path.home', return_value=tmp_path):
+        assert close_control_master("ssh.runpod.io", ssh_user="abc-def") is False
+
+    mock_subprocess.run.assert_not_called()
+
+
+def test_create_tunnel_stderr_to_log(mock_subprocess, mock_socket, tmp_path):
+    """Test SSH tunnel output goes to DEVNULL or the given log file."""
+    mock_process = Mock()
+    mock_process.poll.return_value = None
+    mock_subprocess.Popen.return_value = mock_process
+
+    mock_sock = Mock()
+    mock_sock.connect_ex.return_value = 0
+    mock_socket.socket.return_value = mock_sock
+
+    log_path = tmp_path / "tunnel.log"
+    tunnel = SSHTunnel(ssh_host="ssh.runpod.io", local_port=8188, multiplex=False, log_path=log_path)
+    tunnel.create_tunnel(timeout=10)
+
+    kwargs = mock_subprocess.Popen.call_args[1]
+    assert kwargs["stdout"] is mock_subprocess.DEVNULL
+    assert kwargs["stderr"].name == str(log_path)
+    assert kwargs["stderr"].closed
+    assert log_path.exists()
+
+
 def test_create_tunnel_already_running(mock_subprocess, mock_socket):
     """Test creating tunnel when one already exists."""
     mock_process = Mock()
@@ -175,6 +229,44 @@ def test_create_tunnel_connection_timeout(mock_subprocess, mock_socket):
     mock_process.terminate.assert_called_once()
 
 
+def test_create_tunnels_concurrently(mock_subprocess, tmp_path):
+    """Test several tunnels are brought up together."""
+    import socket
+
+    mock_process = Mock()
+    mock_process.poll.return_value = None
+    mock_subprocess.Popen.return_value = mock_process
+
+    listeners = []
+    for _ in range(2):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        listeners.append(listener)
+
+    # Second pod's port has nothing listening
+    closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+
+    tunnels = [
+        SSHTunnel(ssh_host="ssh.runpod.io", local_port=listeners[0].getsockname()[1]),
+        SSHTunnel(ssh_host="ssh.runpod.io", local_port=closed_port),
+        SSHTunnel(ssh_host="ssh.runpod.io", local_port=listeners[1].getsockname()[1]),
+    ]
+
+    try:
+        with patch('autopod.ssh.Path.home', return_value=tmp_path):
+            results = create_tunnels(tunnels, timeout=1)
+    finally:
+        for listener in listeners:
+            listener.close()
+
+    assert results == [True, False, True]
+    assert mock_subprocess.Popen.call_count == 3
+
+
 def test_is_alive_running(mock_subprocess):
     """Test is_alive() when tunnel is running."""
     mock_process = Mock()
@@ -237,7 +329,8 @@ def test_wait_for_connection_success(mock_socket):
     result = tunnel.wait_for_connection(timeout=5, interval=0.1)
 
     assert result is True
-    mock_sock.connect_ex.assert_called_with(('localhost', 8188))
+    mock_sock.setblocking.assert_called_with(False)
+    mock_sock.connect_ex.assert_called_with(('127.0.0.1', 8188))
 
 
 def test_wait_for_connection_timeout(mock_socket, mock_time):
@@ -252,7 +345,7 @@ def test_wait_for_connection_timeout(mock_socket, mock_time):
     mock_process.poll.return_value = None
 
     # Mock time to simulate timeout
-    mock_time.time.side_effect = [0, 0.5, 1.0, 5.1]  # Exceed timeout
+    mock_time.monotonic.side_effect = [0, 0.5, 1.0, 5.1]  # Exceed timeout
     mock_time.sleep = Mock()  # Don't actually sleep
 
     tunnel = SSHTunnel(
@@ -267,6 +360,29 @@ def test_wait_for_connection_timeout(mock_socket, mock_time):
     assert result is False
 
 
+def test_wait_for_connection_real_listener():
+    """Test wait_for_connection() detects a real listening port."""
+    import socket
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+
+    mock_process = Mock()
+    mock_process.poll.return_value = None
+
+    tunnel = SSHTunnel(ssh_host="ssh.runpod.io", local_port=port)
+    tunnel.process = mock_process
+
+    try:
+        start = time.monotonic()
+        assert tunnel.wait_for_connection(timeout=5) is True
+        assert time.monotonic() - start < 1
+    finally:
+        listener.close()
+
+
 def test_wait_for_connection_process_dies(mock_socket):
     """Test wait_for_connection() when process dies."""
     mock_sock = Mock()
@@ -289,6 +405,30 @@ def test_wait_for_connection_process_dies(mock_socket):
     assert result is False
 
 
+def test_wait_for_connection_real_process_exits():
+    """Test wait_for_connection() returns promptly when the SSH process exits."""
+    import socket
+    import subprocess
+    import sys
+
+    # Find a port with nothing listening on it
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+
+    tunnel = SSHTunnel(ssh_host="ssh.runpod.io", local_port=port)
+    tunnel.process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    tunnel._watch_process()
+
+    try:
+        start = time.monotonic()
+        assert tunnel.wait_for_connection(timeout=10) is False
+        assert time.monotonic() - start < 5
+    finally:
+        tunnel.close()
+
+
 def test_close_graceful(mock_subprocess):
     """Test graceful tunnel close."""
     mock_process = Mock()
@@ -456,6 +596,30 @@ def test_parse_ssh_connection_string_invalid_no_at():
         parse_ssh_connection_string("ssh.runpod.io:12345")
 
 
+def test_parse_ssh_connection_string_runpod_proxy():
+    """Test parsing RunPod proxy format (no port)."""
+    result = parse_ssh_connection_string("abc123-64411540@ssh.runpod.io")
+
+    assert result == {"user": "abc123-64411540", "host": "ssh.runpod.io", "port": None}
+
+
+def test_parse_ssh_connection_string_returns_fresh_dict():
+    """Test cached parsing still hands each caller its own dict."""
+    first = parse_ssh_connection_string("root@ssh.runpod.io:12345")
+    first["port"] = 1
+
+    second = parse_ssh_connection_string("root@ssh.runpod.io:12345")
+
+    assert second["port"] == 12345
+    assert second is not first
+
+
+def test_parse_ssh_connection_string_invalid_extra_colon():
+    """Test parsing rejects a malformed port section."""
+    with pytest.raises(ValueError, match="Invalid SSH connection string"):
+        parse_ssh_connection_string("root@host:22:33")
+
+
 def test_parse_ssh_connection_string_invalid_no_port():
     """Test parsing invalid string (missing port)."""
     with pytest.raises(ValueError, match="Invalid SSH connection string"):
@@ -2,8 +2,15 @@ import pytest
 from unittest.mock import patch, MagicMock, call
 from pathlib import Path
 import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
 
-from autopod.tunnel import TunnelManager, SSHTunnel
+from autopod.tunnel import TunnelManager, SSHTunnel, _default_config_dir
 
 @pytest.fixture
 def mock_psutil():
@@ -35,6 +42,8 @@ def test_stop_all_tunnels(manager, mock_psutil):
         "pod-3": tunnel3,
     }
 
+    mock_psutil.wait_procs.return_value = ([], [])
+
     # Act
     stopped_count = manager.stop_all_tunnels()
 
@@ -86,6 +95,11 @@ def test_load_state_reconnects_to_active_tunnels(tmp_path, mock_psutil):
     mock_process.cmdline.return_value = ["ssh", "-L", "8188:localhost:8188"]
     mock_psutil.Process.return_value = mock_process
 
+    # Running processes, as seen by the single process_iter() pass
+    ssh_proc = MagicMock(pid=1234, info={"cmdline": ["ssh", "-L", "8188:localhost:8188"]})
+    other_proc = MagicMock(pid=5678, info={"cmdline": ["python", "-m", "http.server", "8189"]})
+    mock_psutil.process_iter.return_value = [ssh_proc, other_proc]
+
     # Create a dummy state file
     state_data = {
         "pod-active": {
@@ -107,7 +121,359 @@ def test_load_state_reconnects_to_active_tunnels(tmp_path, mock_psutil):
     assert "pod-active" in manager.tunnels
     assert "pod-dead" not in manager.tunnels
     assert manager.tunnels["pod-active"].pid == 1234
-    # The current implementation calls psutil.Process twice, which is inefficient
-    # but not incorrect. The test is updated to reflect the actual call count.
-    assert mock_psutil.Process.call_count == 2
+    # Liveness comes from the snapshot, not per-tunnel cmdline reads
+    assert mock_psutil.Process.call_count == 1
+    mock_process.cmdline.assert_not_called()
+    mock_psutil.process_iter.assert_called_once_with(["cmdline"])
+    # The dead tunnel is never constructed, so its PID is never probed
+    assert call(5678) not in mock_psutil.pid_exists.call_args_list
     mock_psutil.Process.assert_any_call(1234)
+
+def test_start_spawns_detached_ssh(tmp_path, monkeypatch):
+    """Test that start() launches ssh in its own session via posix_spawn."""
+    fake_ssh = tmp_path / "ssh"
+    fake_ssh.write_text("#!/bin/sh\nsleep 30\n")
+    fake_ssh.chmod(0o755)
+    monkeypatch.setattr('autopod.tunnel._SSH_PATH', str(fake_ssh))
+
+    # Stand in for the port ssh would bind once connected
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    local_port = listener.getsockname()[1]
+
+    tunnel = SSHTunnel("pod-1", "a@b.c", local_port, 8188)
+    start = time.monotonic()
+    with patch.object(SSHTunnel, 'is_active', return_value=False), listener:
+        assert tunnel.start() is True
+    assert time.monotonic() - start < 1.0
+
+    try:
+        assert tunnel.pid is not None
+        assert os.getsid(tunnel.pid) == tunnel.pid
+    finally:
+        os.kill(tunnel.pid, signal.SIGKILL)
+        os.waitpid(tunnel.pid, 0)
+
+def test_start_reports_immediate_exit(tmp_path, monkeypatch):
+    """Test that start() returns False when ssh exits right away."""
+    fake_ssh = tmp_path / "ssh"
+    fake_ssh.write_text("#!/bin/sh\necho 'Permission denied' >&2\nexit 255\n")
+    fake_ssh.chmod(0o755)
+    monkeypatch.setattr('autopod.tunnel._SSH_PATH', str(fake_ssh))
+
+    tunnel = SSHTunnel("pod-1", "a@b.c", 18188, 8188)
+    with patch.object(SSHTunnel, 'is_active', return_value=False), \
+            patch('autopod.tunnel.logger') as mock_logger:
+        assert tunnel.start() is False
+    assert tunnel.pid is None
+    assert "Permission denied" in mock_logger.error.call_args[0][0]
+
+def test_is_active_caches_result(mock_psutil):
+    """Test that is_active() reuses its result and the psutil handle within the TTL."""
+    mock_psutil.pid_exists.return_value = True
+    mock_process = MagicMock()
+    mock_process.cmdline.return_value = ["ssh", "-L", "8188:localhost:8188"]
+    mock_psutil.Process.return_value = mock_process
+
+    tunnel = SSHTunnel("pod-1", "a@b.c", 8188, 8188, pid=1234)
+    assert tunnel.is_active() is True
+    assert tunnel.is_active() is True
+
+    assert mock_process.cmdline.call_count == 1
+    assert mock_psutil.Process.call_count == 1
+
+    # Expired entries are re-checked
+    tunnel._cache_ts -= 2
+    assert tunnel.is_active() is True
+    assert mock_process.cmdline.call_count == 2
+
+def test_stop_reuses_process_handle(mock_psutil):
+    """Test that stop() terminates the cached handle and clears the cache."""
+    mock_psutil.pid_exists.return_value = True
+    mock_process = MagicMock()
+    mock_process.cmdline.return_value = ["ssh", "-L", "8188:localhost:8188"]
+    mock_psutil.Process.return_value = mock_process
+
+    tunnel = SSHTunnel("pod-1", "a@b.c", 8188, 8188, pid=1234)
+    assert tunnel.stop() is True
+
+    mock_process.terminate.assert_called_once()
+    assert mock_psutil.Process.call_count == 1
+    assert tunnel.is_active() is False
+
+def test_save_state_atomic_and_skips_unchanged(manager, mock_psutil):
+    """Test that _save_state replaces the file atomically and skips no-op writes."""
+    tunnel = MagicMock(spec=SSHTunnel)
+    tunnel.is_active.return_value = True
+    tunnel.to_dict.return_value = {"pod_id": "pod-1", "local_port": 8188}
+    manager.tunnels = {"pod-1": tunnel}
+
+    with patch('autopod.tunnel.os.replace', wraps=os.replace) as mock_replace:
+        manager._save_state()
+        manager._save_state()
+
+    assert mock_replace.call_count == 1
+    assert json.loads(manager.state_file.read_text()) == {
+        "pod-1": {"pod_id": "pod-1", "local_port": 8188}
+    }
+    assert not manager.state_file.with_suffix(".json.tmp").exists()
+    assert (manager.state_file.stat().st_mode & 0o777) == 0o600
+
+def test_cleanup_stale_tunnels_saves_once(manager, mock_psutil):
+    """Test that cleaning up several stale tunnels writes state once."""
+    stale = []
+    for _ in range(3):
+        tunnel = MagicMock(spec=SSHTunnel)
+        tunnel.is_active.return_value = False
+        stale.append(tunnel)
+    manager.tunnels = {f"pod-{i}": t for i, t in enumerate(stale)}
+
+    with patch.object(manager, '_save_state') as mock_save:
+        assert manager.cleanup_stale_tunnels() == 3
+
+    mock_save.assert_called_once()
+    assert not manager.tunnels
+
+def test_batched_save_defers_writes(manager, mock_psutil):
+    """Test that batched_save() collapses several saves into one write."""
+    for pod_id in ("pod-1", "pod-2"):
+        tunnel = MagicMock(spec=SSHTunnel)
+        tunnel.is_active.return_value = True
+        tunnel.to_dict.return_value = {"pod_id": pod_id}
+        manager.tunnels[pod_id] = tunnel
+
+    with patch('autopod.tunnel.os.replace', wraps=os.replace) as mock_replace:
+        with manager.batched_save():
+            manager.remove_tunnel("pod-1")
+            manager.remove_tunnel("pod-2")
+            assert mock_replace.call_count == 0
+
+    assert mock_replace.call_count == 1
+    assert json.loads(manager.state_file.read_text()) == {}
+
+def _serve_once(reply):
+    """Listen on an ephemeral port and answer one connection with reply."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def handle():
+        conn, _ = listener.accept()
+        with conn:
+            conn.recv(1024)
+            if reply:
+                conn.sendall(reply)
+        listener.close()
+
+    threading.Thread(target=handle, daemon=True).start()
+    return listener.getsockname()[1]
+
+def test_connectivity_any_response(mock_psutil):
+    """Test that any reply on the forwarded port counts as connected."""
+    port = _serve_once(b"HTTP/1.0 404 Not Found\r\n\r\n")
+    tunnel = SSHTunnel("pod-1", "a@b.c", port, 8188)
+
+    with patch.object(SSHTunnel, 'is_active', return_value=True):
+        assert tunnel.test_connectivity(timeout=2) is True
+
+def test_connectivity_closed_without_reply(mock_psutil):
+    """Test that ssh accepting then closing (remote refused) fails the check."""
+    port = _serve_once(b"")
+    tunnel = SSHTunnel("pod-1", "a@b.c", port, 8188)
+
+    with patch.object(SSHTunnel, 'is_active', return_value=True):
+        assert tunnel.test_connectivity(timeout=2) is False
+
+def test_import_does_not_load_psutil():
+    """Test that importing autopod.tunnel defers loading psutil until first use."""
+    code = (
+        "import sys, autopod.tunnel\n"
+        "assert 'psutil._common' not in sys.modules\n"
+        "autopod.tunnel.psutil.pid_exists(1)\n"
+        "assert 'psutil._common' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+@pytest.mark.parametrize("argv, expected", [
+    (["ssh", "-N", "-L", "8188:localhost:8188", "a@b.c"], True),
+    (["/usr/bin/ssh", "-N", "-L", "8188:localhost:8188", "a@b.c"], True),
+    (["ssh", "-N", "-L", "8188:localhost:9000", "a@b.c"], False),
+    (["sshfs", "-p", "8188", "host:/data"], False),
+    (["ssh-agent", "8188:localhost:8188"], False),
+    (None, False),
+])
+def test_matches_cmdline(argv, expected):
+    """Test that only our exact ssh -L invocation counts as the tunnel."""
+    tunnel = SSHTunnel("pod-1", "a@b.c", 8188, 8188)
+    assert tunnel._matches_cmdline(argv) is expected
+
+def test_port_index_tracks_tunnels(manager, mock_psutil):
+    """Test that port conflicts are found via the port index and cleared on removal."""
+    tunnel = manager.create_tunnel("pod-1", "a@b.c", 8188, 8188)
+    assert manager._port_index == {8188: "pod-1"}
+
+    with patch.object(SSHTunnel, 'is_active', return_value=True):
+        assert manager._is_port_in_use(8188) is True
+        assert manager._is_port_in_use(8189) is False
+        with pytest.raises(RuntimeError, match="already in use"):
+            manager.create_tunnel("pod-2", "d@e.f", 8188, 8188)
+
+    # Recreating the pod's tunnel on a new port drops the old entry
+    with patch.object(SSHTunnel, 'is_active', return_value=False):
+        manager.create_tunnel("pod-1", "a@b.c", 8189, 8188)
+    assert manager._port_index == {8189: "pod-1"}
+
+    manager.remove_tunnel("pod-1")
+    assert manager._port_index == {}
+
+def test_multiplexed_tunnel_uses_control_master(manager, mock_psutil, monkeypatch):
+    """Test that multiplexed tunnels share a ControlMaster socket and persist the setting."""
+    tunnel = manager.create_tunnel("pod-1", "a@b.c", 8188, 8188, multiplex=True)
+    assert tunnel.control_dir == manager.control_dir
+    assert (manager.control_dir.stat().st_mode & 0o777) == 0o700
+
+    spawned = []
+
+    def fake_spawn(cmd, stderr_fd):
+        spawned.append(cmd)
+        raise OSError("not spawning in tests")
+
+    monkeypatch.setattr('autopod.tunnel._SSH_PATH', '/usr/bin/ssh')
+    monkeypatch.setattr('autopod.tunnel._spawn_detached', fake_spawn)
+    with patch.object(SSHTunnel, 'is_active', return_value=False):
+        tunnel.start()
+
+    cmd = spawned[0]
+    assert cmd is tunnel._ssh_argv  # built once in __init__, not per start()
+    assert "ControlMaster=auto" in cmd
+    assert f"ControlPath={manager.control_dir / 'cm-%C'}" in cmd
+    assert cmd[-1] == "a@b.c"
+
+    restored = SSHTunnel.from_dict(tunnel.to_dict())
+    assert restored.control_dir == manager.control_dir
+
+def test_close_control_masters(manager):
+    """Test that close_control_masters sends 'ssh -O exit' to each control socket."""
+    manager.control_dir.mkdir()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(manager.control_dir / "cm-abc123"))
+    (manager.control_dir / "not-a-socket").write_text("")
+
+    with patch('autopod.tunnel.subprocess.run') as mock_run, sock:
+        mock_run.return_value.returncode = 0
+        assert manager.close_control_masters() == 1
+
+    args = mock_run.call_args[0][0]
+    assert args[-3:] == ["-O", "exit", "autopod"]
+    assert f"ControlPath={manager.control_dir / 'cm-abc123'}" in args
+
+def test_save_state_is_compact_and_order_independent(manager, mock_psutil):
+    """Test that saved state is compact and identical regardless of dict order."""
+    def make_tunnel(pod_id):
+        tunnel = MagicMock(spec=SSHTunnel)
+        tunnel.is_active.return_value = True
+        tunnel.to_dict.return_value = {"pod_id": pod_id, "local_port": 8188}
+        return tunnel
+
+    manager.tunnels = {"pod-b": make_tunnel("pod-b"), "pod-a": make_tunnel("pod-a")}
+    manager._save_state()
+    first = manager.state_file.read_bytes()
+
+    manager.tunnels = {"pod-a": make_tunnel("pod-a"), "pod-b": make_tunnel("pod-b")}
+    with patch('autopod.tunnel.os.replace') as mock_replace:
+        manager._save_state()
+
+    mock_replace.assert_not_called()
+    assert b" " not in first and b"\n" not in first
+
+def test_default_config_dir_resolved_once(tmp_path, mock_psutil):
+    """Test that TunnelManager resolves ~/.autopod once and creates it if missing."""
+    _default_config_dir.cache_clear()
+    try:
+        with patch('autopod.tunnel.Path.home', return_value=tmp_path) as mock_home:
+            first = TunnelManager()
+            second = TunnelManager()
+
+        assert mock_home.call_count == 1
+        assert first.config_dir == second.config_dir == tmp_path / ".autopod"
+        assert first.config_dir.is_dir()
+    finally:
+        _default_config_dir.cache_clear()
+
+def test_stop_all_tunnels_waits_in_parallel(manager, mock_psutil):
+    """Test that stop_all_tunnels signals every tunnel before waiting, then kills survivors."""
+    events = []
+    procs = []
+    for pod_id in ("pod-1", "pod-2"):
+        proc = MagicMock(name=pod_id)
+        proc.terminate.side_effect = lambda p=pod_id: events.append(("term", p))
+        procs.append(proc)
+
+        tunnel = MagicMock(spec=SSHTunnel)
+        tunnel.is_active.return_value = True
+        tunnel._get_process.return_value = proc
+        tunnel.stop.side_effect = lambda wait=True, proc=proc: proc.terminate() or True
+        manager.tunnels[pod_id] = tunnel
+
+    def wait_procs(procs_, timeout=None):
+        events.append(("wait", timeout))
+        return ([procs[0]], [procs[1]]) if timeout else (procs_, [])
+
+    mock_psutil.wait_procs.side_effect = wait_procs
+
+    manager_tunnels = list(manager.tunnels.values())
+    assert manager.stop_all_tunnels() == 2
+
+    assert events[:3] == [("term", "pod-1"), ("term", "pod-2"), ("wait", 5)]
+    for tunnel in manager_tunnels:
+        tunnel.stop.assert_called_once_with(wait=False)
+    procs[0].kill.assert_not_called()
+    procs[1].kill.assert_called_once()
+
+def test_load_state_reuses_parsed_file(tmp_path, mock_psutil):
+    """Test that an unchanged tunnels.json is parsed once across managers."""
+    ssh_proc = MagicMock(pid=1234, info={"cmdline": ["ssh", "-L", "8188:localhost:8188"]})
+    mock_psutil.process_iter.return_value = [ssh_proc]
+    mock_psutil.pid_exists.return_value = True
+    (tmp_path / "tunnels.json").write_text(json.dumps({
+        "pod-1": {"pod_id": "pod-1", "ssh_connection_string": "a@b.c",
+                  "local_port": 8188, "remote_port": 8188, "pid": 1234}
+    }))
+
+    with patch('autopod.tunnel.json.loads', wraps=json.loads) as mock_loads:
+        first = TunnelManager(config_dir=tmp_path)
+        second = TunnelManager(config_dir=tmp_path)
+        assert mock_loads.call_count == 1
+
+        # A rewrite by another process is picked up
+        (tmp_path / "tunnels.json").write_text("{}")
+        third = TunnelManager(config_dir=tmp_path)
+        assert mock_loads.call_count == 2
+
+    assert list(first.tunnels) == list(second.tunnels) == ["pod-1"]
+    assert first.tunnels["pod-1"] is not second.tunnels["pod-1"]
+    assert third.tunnels == {}
+
+def test_ssh_tunnel_uses_slots(mock_psutil):
+    """Test that SSHTunnel has no per-instance __dict__."""
+    tunnel = SSHTunnel("pod-1", "a@b.c", 8188, 8188)
+    assert not hasattr(tunnel, "__dict__")
+    with pytest.raises(AttributeError):
+        tunnel.unknown_attribute = 1
+
+def test_cleanup_checks_each_tunnel_once(manager, mock_psutil):
+    """Test that cleanup decides liveness and serializes survivors in one pass."""
+    alive = MagicMock(spec=SSHTunnel)
+    alive.is_active.return_value = True
+    alive.to_dict.return_value = {"pod_id": "pod-1"}
+    dead = MagicMock(spec=SSHTunnel)
+    dead.is_active.return_value = False
+    manager.tunnels = {"pod-1": alive, "pod-2": dead}
+
+    assert manager.cleanup_stale_tunnels() == 1
+
+    alive.is_active.assert_called_once()
+    dead.is_active.assert_called_once()
+    dead.to_dict.assert_not_called()
+    assert json.loads(manager.state_file.read_text()) == {"pod-1": {"pod_id": "pod-1"}}